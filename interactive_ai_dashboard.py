@@ -12,15 +12,24 @@ import json
 import os
 from datetime import datetime, timedelta
 import base64
-from src.utils.data_loader import load_enhanced_msme_data
-from src.utils.ai_helper import get_enhanced_chart_context, chat_with_ai_enhanced
+from src.utils.data_loader import (ANALYTICS_BACKEND, base_version, base_dataset_problems, load_enhanced_msme_data,
+                                   load_regional_panel, load_analytics_backend, load_query_engine,
+                                   load_context_snapshots, compute_data_version)
+from src.utils.context_snapshots import slide_id_for
+from src.utils.ai_helper import chat_with_ai_enhanced, iter_batch_answers
 from src.components.header import render_header
 from src.components.control_bar import render_control_bar
 from src.components.metrics import render_metrics
-from src.components.story_visualizations import render_story_visualizations
+from src.components.story_visualizations import render_chapter_image, render_story_visualizations
 from src.components.ai_chat_panel import render_ai_chat_panel
 from src.components.strategic_blueprint import render_strategic_blueprint
 from src.components.footer import render_footer
+from src.components.slideshow import SLIDES, render_slideshow
+from src.utils.fragments import fragment, rerun_fragment
+from src.utils.shared_frames import enable_copy_on_write
+
+# Shared frames are sliced per session as Copy-on-Write views (src/utils/shared_frames.py)
+enable_copy_on_write()
 
 def load_css(file_name):
     with open(file_name) as f:
@@ -163,62 +172,240 @@ with control_cols[4]:
     st.markdown(f'<div class="control-group"><span class="control-label">🤖 AI STATUS</span><br/><span style="color: #00ffff; font-weight: bold; font-size: 0.8rem;">{ai_status}</span></div>', unsafe_allow_html=True)
 
 # Load enhanced data
-economic_data, msme_sectors, export_projection, regional_data = load_enhanced_msme_data()
+# Base datasets are published once per host and memory-mapped by every worker; a republish swaps versions
+datasets_version = base_version()
+economic_data, msme_sectors, export_projection = load_enhanced_msme_data(datasets_version)
+for problem in base_dataset_problems(datasets_version):
+    st.error(problem)
+analytics = None
+if ANALYTICS_BACKEND == 'duckdb':
+    frames_version = compute_data_version(economic_data, msme_sectors, export_projection)
+    analytics = load_analytics_backend(frames_version, economic_data, msme_sectors, export_projection)
+if analytics is not None:
+    # Source tables stay in the DuckDB file; its source hashes stand in for the regional frames
+    regional_panel = None
+    data_version = compute_data_version(economic_data, msme_sectors, export_projection, salt=analytics.sources_version)
+else:
+    regional_panel = load_regional_panel(datasets_version)
+    regional_frames = [regional_panel.state_year] if regional_panel is not None else []
+    data_version = compute_data_version(economic_data, msme_sectors, export_projection, *regional_frames)
+query_engine = load_query_engine(data_version, economic_data, msme_sectors, regional_panel,
+                                 with_indicators=analytics is None)
+# Per-slide AI summaries for every year-range bucket, so asking a question is a lookup
+context_snapshots = load_context_snapshots(data_version, economic_data, msme_sectors, export_projection,
+                                           analytics or regional_panel)
+
+# Filter data based on selections (memoized per filter signature, shared read-only)
+filtered_economic = query_engine.select('economic', st.session_state.filters)
+
+@fragment
+def render_ai_panels():
+    """AI analyst + assistant panels; sending a question reruns only this fragment"""
+    st.markdown("""
+    <div class="ai-panel-container">
+        <div class="ai-panel-header">
+            <h3><span class="ai-icon">🤖</span> QUANTUM AI ANALYST</h3>
+            <p>Your copilot for deep economic insights & strategic foresight.</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # --- API Key Handling --- 
+    # Attempt to load from st.secrets first
+    try:
+        if 'openai_api_key' not in st.session_state or not st.session_state.openai_api_key:
+            if "OPENAI_API_KEY" in st.secrets:
+                st.session_state.openai_api_key = st.secrets["OPENAI_API_KEY"]
+                st.success("🔑 OpenAI API Key loaded securely from secrets. AI features enabled.")
+            else:
+                st.session_state.openai_api_key = ""  # Ensure it's initialized if not in secrets
+    except Exception:
+        st.session_state.openai_api_key = ""
+
+    # Only show input if key is not loaded from secrets
+    if not st.session_state.get("openai_api_key"): 
+        openai_api_key_input = st.text_input(
+            "🔑 Enter OpenAI API Key (or set OPENAI_API_KEY in st.secrets):", 
+            type="password", 
+            key="openai_api_key_input_main_panel", 
+            help="Required for AI analysis. Your key is not stored if using secrets."
+        )
+        if openai_api_key_input:
+            st.session_state.openai_api_key = openai_api_key_input
+            st.rerun() # Rerun to reflect the new key status
+
+    if not st.session_state.get("openai_api_key"):
+        st.warning("Please enter your OpenAI API key above, or set it in `secrets.toml` (local) / Streamlit Cloud secrets (deployed) to enable AI features.")
+    elif not st.session_state.openai_api_key.startswith("sk-"):
+        st.warning("Invalid OpenAI API Key format. It should start with 'sk-'. Please check and re-enter.")
+    else:
+        st.success("OpenAI API Key accepted. AI features enabled.")
+    # --- End API Key Handling ---
+
+    st.markdown("""
+        <div class="chat-interface">
+    """, unsafe_allow_html=True)
+
+    if st.session_state.chat_history:
+        for entry in st.session_state.chat_history[-10:]: # Iterate through a copy or recent items
+            if isinstance(entry, tuple) and len(entry) == 2:
+                role, text = entry
+                if role == "user":
+                    st.markdown(f'<div class="chat-bubble user-bubble">{text}</div>', unsafe_allow_html=True)
+                else:
+                    st.markdown(f'<div class="chat-bubble ai-bubble">{text}</div>', unsafe_allow_html=True)
+            elif isinstance(entry, dict) and 'question' in entry and 'response' in entry:
+                # This section is for the other chat history format, display as Q&A
+                # This part of the UI (chat bubbles) might not be the best place for Q&A format.
+                # Consider if you want to display dict-formatted history here, or only in the expander section.
+                # For now, let's display user's question from dict format if it's a user turn.
+                # Or display AI response if it's an AI turn (though dicts usually have both Q and A).
+                # This part might need more UI/UX thought based on how you want to mix formats.
+                # A simple approach:
+                st.markdown(f'<div class="chat-bubble user-bubble">Q: {entry["question"]}</div>', unsafe_allow_html=True)
+                st.markdown(f'<div class="chat-bubble ai-bubble">A: {entry["response"]}</div>', unsafe_allow_html=True)
+            # else:
+                # Optionally handle or log unexpected chat entry formats
+                # st.warning("Unsupported chat history format encountered.")
+
+    user_query_ai = st.text_area("💬 Ask the AI:", key="ai_chat_input_panel", height=100)
+
+    if st.button("🚀 Send to AI", key="send_ai_button_panel", use_container_width=True):
+        if not st.session_state.openai_api_key:
+            st.error("Cannot connect to AI: OpenAI API Key is missing.")
+        elif not user_query_ai:
+            st.warning("Please enter a question for the AI.")
+        else:
+            current_slide = st.session_state.get('current_slide', 0)
+            context_for_ai = context_snapshots.system_context(
+                slide_id_for(current_slide), st.session_state.filters,
+                f"User query regarding: {SLIDES[current_slide]['title']}"
+            )
+            # Tokens render as they arrive; the full answer is returned once the stream ends
+            ai_response = st.write_stream(chat_with_ai_enhanced(user_query_ai, context_for_ai, stream=True,
+                                                                slide=slide_id_for(current_slide)))
+            st.session_state.chat_history.append(("user", user_query_ai))
+            st.session_state.chat_history.append(("ai", ai_response))
+            rerun_fragment()
+
+    st.markdown("</div>", unsafe_allow_html=True) # Close chat-interface
+    # Removed one redundant </div> for ai-panel-container
+
+    st.markdown('<div class="ai-chat-container">', unsafe_allow_html=True)
+    st.markdown("### 🤖 AI Analytics Assistant")
+
+    if st.session_state.openai_api_key:
+        st.markdown('<span class="status-indicator status-online"></span>**AI Ready for All Users**', unsafe_allow_html=True)
+        st.info("🌟 AI insights powered by OpenAI are available for everyone!")
+    else:
+        st.markdown('<span class="status-indicator status-offline"></span>**AI Temporarily Offline**', unsafe_allow_html=True)
+
+    # Chat History
+    if st.session_state.chat_history:
+        st.markdown("#### 💬 Recent Conversations")
+        for i, chat_item in enumerate(st.session_state.chat_history[-2:]): # Iterate through a copy or recent items
+            if isinstance(chat_item, dict) and 'question' in chat_item and 'response' in chat_item:
+                question = chat_item['question']
+                response = chat_item['response']
+                timestamp = chat_item.get('timestamp', 'Unknown time')
+                with st.expander(f"💡 {question[:30]}..."):
+                    st.markdown(f"**Q:** {question}")
+                    st.markdown(f"**AI:** {response}")
+                    st.caption(f"⏰ {timestamp}")
+            elif isinstance(chat_item, tuple) and len(chat_item) == 2:
+                role, text = chat_item
+                # Decide how to display tuple-based chat history in this expander
+                # For example, show user queries or AI responses directly
+                if role == "user":
+                    with st.expander(f"👤 User: {text[:30]}..."):
+                        st.markdown(text)
+                else: # AI
+                    with st.expander(f"🤖 AI: {text[:30]}..."):
+                        st.markdown(text)
+            # else:
+                # Optionally log or display a message for unsupported formats
+                # st.write(f"Skipping item {i}: Unsupported format")
+
+    # Current question
+    st.markdown("#### ❓ Ask About Current Analysis")
+
+    if st.session_state.selected_chart:
+        st.info(f"📊 Context: {st.session_state.selected_chart}")
+
+    user_question = st.text_area(
+        "Your question:",
+        placeholder="e.g., 'What are the top investment opportunities?' or 'How can we achieve 25% export target?'",
+        height=100,
+        key="ai_question"
+    )
+
+    # Quick question buttons
+    active_slide = slide_id_for(st.session_state.get('current_slide', 0))
+    st.markdown("**⚡ Quick Questions:**")
+    quick_questions = [
+        "💰 Investment opportunities?",
+        "📈 Growth drivers?", 
+        "🎯 Strategic priorities?",
+        "🌍 Export potential?"
+    ]
+
+    cols = st.columns(2)
+    for i, question in enumerate(quick_questions):
+        with cols[i % 2]:
+            if st.button(question, key=f"quick_{i}", use_container_width=True):
+                if st.session_state.selected_chart and st.session_state.openai_api_key:
+                    # Canned questions are routed to the quick model tier
+                    response = st.write_stream(chat_with_ai_enhanced(question, st.session_state.ai_context, stream=True,
+                                                                     slide=active_slide, canned=True))
+                    st.session_state.chat_history.append({
+                        "question": question,
+                        "response": response,
+                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                        "chart": st.session_state.selected_chart
+                    })
+                    rerun_fragment()
+
+    # All quick questions at once: answers are requested concurrently and shown as each one lands
+    if st.button("🧠 Brief me on everything", key="quick_brief_all", use_container_width=True):
+        if st.session_state.selected_chart and st.session_state.openai_api_key:
+            for question, response in iter_batch_answers(quick_questions, st.session_state.ai_context,
+                                                         slide=active_slide, canned=True):
+                with st.expander(f"💡 {question}", expanded=True):
+                    st.markdown(response)
+                st.session_state.chat_history.append({
+                    "question": question,
+                    "response": response,
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                    "chart": st.session_state.selected_chart
+                })
+        else:
+            st.warning("Please select a chart above to brief the AI on!")
+
+    # Main AI query button
+    if st.button("🚀 Get AI Insights", disabled=not st.session_state.openai_api_key, use_container_width=True):
+        if user_question and st.session_state.selected_chart:
+            st.markdown("#### 🎯 AI Response")
+            response = st.write_stream(chat_with_ai_enhanced(user_question, st.session_state.ai_context, stream=True,
+                                                             slide=active_slide))
+
+            st.session_state.chat_history.append({
+                "question": user_question,
+                "response": response,
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                "chart": st.session_state.selected_chart
+            })
+        else:
+            st.warning("Please select a chart above and enter a question!")
+
+    st.markdown('</div>', unsafe_allow_html=True)
 
-# Filter data based on selections
-filtered_economic = economic_data[
-    (economic_data['Year'] >= year_range[0]) & 
-    (economic_data['Year'] <= year_range[1])
-]
 
 # Main Dashboard Layout
 col1, col2 = st.columns([3, 1])
 
 with col1:
     # Cyberpunk Metrics Section
-    st.markdown('<h2 class="section-header">📊 QUANTUM PERFORMANCE MATRIX</h2>', unsafe_allow_html=True)
-    
-    metric_cols = st.columns(4)
-    
-    with metric_cols[0]:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-label">📈 GDP GROWTH 2023</div>
-            <div class="metric-value">8.15%</div>
-            <div class="metric-description">EXACT World Bank data: 8.1529%</div>
-            <div style="color: #ff0080; font-weight: 600; margin-top: 0.5rem;">✅ WB Verified</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with metric_cols[1]:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-label">👥 LABOR FORCE 2024</div>
-            <div class="metric-value">607.7M</div>
-            <div class="metric-description">EXACT WB: 607,691,498 workers</div>
-            <div style="color: #ff0080; font-weight: 600; margin-top: 0.5rem;">✅ WB Official</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with metric_cols[2]:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-label">🌐 EXPORTS 2023</div>
-            <div class="metric-value">21.85%</div>
-            <div class="metric-description">EXACT WB: 21.8482% of GDP</div>
-            <div style="color: #ff0080; font-weight: 600; margin-top: 0.5rem;">✅ WB Data</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with metric_cols[3]:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-label">🚀 UNEMPLOYMENT 2024</div>
-            <div class="metric-value">4.20%</div>
-            <div class="metric-description">EXACT WB: 4.202% ILO estimate</div>
-            <div style="color: #ff0080; font-weight: 600; margin-top: 0.5rem;">✅ WB Verified</div>
-        </div>
-        """, unsafe_allow_html=True)
+    render_metrics()
     
     # 🖼️ ACTUAL UNIFIED STORY VISUALIZATIONS
     st.markdown('<h2 class="section-header">🖼️ UNIFIED STORY VISUALIZATIONS</h2>', unsafe_allow_html=True)
@@ -229,8 +416,7 @@ with col1:
     with viz_tabs[0]:
         st.markdown("### 📊 India's Economic Foundation for MSME Growth (2010-2024)")
         try:
-            with open('output/images/chapter1_economic_foundation.png', 'rb') as f:
-                st.image(f.read(), caption="Chapter 1: Economic Foundation - Generated from EXACT World Bank Data", use_container_width=True)
+            render_chapter_image('chapter1_economic_foundation', "Chapter 1: Economic Foundation - Generated from EXACT World Bank Data")
             st.success("✅ **This visualization uses EXACT World Bank data from `wb_combined_indicators.csv`**")
         except Exception as e:
             st.error(f"❌ Could not load Chapter 1 image: {e}")
@@ -238,8 +424,7 @@ with col1:
     with viz_tabs[1]:
         st.markdown("### 🎯 MSME Opportunity Matrix - Data-Driven Sector Analysis")
         try:
-            with open('output/images/chapter2_msme_opportunities.png', 'rb') as f:
-                st.image(f.read(), caption="Chapter 2: MSME Opportunities - Based on Research Data", use_container_width=True)
+            render_chapter_image('chapter2_msme_opportunities', "Chapter 2: MSME Opportunities - Based on Research Data")
             st.success("✅ **This shows the actual sector analysis from your unified story**")
         except Exception as e:
             st.error(f"❌ Could not load Chapter 2 image: {e}")
@@ -247,8 +432,7 @@ with col1:
     with viz_tabs[2]:
         st.markdown("### 🌐 India's Export Growth Journey & MSME Potential (2010-2030)")
         try:
-            with open('output/images/chapter3_export_pathway.png', 'rb') as f:
-                st.image(f.read(), caption="Chapter 3: Export Pathway - Current: 21.85% of GDP", use_container_width=True)
+            render_chapter_image('chapter3_export_pathway', "Chapter 3: Export Pathway - Current: 21.85% of GDP")
             st.success("✅ **Shows real export data: 21.85% of GDP (2023) targeting 25% by 2030**")
         except Exception as e:
             st.error(f"❌ Could not load Chapter 3 image: {e}")
@@ -257,419 +441,8 @@ with col1:
     
     # 📊 INTERACTIVE SLIDESHOW DASHBOARD
     st.markdown('<h2 class="section-header">📊 INTERACTIVE ANALYTICS SLIDESHOW</h2>', unsafe_allow_html=True)
-    
-    # Initialize slideshow session state
-    if 'current_slide' not in st.session_state:
-        st.session_state.current_slide = 0
-    
-    # Slideshow data
-    slides = [
-        {
-            "title": "Economic Foundation",
-            "subtitle": "GDP Growth & Labor Force Analysis",
-            "icon": "🏗️",
-            "story": "India's economic resilience shines through post-COVID recovery with 8.2% GDP growth and 608M workforce."
-        },
-        {
-            "title": "MSME Opportunities", 
-            "subtitle": "Sector Growth & Digital Transformation",
-            "icon": "🎯",
-            "story": "Digital Commerce leads with 32% growth potential while FinTech and HealthTech emerge as powerhouse sectors."
-        },
-        {
-            "title": "Export Pathway",
-            "subtitle": "Global Trade & Export Potential", 
-            "icon": "🌐",
-            "story": "Export trajectory from 21.8% to 25% of GDP by 2030, with MSMEs driving 68% of total export growth."
-        },
-        {
-            "title": "Regional Analysis",
-            "subtitle": "State-wise MSME Distribution",
-            "icon": "🏭", 
-            "story": "Maharashtra, Gujarat, and Tamil Nadu lead MSME concentration with unique specialization patterns."
-        }
-    ]
-    
-    # Slideshow Container
-    st.markdown("""
-    <div class="slideshow-container">
-        """, unsafe_allow_html=True)
-        
-    # Navigation JavaScript
-    st.markdown("""
-    <script>
-    function showSlide(n) {
-        const slides = document.querySelectorAll('.slide');
-        const dots = document.querySelectorAll('.dot');
-        const buttons = document.querySelectorAll('.slide-btn');
-        
-        slides.forEach(slide => slide.classList.remove('active'));
-        dots.forEach(dot => dot.classList.remove('active'));
-        buttons.forEach(btn => btn.classList.remove('active'));
-        
-        if (slides[n]) {
-            slides[n].classList.add('active');
-            dots[n].classList.add('active'); 
-            buttons[n].classList.add('active');
-        }
-    }
-    </script>
-    """, unsafe_allow_html=True)
-    
-    # Generate slides dynamically
-    for i, slide in enumerate(slides):
-        active_class = "active" if i == st.session_state.current_slide else ""
-        
-        st.markdown(f"""
-        <div class="slide {active_class}" id="slide{i}">
-            <div style="text-align: center; margin-bottom: 2rem;">
-                <h2 style="color: #00cccc; font-family: 'Orbitron', monospace; font-size: 2.5rem; margin-bottom: 0.5rem;">
-                    {slide['icon']} {slide['title']}
-                </h2>
-                <h3 style="color: #cc6699; font-size: 1.2rem; margin-bottom: 2rem;">
-                    {slide['subtitle']}
-                </h3>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        # Create chart content based on slide type
-        if i == 0:  # Economic Foundation
-            with st.container():
-                st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-                
-                # Economic Foundation Chart
-                fig_growth = make_subplots(
-                    rows=2, cols=2,
-                    subplot_titles=('GDP Growth Rate (% annually)', 'Labor Force Size (millions)',
-                                  'Export Performance (% of GDP)', 'Digital Adoption Progress (%)'),
-                    specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                           [{"secondary_y": False}, {"secondary_y": False}]],
-                    vertical_spacing=0.15,
-                    horizontal_spacing=0.12
-                )
-                
-                # GDP Growth Rate
-                fig_growth.add_trace(
-                    go.Scatter(
-                        x=filtered_economic['Year'], 
-                        y=filtered_economic['GDP_Growth'],
-                        mode='lines+markers',
-                        name='GDP Growth Rate',
-                        line=dict(color='#2E8B57', width=3),
-                        marker=dict(size=8, color='#2E8B57', line=dict(width=2, color='white')),
-                        hovertemplate='<b>GDP Growth</b><br>Year: %{x}<br>Growth Rate: %{y:.1f}%<extra></extra>',
-                        showlegend=False
-                    ),
-                    row=1, col=1
-                )
-                
-                # Labor Force
-                fig_growth.add_trace(
-                    go.Scatter(
-                        x=filtered_economic['Year'], 
-                        y=filtered_economic['Labor_Force_Million'],
-                        mode='lines+markers',
-                        name='Labor Force',
-                        line=dict(color='#4169E1', width=3),
-                        marker=dict(size=8, color='#4169E1', line=dict(width=2, color='white')),
-                        hovertemplate='<b>Labor Force</b><br>Year: %{x}<br>Workers: %{y:.0f} million<extra></extra>',
-                        showlegend=False
-                    ),
-                    row=1, col=2
-                )
-                
-                # Export Performance
-                fig_growth.add_trace(
-                go.Scatter(
-                    x=filtered_economic['Year'], 
-                        y=filtered_economic['Exports_Percent_GDP'],
-                    mode='lines+markers',
-                        name='Export Performance',
-                        line=dict(color='#DC143C', width=3),
-                        marker=dict(size=8, color='#DC143C', line=dict(width=2, color='white')),
-                        hovertemplate='<b>Export Performance</b><br>Year: %{x}<br>Exports: %{y:.1f}% of GDP<extra></extra>',
-                    showlegend=False
-                ),
-                    row=2, col=1
-                )
-                
-                # Digital Adoption
-                fig_growth.add_trace(
-                    go.Scatter(
-                        x=filtered_economic['Year'], 
-                        y=filtered_economic['Digital_Adoption'],
-                        mode='lines+markers',
-                        name='Digital Adoption',
-                        line=dict(color='#FF8C00', width=3),
-                        marker=dict(size=8, color='#FF8C00', line=dict(width=2, color='white')),
-                        hovertemplate='<b>Digital Adoption</b><br>Year: %{x}<br>Adoption: %{y}%<extra></extra>',
-                        showlegend=False
-                    ),
-                    row=2, col=2
-                )
-        
-                fig_growth.update_layout(
-                    height=500,
-                    font=dict(family="Inter, sans-serif", color="#00cccc", size=11),
-                    paper_bgcolor='rgba(5, 5, 5, 0.95)',
-            plot_bgcolor='rgba(0, 0, 0, 0.3)',
-            hovermode='closest',
-                    showlegend=False
-                )
-                
-                for row, col in [(1,1), (1,2), (2,1), (2,2)]:
-                    fig_growth.update_xaxes(
-                        title_text="Year", 
-                        gridcolor='rgba(0, 204, 204, 0.2)',
-                        showgrid=True,
-                        title_font=dict(size=12, color="#00cccc"),
-                        tickfont=dict(color="#00cccc"),
-                        row=row, col=col
-                    )
-                
-                fig_growth.update_yaxes(title_text="GDP Growth (%)", gridcolor='rgba(204, 102, 153, 0.1)', 
-                                       title_font=dict(size=12, color="#00cccc"), tickfont=dict(color="#00cccc"), 
-                                       row=1, col=1)
-                fig_growth.update_yaxes(title_text="Workers (Millions)", gridcolor='rgba(204, 102, 153, 0.1)', 
-                                       title_font=dict(size=12, color="#00cccc"), tickfont=dict(color="#00cccc"), 
-                                       row=1, col=2)
-                fig_growth.update_yaxes(title_text="Exports (% of GDP)", gridcolor='rgba(204, 102, 153, 0.1)', 
-                                       title_font=dict(size=12, color="#00cccc"), tickfont=dict(color="#00cccc"), 
-                                       row=2, col=1)
-                fig_growth.update_yaxes(title_text="Digital Adoption (%)", gridcolor='rgba(204, 102, 153, 0.1)', 
-                                       title_font=dict(size=12, color="#00cccc"), tickfont=dict(color="#00cccc"), 
-                                       row=2, col=2)
-                
-                st.plotly_chart(fig_growth, use_container_width=True, key=f"economic_foundation_chart_slide_{i}")
-                st.markdown('</div>', unsafe_allow_html=True)
-        elif i == 1: # MSME Opportunities Slide
-            st.markdown('<div class="filter-section" style="margin-top:1rem; margin-bottom:1rem; padding:1rem;">', unsafe_allow_html=True)
-            st.markdown('<div class="control-group"><span class="control-label">🏭 SECTOR FOCUS FOR MSME DATA</span></div>', unsafe_allow_html=True)
-            available_sectors_slide = list(msme_sectors['Sector'].unique())
-            selected_sectors_slide = st.multiselect(
-                "Select Sectors for MSME Opportunity Analysis",
-                available_sectors_slide,
-                default=st.session_state.filters.get('sectors', []), # Use .get for safety
-                key=f"sector_focus_slide_{i}",
-                label_visibility="collapsed"
-            )
-            st.session_state.filters['sectors'] = selected_sectors_slide
-            
-            display_sectors_slide = msme_sectors
-            if selected_sectors_slide: # Filter if any sectors are selected
-                display_sectors_slide = msme_sectors[msme_sectors['Sector'].isin(selected_sectors_slide)]
-            
-            st.markdown('</div>', unsafe_allow_html=True) # Close filter-section
-            
-            # MSME Opportunities Bubble Chart within the slide
-            with st.container():
-                st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-                fig_bubble_slide = go.Figure()
-                if not display_sectors_slide.empty:
-                    fig_bubble_slide.add_trace(go.Scatter(
-                        x=display_sectors_slide['Growth_Potential'],
-                        y=display_sectors_slide['Market_Size_Billion'],
-                        mode='markers+text',
-                        marker=dict(
-                            size=display_sectors_slide['Employment_Multiplier'] * 18, # Adjusted size
-                            color=display_sectors_slide['Digital_Readiness'],
-                            colorscale='Plasma', 
-                            showscale=True,
-                            colorbar=dict(title="Digital Readiness %", x=1.05, thickness=15, tickfont=dict(color="#00cccc"), titlefont=dict(color="#00cccc")),
-                            line=dict(width=1, color='rgba(255,255,255,0.3)')
-                        ),
-                        text=display_sectors_slide['Sector'],
-                        textposition="middle center", # Centered text on bubbles
-                        textfont=dict(size=9, color='rgba(255,255,255,0.9)', family="Inter"),
-                        customdata=display_sectors_slide[['Employment_Multiplier', 'Export_Potential', 'Risk_Factor']],
-                        hovertemplate='<b>%{text}</b><br>' +
-                                     '📈 Growth: %{x:.1f}%<br>' +
-                                     '💰 Market: $%{y}B<br>' +
-                                     '👥 Emp. X: %{customdata[0]:.1f}x<br>' +
-                                     '🌍 Export Pot.: %{customdata[1]}%<br>' +
-                                     '🎲 Risk Factor: %{customdata[2]:.1f}<extra></extra>'
-                    ))
-                else:
-                    st.warning("No sectors selected or data available for the current filter.")
-                
-                fig_bubble_slide.update_layout(
-                    title_text="MSME Sector Opportunities Matrix",
-                    xaxis_title_text="Annual Growth Potential (%)",
-                    yaxis_title_text="Total Market Size ($ Billions)",
-                    height=650, # Increased height slightly
-                    font=dict(family="Inter", color="#00cccc", size=12),
-                    paper_bgcolor='rgba(5,5,5,0.95)', 
-                    plot_bgcolor='rgba(10,10,20,0.6)', # Slightly darker plot bg
-                    showlegend=False,
-                    xaxis=dict(gridcolor='rgba(0,204,204,0.1)', zerolinecolor='rgba(204,102,153,0.2)', color="#00cccc", tickfont=dict(color="#00cccc")),
-                    yaxis=dict(gridcolor='rgba(0,204,204,0.1)', zerolinecolor='rgba(204,102,153,0.2)', color="#00cccc", tickfont=dict(color="#00cccc")),
-                    hoverlabel=dict(bgcolor="rgba(5,5,5,0.8)", font_size=13, font_family="Inter", bordercolor="#00cccc")
-                )
-                st.plotly_chart(fig_bubble_slide, use_container_width=True, key=f"msme_bubble_chart_slide_{i}")
-                st.markdown('</div>', unsafe_allow_html=True) # Close chart-container
-
-        elif i == 2: # Export Pathway Slide
-            with st.container():
-                st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-                st.markdown('<h4 style="text-align:center; color:#00cccc; font-family: Orbitron, monospace;">🚀 Export Growth Trajectory (Slide View)</h4>', unsafe_allow_html=True)
-        
-                # Filter export_projection data based on global time_horizon or year_range if applicable
-                # For this example, let's assume export_projection data aligns with the full range or specific years
-                # If year_range from global filter is (2024, 2030), it would filter this data. We might need a more specific filter for projections.
-        
-                fig_export_slide = go.Figure()
-                fig_export_slide.add_trace(go.Scatter(
-                    x=export_projection['Year'], # Assuming export_projection is already correctly filtered or covers the range
-            y=export_projection['Export_Percent_GDP'],
-            mode='lines+markers',
-            name='Total Exports (% GDP)',
-                    line=dict(color='#1ABC9C', width=3),
-                    marker=dict(size=9, symbol="star-diamond"),
-                    fill='tozeroy', # Fill to y=0
-                    fillcolor='rgba(26,188,156,0.15)',
-                    hovertemplate='<b>Total Exports:</b> %{y:.2f}% of GDP<br>Year: %{x}<extra></extra>'
-                ))
-                fig_export_slide.add_trace(go.Scatter(
-            x=export_projection['Year'],
-            y=export_projection['MSME_Export_Share'],
-            mode='lines+markers',
-            name='MSME Export Share (%)',
-                    line=dict(color='#9B59B6', width=3, dash='dash'),
-                    marker=dict(size=9, symbol="triangle-up"),
-                    yaxis='y2',
-                    hovertemplate='<b>MSME Share:</b> %{y:.1f}%<br>Year: %{x}<extra></extra>'
-                ))
-                fig_export_slide.add_hline(y=25, line_dash="dot", line_color="#E74C3C", line_width=2,
-                                        annotation_text="Target: 25% of GDP by 2030", 
-                                        annotation_position="bottom right", 
-                                        annotation_font=dict(color="#E74C3C"))
-
-                fig_export_slide.update_layout(
-            height=600,
-                    font=dict(family="Inter", color="#00cccc", size=12),
-                    paper_bgcolor='rgba(5,5,5,0.95)', 
-                    plot_bgcolor='rgba(10,10,20,0.6)',
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(size=11, color="#00cccc"), bgcolor="rgba(5,5,5,0.7)"),
-                    xaxis=dict(title="Year", gridcolor='rgba(0,204,204,0.1)', zerolinecolor='rgba(204,102,153,0.2)', color="#00cccc"),
-                    yaxis=dict(title="Total Exports (% GDP)", gridcolor='rgba(0,204,204,0.1)', zerolinecolor='rgba(204,102,153,0.2)', color="#00cccc"),
-                    yaxis2=dict(title="MSME Export Share (%)", overlaying="y", side="right", color="#9B59B6", gridcolor='rgba(155,89,182,0.1)', showgrid=False, tickfont=dict(color="#9B59B6")),
-                    hovermode='x unified'
-                )
-                st.plotly_chart(fig_export_slide, use_container_width=True, key=f"export_chart_slide_{i}")
-                st.markdown('</div>', unsafe_allow_html=True) # Close chart-container
-
-        elif i == 3: # Regional Analysis Slide
-            with st.container():
-                st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-                
-                # For regional data, we usually show the top N states or all available.
-                # No specific filter from global set seems directly applicable unless we add one for states.
-                
-                fig_regional_slide = go.Figure()
-                
-                # Top N states for clarity, e.g., top 6 or 10
-                top_n_states = regional_data.nlargest(10, 'MSME_Count')
-                
-                # Define a more vibrant and distinct color palette for cyberpunk theme
-                cyber_colors = ['#FF00FF', '#00FFFF', '#FFFF00', '#FF6B35', '#20C997', '#6F42C1', '#E83E8C', '#FD7E14', '#007BFF', '#343A40']
-                
-                fig_regional_slide.add_trace(go.Bar(
-                    x=top_n_states['State'],
-                    y=top_n_states['MSME_Count'],
-                    name='MSME Count by State',
-            marker=dict(
-                        color=cyber_colors[:len(top_n_states)], # Apply colors
-                        line=dict(color='rgba(255,255,255,0.5)', width=1)
-                    ),
-                    text=[f'{count/1000:.1f}K' for count in top_n_states['MSME_Count']], # Format text as thousands
-                    textposition='outside', # Position text above bars
-                    textfont=dict(size=10, color='#00cccc'),
-                    hovertemplate='<b>%{x}</b><br>MSME Count: %{y:,}<br>GDP Contrib: %{customdata[0]:.1f}%<br>Digital Score: %{customdata[1]}<extra></extra>',
-                    customdata=top_n_states[['GDP_Contribution', 'Digital_Score']]
-                ))
-                
-                fig_regional_slide.update_layout(
-            height=600,
-                    font=dict(family="Inter", color="#00cccc", size=12),
-                    paper_bgcolor='rgba(5,5,5,0.95)', 
-                    plot_bgcolor='rgba(10,10,20,0.6)',
-                    showlegend=False, # Bar charts often don't need a legend for a single trace
-            xaxis=dict(
-                        title="State / Union Territory", 
-                        gridcolor='rgba(0,204,204,0.1)', 
-                        color="#00cccc", 
-                        tickangle=-45, # Angled ticks for better readability
-                        tickfont=dict(size=11)
-            ),
-            yaxis=dict(
-                        title="Number of MSME Enterprises", 
-                        gridcolor='rgba(0,204,204,0.1)', 
-                        color="#00cccc",
-                        tickformat=',.0f' # Format y-axis ticks with commas
-                    ),
-                    hoverlabel=dict(bgcolor="rgba(5,5,5,0.8)", font_size=13, font_family="Inter")
-                )
-                st.plotly_chart(fig_regional_slide, use_container_width=True, key=f"regional_chart_slide_{i}")
-                st.markdown('</div>', unsafe_allow_html=True) # Close chart-container
-
-        # End of slide specific content
-        st.markdown('</div>', unsafe_allow_html=True) # This closes the <div class="slide ...">
-
-    # Navigation Controls (This was part of the erroneously deleted block)
-    st.markdown("""
-    <div class="slide-nav">
-        <button class="slide-btn" onclick="showSlide(0); window.parent.postMessage({type: 'setSlide', slide: 0}, '*')">🏗️ Economic</button>
-        <button class="slide-btn" onclick="showSlide(1); window.parent.postMessage({type: 'setSlide', slide: 1}, '*')">🎯 MSME</button>
-        <button class="slide-btn" onclick="showSlide(2); window.parent.postMessage({type: 'setSlide', slide: 2}, '*')">🌐 Export</button>
-        <button class="slide-btn" onclick="showSlide(3); window.parent.postMessage({type: 'setSlide', slide: 3}, '*')">🏭 Regional</button>
-        
-        
-    </div>
-    </div> 
-    """, unsafe_allow_html=True) # Note: One </div> was for slideshow-container, another seems to be from original
-
-    # Streamlit navigation buttons (fallback)
-    nav_cols = st.columns(4)
-    with nav_cols[0]:
-        if st.button("🏗️ Economic Foundation", key="nav_economic_fallback", use_container_width=True): # Added fallback key
-            st.session_state.current_slide = 0
-            st.rerun()
-    with nav_cols[1]:
-        if st.button("🎯 MSME Opportunities", key="nav_msme_fallback", use_container_width=True): # Added fallback key
-            st.session_state.current_slide = 1
-            st.rerun()
-    with nav_cols[2]:
-        if st.button("🌐 Export Pathway", key="nav_export_fallback", use_container_width=True): # Added fallback key
-            st.session_state.current_slide = 2
-            st.rerun()
-    with nav_cols[3]:
-        if st.button("🏭 Regional Analysis", key="nav_regional_fallback", use_container_width=True): # Added fallback key
-            st.session_state.current_slide = 3
-            st.rerun()
-    
-    # Story Narration Section
-    st.markdown("""
-    <div class="story-narration">
-        <div class="story-title">📖 Analytics Story Narration</div>
-        <div class="story-content">
-    """, unsafe_allow_html=True)
-    
-    current_story = slides[st.session_state.current_slide]['story']
-    st.markdown(f"""
-        <p><strong>🎬 Current Chapter:</strong> {slides[st.session_state.current_slide]['title']}</p>
-        <p>{current_story}</p>
-        
-        <div style="margin-top: 1.5rem; padding: 1rem; background: rgba(0, 204, 204, 0.1); border-radius: 8px; border-left: 4px solid #00cccc;">
-            <h4 style="color: #00cccc; margin: 0 0 0.5rem 0;">💭 Narrative Insights</h4>
-            <p style="margin: 0; font-style: italic;">This slide presents key data patterns that tell the story of India's MSME ecosystem evolution. Each visualization reveals critical decision points for strategic investment and policy formation.</p>
-        </div>
-        
-        <div style="margin-top: 1rem; text-align: center;">
-            <p style="font-size: 0.9rem; opacity: 0.8;">🎯 Use the navigation buttons above to explore different chapters of the MSME analytics story</p>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown('</div></div>', unsafe_allow_html=True) # Closes story-content and story-narration
+    render_slideshow(filtered_economic, msme_sectors, export_projection, regional_panel, data_version, query_engine,
+                     analytics)
     
     # 🧠 AI-POWERED REAL-TIME INSIGHTS ENGINE (Still within col1)
     with st.container():
@@ -696,27 +469,17 @@ with col1:
         # Click-to-AI functionality
         if st.button("🤖 Analyze Economic Trends", key="econ_click_ai_restored", use_container_width=True): # Key changed
             st.session_state.selected_chart = "Economic Foundation"
-            st.session_state.ai_context = get_enhanced_chart_context(
-                "Economic Foundation Analysis - User clicked on economic indicators",
-                "GDP shows resilience post-COVID at 8.15% (2023), Digital adoption accelerated to 89%, Workforce reached 607.7M (WB verified)",
-                st.session_state.filters
+            st.session_state.ai_context = context_snapshots.system_context(
+                'economic_foundation', st.session_state.filters,
+                "Economic Foundation Analysis - User clicked on economic indicators"
             )
         
         st.info("💡 **Key Insight:** GDP growth reached 8.15% in 2023 (WB: 8.1529%), labor force expanded to 607.7M workers (WB: 607,691,498), and exports reached 21.85% of GDP (WB: 21.8482%). These EXACT values match your unified story visualizations.")
         
         if st.button("🤖 Ask AI about Economic Foundation", key="econ_ai_restored", use_container_width=True): # Key changed
             st.session_state.selected_chart = "Economic Foundation"
-            # Ensure filtered_economic_slide is defined or use global filtered_economic
-            # This part needs to be aware of which data to use for context
-            current_econ_data_for_ai = economic_data[ (economic_data['Year'] >= st.session_state.filters['year_range'][0]) & (economic_data['Year'] <= st.session_state.filters['year_range'][1])]
-            if not current_econ_data_for_ai.empty:
-                 st.session_state.ai_context = get_enhanced_chart_context(
-                    "Economic Foundation Analysis",
-                    f"GDP: {current_econ_data_for_ai['GDP_Growth'].iloc[-1]}%, Labor: {current_econ_data_for_ai['Labor_Force_Million'].iloc[-1]}M, Digital: {current_econ_data_for_ai['Digital_Adoption'].iloc[-1]}%",
-                    st.session_state.filters
-                )
-            else: # Fallback if no data
-                 st.session_state.ai_context = get_enhanced_chart_context("Economic Foundation Analysis", "Economic data for the selected range is currently unavailable.", st.session_state.filters)
+            # Precomputed summary for the selected year range (it reports when the range has no data)
+            st.session_state.ai_context = context_snapshots.system_context('economic_foundation', st.session_state.filters)
 
         # The st.markdown('</div>', unsafe_allow_html=True) for this AI engine container was missing, adding it back
     st.markdown('</div>', unsafe_allow_html=True) # Closes the AI Insights Engine container in col1
@@ -780,99 +543,6 @@ with col1:
         st.markdown("</div>", unsafe_allow_html=True) # Closes strategic-roadmap-container
     # END OF NEW STRATEGIC BLUEPRINT SECTION
 
-    # AI Chat Panel (in col2)
-    with col2: 
-        st.markdown("""
-        <div class="ai-panel-container">
-            <div class="ai-panel-header">
-                <h3><span class="ai-icon">🤖</span> QUANTUM AI ANALYST</h3>
-                <p>Your copilot for deep economic insights & strategic foresight.</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # --- API Key Handling --- 
-        # Attempt to load from st.secrets first
-        try:
-            if 'openai_api_key' not in st.session_state or not st.session_state.openai_api_key:
-                if "OPENAI_API_KEY" in st.secrets:
-                    st.session_state.openai_api_key = st.secrets["OPENAI_API_KEY"]
-                    st.success("🔑 OpenAI API Key loaded securely from secrets. AI features enabled.")
-                else:
-                    st.session_state.openai_api_key = ""  # Ensure it's initialized if not in secrets
-        except Exception:
-            st.session_state.openai_api_key = ""
-        
-        # Only show input if key is not loaded from secrets
-        if not st.session_state.get("openai_api_key"): 
-            openai_api_key_input = st.text_input(
-                "🔑 Enter OpenAI API Key (or set OPENAI_API_KEY in st.secrets):", 
-                type="password", 
-                key="openai_api_key_input_main_panel", 
-                help="Required for AI analysis. Your key is not stored if using secrets."
-            )
-            if openai_api_key_input:
-                st.session_state.openai_api_key = openai_api_key_input
-                st.rerun() # Rerun to reflect the new key status
-        
-        if not st.session_state.get("openai_api_key"):
-            st.warning("Please enter your OpenAI API key above, or set it in `secrets.toml` (local) / Streamlit Cloud secrets (deployed) to enable AI features.")
-        elif not st.session_state.openai_api_key.startswith("sk-"):
-            st.warning("Invalid OpenAI API Key format. It should start with 'sk-'. Please check and re-enter.")
-        else:
-            st.success("OpenAI API Key accepted. AI features enabled.")
-        # --- End API Key Handling ---
-            
-        st.markdown("""
-            <div class="chat-interface">
-        """, unsafe_allow_html=True)
-    
-        if st.session_state.chat_history:
-            for entry in st.session_state.chat_history[-10:]: # Iterate through a copy or recent items
-                if isinstance(entry, tuple) and len(entry) == 2:
-                    role, text = entry
-                    if role == "user":
-                        st.markdown(f'<div class="chat-bubble user-bubble">{text}</div>', unsafe_allow_html=True)
-                    else:
-                        st.markdown(f'<div class="chat-bubble ai-bubble">{text}</div>', unsafe_allow_html=True)
-                elif isinstance(entry, dict) and 'question' in entry and 'response' in entry:
-                    # This section is for the other chat history format, display as Q&A
-                    # This part of the UI (chat bubbles) might not be the best place for Q&A format.
-                    # Consider if you want to display dict-formatted history here, or only in the expander section.
-                    # For now, let's display user's question from dict format if it's a user turn.
-                    # Or display AI response if it's an AI turn (though dicts usually have both Q and A).
-                    # This part might need more UI/UX thought based on how you want to mix formats.
-                    # A simple approach:
-                    st.markdown(f'<div class="chat-bubble user-bubble">Q: {entry["question"]}</div>', unsafe_allow_html=True)
-                    st.markdown(f'<div class="chat-bubble ai-bubble">A: {entry["response"]}</div>', unsafe_allow_html=True)
-                # else:
-                    # Optionally handle or log unexpected chat entry formats
-                    # st.warning("Unsupported chat history format encountered.")
-        
-        user_query_ai = st.text_area("💬 Ask the AI:", key="ai_chat_input_panel", height=100)
-
-        if st.button("🚀 Send to AI", key="send_ai_button_panel", use_container_width=True):
-            if not st.session_state.openai_api_key:
-                st.error("Cannot connect to AI: OpenAI API Key is missing.")
-            elif not user_query_ai:
-                st.warning("Please enter a question for the AI.")
-            else:
-                with st.spinner("🧠 Quantum AI is processing your query..."):
-                    current_slide_title = slides[st.session_state.current_slide]['title'] if 'current_slide' in st.session_state and slides else "General Dashboard View"
-                    active_filters_summary = f"Year: {st.session_state.filters['year_range']}, Sectors: {st.session_state.filters.get('sectors','All')}"
-                    context_for_ai = get_enhanced_chart_context(
-                        f"User query regarding: {current_slide_title}",
-                        f"Current filters: {active_filters_summary}. User is viewing {current_slide_title}.",
-                        st.session_state.filters
-                    )
-                    ai_response = chat_with_ai_enhanced(user_query_ai, context_for_ai)
-                    st.session_state.chat_history.append(("user", user_query_ai))
-                    st.session_state.chat_history.append(("ai", ai_response))
-                    st.rerun()
-
-        st.markdown("</div>", unsafe_allow_html=True) # Close chat-interface
-        # Removed one redundant </div> for ai-panel-container
-
     # Enhanced Cyberpunk Footer
     st.markdown("""
     <div class="cyber-footer">
@@ -886,105 +556,7 @@ with col1:
         </div>
         """, unsafe_allow_html=True)
 
-    # Final script cleanup: Remove any trailing/extra st.markdown('</div>', unsafe_allow_html=True) that might be left from old structures.
-    # This is hard to do without seeing the full file context after this edit.
-
-    # ... (This section seemed okay) ...
 
 # AI Chat Panel (Right Column)
 with col2:
-    st.markdown('<div class="ai-chat-container">', unsafe_allow_html=True)
-    st.markdown("### 🤖 AI Analytics Assistant")
-    
-    if st.session_state.openai_api_key:
-        st.markdown('<span class="status-indicator status-online"></span>**AI Ready for All Users**', unsafe_allow_html=True)
-        st.info("🌟 AI insights powered by GPT-4 are available for everyone!")
-    else:
-        st.markdown('<span class="status-indicator status-offline"></span>**AI Temporarily Offline**', unsafe_allow_html=True)
-    
-    # Chat History
-    if st.session_state.chat_history:
-        st.markdown("#### 💬 Recent Conversations")
-        for i, chat_item in enumerate(st.session_state.chat_history[-2:]): # Iterate through a copy or recent items
-            if isinstance(chat_item, dict) and 'question' in chat_item and 'response' in chat_item:
-                question = chat_item['question']
-                response = chat_item['response']
-                timestamp = chat_item.get('timestamp', 'Unknown time')
-                with st.expander(f"💡 {question[:30]}..."):
-                    st.markdown(f"**Q:** {question}")
-                    st.markdown(f"**AI:** {response}")
-                    st.caption(f"⏰ {timestamp}")
-            elif isinstance(chat_item, tuple) and len(chat_item) == 2:
-                role, text = chat_item
-                # Decide how to display tuple-based chat history in this expander
-                # For example, show user queries or AI responses directly
-                if role == "user":
-                    with st.expander(f"👤 User: {text[:30]}..."):
-                        st.markdown(text)
-                else: # AI
-                    with st.expander(f"🤖 AI: {text[:30]}..."):
-                        st.markdown(text)
-            # else:
-                # Optionally log or display a message for unsupported formats
-                # st.write(f"Skipping item {i}: Unsupported format")
-    
-    # Current question
-    st.markdown("#### ❓ Ask About Current Analysis")
-    
-    if st.session_state.selected_chart:
-        st.info(f"📊 Context: {st.session_state.selected_chart}")
-    
-    user_question = st.text_area(
-        "Your question:",
-        placeholder="e.g., 'What are the top investment opportunities?' or 'How can we achieve 25% export target?'",
-        height=100,
-        key="ai_question"
-    )
-    
-    # Quick question buttons
-    st.markdown("**⚡ Quick Questions:**")
-    quick_questions = [
-        "💰 Investment opportunities?",
-        "📈 Growth drivers?", 
-        "🎯 Strategic priorities?",
-        "🌍 Export potential?"
-    ]
-    
-    cols = st.columns(2)
-    for i, question in enumerate(quick_questions):
-        with cols[i % 2]:
-            if st.button(question, key=f"quick_{i}", use_container_width=True):
-                if st.session_state.selected_chart and st.session_state.openai_api_key:
-                    with st.spinner("🧠 AI analyzing..."):
-                        response = chat_with_ai_enhanced(question, st.session_state.ai_context)
-                        st.session_state.chat_history.append({
-                            "question": question,
-                            "response": response,
-                            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                            "chart": st.session_state.selected_chart
-                        })
-                        st.rerun()
-    
-    # Main AI query button
-    if st.button("🚀 Get AI Insights", disabled=not st.session_state.openai_api_key, use_container_width=True):
-        if user_question and st.session_state.selected_chart:
-            with st.spinner("🤔 AI is analyzing data..."):
-                response = chat_with_ai_enhanced(user_question, st.session_state.ai_context)
-                
-                st.session_state.chat_history.append({
-                    "question": user_question,
-                    "response": response,
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                    "chart": st.session_state.selected_chart
-                })
-                
-                st.markdown("#### 🎯 AI Response")
-                st.markdown(f"""
-                <div class="insight-card">
-                    {response}
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.warning("Please select a chart above and enter a question!")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+    render_ai_panels()
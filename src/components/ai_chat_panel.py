@@ -42,22 +42,22 @@ def render_ai_chat_panel(slides_data=None): # slides_data is optional
 
         if st.button("🚀 Send to AI", key="send_ai_button_main_panel_v3", use_container_width=True):
             if st.session_state.get("openai_api_key") and user_query_ai:
-                with st.spinner("🧠 AI processing..."):
-                    current_slide_index = st.session_state.get('current_slide', 0)
-                    slide_title = "General"
-                    # Ensure slides_data is a list and current_slide_index is valid
-                    if isinstance(slides_data, list) and slides_data and 0 <= current_slide_index < len(slides_data) and isinstance(slides_data[current_slide_index], dict) and 'title' in slides_data[current_slide_index]:
-                        slide_title = slides_data[current_slide_index]['title']
-
-                    filters = st.session_state.get('filters', {"year_range": (2010,2024), "analysis_type":"Complete Analysis", "time_horizon": "Current (2024)", "sectors": []}) # Provide default filters
-                    ai_context = st.session_state.get("ai_context")
-                    if not ai_context:
-                        ai_context = get_enhanced_chart_context(slide_title, "Data for " + slide_title, filters)
-
-                    response = chat_with_ai_enhanced(user_query_ai, ai_context)
-                    st.session_state.chat_history.append({"role": "user", "text": user_query_ai, "timestamp": datetime.now().strftime("%H:%M")})
-                    st.session_state.chat_history.append({"role": "ai", "text": response, "timestamp": datetime.now().strftime("%H:%M")})
-                    st.rerun()
+                current_slide_index = st.session_state.get('current_slide', 0)
+                slide_title = "General"
+                # Ensure slides_data is a list and current_slide_index is valid
+                if isinstance(slides_data, list) and slides_data and 0 <= current_slide_index < len(slides_data) and isinstance(slides_data[current_slide_index], dict) and 'title' in slides_data[current_slide_index]:
+                    slide_title = slides_data[current_slide_index]['title']
+
+                filters = st.session_state.get('filters', {"year_range": (2010,2024), "analysis_type":"Complete Analysis", "time_horizon": "Current (2024)", "sectors": []}) # Provide default filters
+                ai_context = st.session_state.get("ai_context")
+                if not ai_context:
+                    ai_context = get_enhanced_chart_context(slide_title, "Data for " + slide_title, filters)
+
+                # Stream tokens into the panel as they arrive
+                response = st.write_stream(chat_with_ai_enhanced(user_query_ai, ai_context, stream=True))
+                st.session_state.chat_history.append({"role": "user", "text": user_query_ai, "timestamp": datetime.now().strftime("%H:%M")})
+                st.session_state.chat_history.append({"role": "ai", "text": response, "timestamp": datetime.now().strftime("%H:%M")})
+                st.rerun()
             elif not st.session_state.get("openai_api_key"): st.error("API Key needed.")
             else: st.warning("Enter a question.")
         st.markdown("</div>", unsafe_allow_html=True)
@@ -1,4 +1,7 @@
 import streamlit as st
+from src.utils.fragments import fragment
+
+@fragment
 def render_metrics():
     st.markdown('<h2 class="section-header">📊 QUANTUM PERFORMANCE MATRIX</h2>', unsafe_allow_html=True)
     metric_cols = st.columns(4)
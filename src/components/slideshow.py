@@ -0,0 +1,186 @@
+import streamlit as st
+from src.utils.fragments import fragment
+from src.utils.figures import (
+    build_economic_foundation_figure,
+    build_msme_opportunities_figure,
+    build_export_pathway_figure,
+    build_regional_figure,
+    get_slide_figure,
+)
+
+SLIDES = [
+    {
+        "title": "Economic Foundation",
+        "subtitle": "GDP Growth & Labor Force Analysis",
+        "icon": "🏗️",
+        "nav_label": "🏗️ Economic Foundation",
+        "nav_key": "nav_economic_fallback",
+        "story": "India's economic resilience shines through post-COVID recovery with 8.2% GDP growth and 608M workforce."
+    },
+    {
+        "title": "MSME Opportunities",
+        "subtitle": "Sector Growth & Digital Transformation",
+        "icon": "🎯",
+        "nav_label": "🎯 MSME Opportunities",
+        "nav_key": "nav_msme_fallback",
+        "story": "Digital Commerce leads with 32% growth potential while FinTech and HealthTech emerge as powerhouse sectors."
+    },
+    {
+        "title": "Export Pathway",
+        "subtitle": "Global Trade & Export Potential",
+        "icon": "🌐",
+        "nav_label": "🌐 Export Pathway",
+        "nav_key": "nav_export_fallback",
+        "story": "Export trajectory from 21.8% to 25% of GDP by 2030, with MSMEs driving 68% of total export growth."
+    },
+    {
+        "title": "Regional Analysis",
+        "subtitle": "State-wise MSME Distribution",
+        "icon": "🏭",
+        "nav_label": "🏭 Regional Analysis",
+        "nav_key": "nav_regional_fallback",
+        "story": "Maharashtra, Gujarat, and Tamil Nadu lead MSME concentration with unique specialization patterns."
+    }
+]
+
+
+def _go_to_slide(index):
+    # Runs before the fragment re-executes, so the click renders the new slide in one pass
+    st.session_state.current_slide = index
+
+
+def _render_active_chart(i, filtered_economic, msme_sectors, export_projection, regional_panel, data_version,
+                         query_engine, analytics):
+    # With the DuckDB backend each builder queries just its chart's rows, and only on a figure cache miss
+    filters = st.session_state.filters
+    if i == 0:  # Economic Foundation
+        with st.container():
+            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            fig_growth = get_slide_figure('economic_foundation', filters, data_version,
+                                          lambda: build_economic_foundation_figure(
+                                              analytics.economic_series(filters.get('year_range')) if analytics
+                                              else filtered_economic))
+            st.plotly_chart(fig_growth, use_container_width=True, key=f"economic_foundation_chart_slide_{i}")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    elif i == 1: # MSME Opportunities Slide
+        st.markdown('<div class="filter-section" style="margin-top:1rem; margin-bottom:1rem; padding:1rem;">', unsafe_allow_html=True)
+        st.markdown('<div class="control-group"><span class="control-label">🏭 SECTOR FOCUS FOR MSME DATA</span></div>', unsafe_allow_html=True)
+        available_sectors_slide = list(msme_sectors['Sector'].unique())
+        selected_sectors_slide = st.multiselect(
+            "Select Sectors for MSME Opportunity Analysis",
+            available_sectors_slide,
+            default=st.session_state.filters.get('sectors', []), # Use .get for safety
+            key=f"sector_focus_slide_{i}",
+            label_visibility="collapsed"
+        )
+        st.session_state.filters['sectors'] = selected_sectors_slide
+
+        display_sectors_slide = msme_sectors
+        if analytics is not None:
+            display_sectors_slide = analytics.sector_metrics(selected_sectors_slide)
+        elif selected_sectors_slide and query_engine is not None: # Filter if any sectors are selected
+            display_sectors_slide = query_engine.select('sectors', {'sectors': selected_sectors_slide})
+        elif selected_sectors_slide:
+            display_sectors_slide = msme_sectors[msme_sectors['Sector'].isin(selected_sectors_slide)]
+
+        st.markdown('</div>', unsafe_allow_html=True) # Close filter-section
+
+        with st.container():
+            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            if display_sectors_slide.empty:
+                st.warning("No sectors selected or data available for the current filter.")
+            fig_bubble_slide = get_slide_figure('msme_opportunities', filters, data_version,
+                                                lambda: build_msme_opportunities_figure(display_sectors_slide))
+            st.plotly_chart(fig_bubble_slide, use_container_width=True, key=f"msme_bubble_chart_slide_{i}")
+            st.markdown('</div>', unsafe_allow_html=True) # Close chart-container
+
+    elif i == 2: # Export Pathway Slide
+        with st.container():
+            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            st.markdown('<h4 style="text-align:center; color:#00cccc; font-family: Orbitron, monospace;">🚀 Export Growth Trajectory (Slide View)</h4>', unsafe_allow_html=True)
+            fig_export_slide = get_slide_figure('export_pathway', filters, data_version,
+                                                lambda: build_export_pathway_figure(
+                                                    analytics.export_projection() if analytics else export_projection))
+            st.plotly_chart(fig_export_slide, use_container_width=True, key=f"export_chart_slide_{i}")
+            st.markdown('</div>', unsafe_allow_html=True) # Close chart-container
+
+    elif i == 3: # Regional Analysis Slide
+        with st.container():
+            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            if analytics is None and regional_panel is None:
+                st.warning("Regional MSME panel data is not available.")
+            else:
+                # Rollups are precomputed in the panel (or aggregated in DuckDB); the slide only picks the year range
+                source = analytics or regional_panel
+                start, end = source.clamp_years(filters.get('year_range'))
+                fig_regional_slide = get_slide_figure('regional_analysis', filters, data_version,
+                                                      lambda: build_regional_figure(
+                                                          analytics.state_rankings((start, end), limit=10) if analytics
+                                                          else regional_panel.query((start, end))))
+                st.plotly_chart(fig_regional_slide, use_container_width=True, key=f"regional_chart_slide_{i}")
+                st.caption(f"New MSME registrations, fiscal years ending {start}-{end}")
+            st.markdown('</div>', unsafe_allow_html=True) # Close chart-container
+
+
+@fragment
+def render_slideshow(filtered_economic, msme_sectors, export_projection, regional_panel, data_version=None,
+                     query_engine=None, analytics=None):
+    """Slideshow fragment: a nav click reruns only this block and builds only the active slide's figure"""
+    if 'current_slide' not in st.session_state:
+        st.session_state.current_slide = 0
+    i = st.session_state.current_slide
+    slide = SLIDES[i]
+
+    # Slideshow Container
+    st.markdown("""
+    <div class="slideshow-container">
+        """, unsafe_allow_html=True)
+
+    st.markdown(f"""
+    <div class="slide active" id="slide{i}">
+        <div style="text-align: center; margin-bottom: 2rem;">
+            <h2 style="color: #00cccc; font-family: 'Orbitron', monospace; font-size: 2.5rem; margin-bottom: 0.5rem;">
+                {slide['icon']} {slide['title']}
+            </h2>
+            <h3 style="color: #cc6699; font-size: 1.2rem; margin-bottom: 2rem;">
+                {slide['subtitle']}
+            </h3>
+        </div>
+    """, unsafe_allow_html=True)
+
+    _render_active_chart(i, filtered_economic, msme_sectors, export_projection, regional_panel, data_version,
+                         query_engine, analytics)
+
+    st.markdown('</div>', unsafe_allow_html=True) # This closes the <div class="slide ...">
+    st.markdown('</div>', unsafe_allow_html=True) # Closes slideshow-container
+
+    # Streamlit navigation buttons
+    nav_cols = st.columns(len(SLIDES))
+    for n, nav_slide in enumerate(SLIDES):
+        with nav_cols[n]:
+            st.button(nav_slide['nav_label'], key=nav_slide['nav_key'], use_container_width=True,
+                      on_click=_go_to_slide, args=(n,))
+
+    # Story Narration Section
+    st.markdown("""
+    <div class="story-narration">
+        <div class="story-title">📖 Analytics Story Narration</div>
+        <div class="story-content">
+    """, unsafe_allow_html=True)
+
+    st.markdown(f"""
+        <p><strong>🎬 Current Chapter:</strong> {slide['title']}</p>
+        <p>{slide['story']}</p>
+
+        <div style="margin-top: 1.5rem; padding: 1rem; background: rgba(0, 204, 204, 0.1); border-radius: 8px; border-left: 4px solid #00cccc;">
+            <h4 style="color: #00cccc; margin: 0 0 0.5rem 0;">💭 Narrative Insights</h4>
+            <p style="margin: 0; font-style: italic;">This slide presents key data patterns that tell the story of India's MSME ecosystem evolution. Each visualization reveals critical decision points for strategic investment and policy formation.</p>
+        </div>
+
+        <div style="margin-top: 1rem; text-align: center;">
+            <p style="font-size: 0.9rem; opacity: 0.8;">🎯 Use the navigation buttons above to explore different chapters of the MSME analytics story</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown('</div></div>', unsafe_allow_html=True) # Closes story-content and story-narration
@@ -1,13 +1,20 @@
 import streamlit as st
-import os
+from src.utils.image_cache import chapter_picture_html, load_chapter_image
+def render_chapter_image(name, caption):
+    # WebP/JPEG size tiers from the static route; st.image (1x JPEG) when static serving is off
+    if st.get_option('server.enableStaticServing'):
+        st.markdown(chapter_picture_html(name, caption), unsafe_allow_html=True)
+        st.caption(caption)
+    else:
+        st.image(load_chapter_image(name), caption=caption, use_column_width=True)
 def render_story_visualizations():
     st.markdown('<h2 class="section-header">🖼️ UNIFIED STORY VISUALIZATIONS</h2>', unsafe_allow_html=True)
     viz_tabs = st.tabs(["📊 Ch1: Eco Foundation", "🎯 Ch2: MSME Oppy", "🌐 Ch3: Export Pathway"])
-    img_paths = ['output/images/chapter1_economic_foundation.png', 'output/images/chapter2_msme_opportunities.png', 'output/images/chapter3_export_pathway.png']
+    chapter_names = ['chapter1_economic_foundation', 'chapter2_msme_opportunities', 'chapter3_export_pathway']
     captions = ["Ch1: Eco Foundation", "Ch2: MSME Opportunities", "Ch3: Export Pathway"]
     for i, tab in enumerate(viz_tabs):
         with tab:
             st.markdown(f"### {captions[i]}")
-            if os.path.exists(img_paths[i]): st.image(img_paths[i], caption=captions[i], use_column_width=True)
-            else: st.error(f"Image not found: {img_paths[i]}")
+            try: render_chapter_image(chapter_names[i], captions[i])
+            except FileNotFoundError as e: st.error(str(e))
     st.info("💡 Actual visualizations from unified MSME story analysis.")
@@ -3,98 +3,286 @@ import openai # For OpenAI client
 import json # Though not used in current functions, good to keep if future AI responses are complex JSON
 import httpx # Import httpx
 import os # Import os to access environment variables
+import asyncio
+import sqlite3
+from src.utils.response_cache import ResponseCache, response_cache_key, normalize_question
+from src.utils.context_builder import build_system_context, build_messages, with_sections
+from src.utils.report_index import ReportIndex, format_excerpt
+from src.utils.model_routing import MODEL_TIERS, classify_request, completion_params
+
+# Connection settings for the shared client: keep-alive pool sized for concurrent sessions,
+# short connect timeout, and transport-level retries for dropped connections.
+# openai's own max_retries covers 429/5xx with exponential backoff.
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=120.0)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+HTTP_CONNECT_RETRIES = 2
+OPENAI_MAX_RETRIES = 3
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key):
+    """One pooled OpenAI client per API key, shared by every session in the process"""
+    http_client = httpx.Client(
+        transport=httpx.HTTPTransport(limits=HTTP_LIMITS, retries=HTTP_CONNECT_RETRIES),
+        timeout=HTTP_TIMEOUT,
+    )
+    return openai.OpenAI(api_key=api_key, http_client=http_client, max_retries=OPENAI_MAX_RETRIES, timeout=HTTP_TIMEOUT)
 
 def get_enhanced_chart_context(chart_type, data_summary, filters):
-    filter_context = f"""
-    Applied Filters:
-    - Year Range: {filters['year_range'][0]}-{filters['year_range'][1]}
-    - Analysis Type: {filters['analysis_type']}
-    - Time Horizon: {filters['time_horizon']}
-    - Selected Sectors: {', '.join(filters['sectors']) if filters['sectors'] else 'All sectors'}
-    """
+    # Token-budgeted system prompt: slide data and filters first, static facts fill the remainder
+    return build_system_context(chart_type, data_summary, filters)
 
-    context = f"""
-    You are an advanced AI analyst specializing in India's MSME (Micro, Small & Medium Enterprises) ecosystem.
-    You have access to real-time data and can provide deep insights with specific recommendations.
-
-    Current Analysis Context: {chart_type}
-    Data Summary: {data_summary}
-    {filter_context}
-
-    Key Economic Indicators (EXACT World Bank Data - Unified Story Aligned):
-    - India's GDP growth: 8.15% (2023, WB: 8.1529363109041) - EXACT from wb_combined_indicators.csv
-    - Labor force: 607.7M workers (2024, WB: 607,691,498) - EXACT World Bank Official Data
-    - MSME GDP contribution: 30.7% (2024 est.), stable at 29-30% range - MSME Ministry
-    - Total MSME count: 57M+ registered enterprises (Dec 2024) - Udyam Portal
-    - Export share: 21.85% of GDP (2023, WB: 21.8482115022381) - EXACT from World Bank
-
-    Priority Growth Sectors (CORRECTED - Conservative Estimates):
-    - Digital Commerce: 18.5% CAGR potential, $189B market - IBEF/McKinsey Reports
-    - Financial Services: 16.2% CAGR, $156B market - Industry Analysis
-    - Healthcare Tech: 14.8% CAGR, 4.5x employment multiplier - Sector Studies
-    - Agriculture Tech: 12.5% CAGR, high rural impact - Government Reports
-
-    Strategic Context (DATA SOURCES VERIFIED):
-    - Digital adoption: 89% (2024) vs 12% (2010) - Estimated based on trends
-    - FDI inflows: $83.5B (2024), steady growth - RBI Data
-    - Export target: 23.6% of GDP by 2030 (current: 21.8%) - Conservative WB-aligned projection
-    - Regional leaders: Maharashtra (3.7M), Tamil Nadu (2.2M), UP (2.0M) MSMEs - Udyam Data
-
-    Provide actionable insights with specific numbers, policy recommendations,
-    and investment strategies. Be conversational but data-driven.
-    """
-    return context
+# Shared completion settings for the analyst panels; model and max_tokens come from the routed tier
+# (src/utils/model_routing.py)
+CHAT_COMPLETION_PARAMS = dict(
+    temperature=0.7,
+    presence_penalty=0.1,
+    frequency_penalty=0.1
+)
+
+def _resolve_api_key():
+    # Prioritize environment variable (loaded from .env locally, or set in deployment)
+    api_key = os.environ.get('OPENAI_API_KEY')
+
+    # Fallback to st.secrets (for Streamlit Cloud)
+    if not api_key and "OPENAI_API_KEY" in st.secrets:
+        api_key = st.secrets["OPENAI_API_KEY"]
 
-def chat_with_ai_enhanced(user_question, chart_context):
+    # Fallback to session_state (if user manually entered, less ideal now)
+    if not api_key and st.session_state.get('openai_api_key'):
+        api_key = st.session_state.get('openai_api_key')
+
+    # Update session_state if a key was found from env or secrets, for consistency in UI
+    if api_key and not st.session_state.get('openai_api_key'):
+         st.session_state.openai_api_key = api_key
+    return api_key
+
+@st.cache_resource(show_spinner=False)
+def get_report_index():
+    """Process-wide BM25 index over the generated reports (None if they can't be read)"""
     try:
-        # Prioritize environment variable (loaded from .env locally, or set in deployment)
-        api_key = os.environ.get('OPENAI_API_KEY')
-        
-        # Fallback to st.secrets (for Streamlit Cloud)
-        if not api_key and "OPENAI_API_KEY" in st.secrets:
-            api_key = st.secrets["OPENAI_API_KEY"]
-        
-        # Fallback to session_state (if user manually entered, less ideal now)
-        if not api_key and st.session_state.get('openai_api_key'):
-            api_key = st.session_state.get('openai_api_key')
+        return ReportIndex()
+    except (OSError, ValueError):
+        return None
 
-        if not api_key:
-            return "⚠️ AI functionality requires an OpenAI API key. Please set it up in .env, Streamlit Cloud secrets, or enter it in the app."
-        
-        # Update session_state if a key was found from env or secrets, for consistency in UI
-        if api_key and not st.session_state.get('openai_api_key'):
-             st.session_state.openai_api_key = api_key
-
-        client = openai.OpenAI(api_key=api_key)
-
-        messages = [
-            {"role": "system", "content": chart_context},
-            {"role": "user", "content": user_question}
-        ]
-
-        chat_history = st.session_state.get('chat_history', [])
-        for chat_item in chat_history[-2:]: # Iterate over a copy if modifying
-            if isinstance(chat_item, dict) and 'question' in chat_item and 'response' in chat_item:
-                 messages.insert(-1, {"role": "user", "content": chat_item["question"]})
-                 messages.insert(-1, {"role": "assistant", "content": str(chat_item["response"])[:200] + "..."})
-            elif isinstance(chat_item, tuple) and len(chat_item) == 2:
-                 messages.insert(-1, {"role": "user", "content": str(chat_item[0])})
-                 messages.insert(-1, {"role": "assistant", "content": str(chat_item[1])[:200] + "..."})
-
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=messages,
-            max_tokens=600,
-            temperature=0.7,
-            presence_penalty=0.1,
-            frequency_penalty=0.1
-        )
-
-        return response.choices[0].message.content
-
-    except openai.APIError as e:
+def _retrieved_sections(user_question):
+    index = get_report_index()
+    if index is None:
+        return []
+    return [format_excerpt(chunk) for _, chunk in index.search(user_question)]
+
+def _build_messages(user_question, chart_context):
+    # The report excerpts most relevant to the question replace part of the static fact list
+    system_context = with_sections(chart_context, _retrieved_sections(user_question))
+    return build_messages(system_context, user_question, st.session_state.get('chat_history', []))
+
+# Near-duplicate matching costs one embeddings call per cache miss, so it is opt-in
+SEMANTIC_CACHE_ENABLED = os.environ.get('MSME_AI_SEMANTIC_CACHE', '').lower() in ('1', 'true', 'yes')
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache():
+    """Process-wide handle on the on-disk AI response cache (None if the disk is not writable)"""
+    try:
+        return ResponseCache()
+    except (OSError, sqlite3.Error):
+        return None
+
+def _embed_question(client, question):
+    try:
+        result = client.embeddings.create(model=EMBEDDING_MODEL, input=normalize_question(question))
+        return result.data[0].embedding
+    except Exception:
+        return None
+
+def _ai_error_message(e):
+    if isinstance(e, openai.APIError):
         st.error(f"OpenAI API Error: {e}")
         return f"❌ OpenAI API Error: {e}. Please check your API key and network."
+    st.error(f"Error in AI chat: {e}")
+    return f"❌ Error: {str(e)}. Please try again."
+
+# Errors that move a request to its tier's fallback model. The primary runs without transport
+# retries when it has a fallback, so these replace waiting on the same model again.
+FALLBACK_ERRORS = (openai.APITimeoutError, openai.RateLimitError, openai.InternalServerError, httpx.TimeoutException)
+
+def _tier_client(client, tier, fallback_ok):
+    settings = MODEL_TIERS[tier]
+    if fallback_ok and settings['fallback']:
+        return client.with_options(timeout=settings['timeout'], max_retries=0)
+    return client.with_options(timeout=settings['timeout'])
+
+def _create_completion(client, messages, tier, fallback_ok=True, **kwargs):
+    """chat.completions.create() on the tier's model, retried once on its fallback tier if it times out"""
+    try:
+        return _tier_client(client, tier, fallback_ok).chat.completions.create(
+            messages=messages, **completion_params(tier, CHAT_COMPLETION_PARAMS), **kwargs)
+    except FALLBACK_ERRORS:
+        fallback = MODEL_TIERS[tier]['fallback']
+        if not (fallback_ok and fallback):
+            raise
+        return _create_completion(client, messages, fallback, fallback_ok=False, **kwargs)
+
+def _stream_chat_completion(client, messages, tier, on_complete=None):
+    parts = []
+    fallback_ok = True
+    while True:
+        try:
+            stream = _tier_client(client, tier, fallback_ok).chat.completions.create(
+                messages=messages, stream=True, **completion_params(tier, CHAT_COMPLETION_PARAMS))
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield chunk.choices[0].delta.content
+            break
+        except FALLBACK_ERRORS as e:
+            # Stalled before the first token: the fallback tier can still answer in full
+            fallback = MODEL_TIERS[tier]['fallback']
+            if parts or not (fallback_ok and fallback):
+                yield _ai_error_message(e)
+                return
+            tier, fallback_ok = fallback, False
+        except Exception as e:
+            yield _ai_error_message(e)
+            return
+    # Only completed answers are handed on (e.g. to the response cache)
+    if on_complete is not None:
+        on_complete("".join(parts))
+
+def chat_with_ai_enhanced(user_question, chart_context, stream=False, slide=None, canned=False):
+    """Answer a question about the dashboard.
+
+    With stream=True a generator of text deltas is returned instead of the full answer,
+    so panels can render tokens as they arrive (e.g. with st.write_stream).
+    `slide` (a slide id) and `canned` (a quick-question button) feed the model routing.
+    """
+    try:
+        api_key = _resolve_api_key()
+        if not api_key:
+            message = "⚠️ AI functionality requires an OpenAI API key. Please set it up in .env, Streamlit Cloud secrets, or enter it in the app."
+            return iter([message]) if stream else message
+
+        client = get_openai_client(api_key)
+        messages = _build_messages(user_question, chart_context)
+        tier = classify_request(user_question, slide, canned)
+
+        # Repeated questions (quick-question buttons especially) are answered from the shared cache
+        cache = get_response_cache()
+        embedding = None
+        if cache is not None:
+            cache_key, cache_scope = response_cache_key(MODEL_TIERS[tier]["model"], chart_context, user_question, messages[1:-1])
+            cached = cache.get(cache_key)
+            if cached is None and SEMANTIC_CACHE_ENABLED:
+                embedding = _embed_question(client, user_question)
+                if embedding is not None:
+                    cached = cache.find_similar(cache_scope, embedding)
+            if cached is not None:
+                return iter([cached]) if stream else cached
+
+        def store_answer(answer):
+            if cache is not None and answer:
+                cache.put(cache_key, cache_scope, user_question, answer, embedding)
+
+        if stream:
+            return _stream_chat_completion(client, messages, tier, on_complete=store_answer)
+
+        response = _create_completion(client, messages, tier)
+        answer = response.choices[0].message.content
+        store_answer(answer)
+        return answer
+
     except Exception as e:
-        st.error(f"Error in AI chat: {e}")
-        return f"❌ Error: {str(e)}. Please try again."
+        message = _ai_error_message(e)
+        return iter([message]) if stream else message
+
+# --- Concurrent multi-question analysis ----------------------------------------------------
+# A briefing (e.g. every quick question for the current slide) fans out over AsyncOpenAI with a
+# bounded number of in-flight requests, so it costs roughly one round-trip of wall time.
+
+BATCH_CONCURRENCY = 4
+
+async def _answer_async(client, semaphore, index, question, messages, tier, timeout=None):
+    async with semaphore:
+        fallback_ok = True
+        while True:
+            settings = MODEL_TIERS[tier]
+            limit = timeout or settings['timeout']
+            tier_client = client.with_options(max_retries=0) if fallback_ok and settings['fallback'] else client
+            try:
+                response = await asyncio.wait_for(tier_client.chat.completions.create(
+                    messages=messages, **completion_params(tier, CHAT_COMPLETION_PARAMS)), limit)
+                return index, question, response.choices[0].message.content, True
+            except (asyncio.TimeoutError, *FALLBACK_ERRORS):
+                if fallback_ok and settings['fallback']:
+                    tier, fallback_ok = settings['fallback'], False  # one retry on the fallback tier
+                    continue
+                return index, question, f"⏱️ No answer within {limit:.0f}s. Please try again.", False
+            except openai.APIError as e:
+                return index, question, f"❌ OpenAI API Error: {e}. Please check your API key and network.", False
+            except Exception as e:
+                return index, question, f"❌ Error: {str(e)}. Please try again.", False
+
+async def analyze_questions_async(api_key, jobs, concurrency=BATCH_CONCURRENCY, timeout=None):
+    """Async generator over (index, question, answer, ok) for `jobs` = [(index, question, messages, tier)], in completion order"""
+    http_client = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(limits=HTTP_LIMITS, retries=HTTP_CONNECT_RETRIES),
+        timeout=HTTP_TIMEOUT,
+    )
+    async with openai.AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=OPENAI_MAX_RETRIES) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [asyncio.ensure_future(_answer_async(client, semaphore, index, question, messages, tier, timeout))
+                 for index, question, messages, tier in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+def iter_batch_answers(questions, chart_context, concurrency=BATCH_CONCURRENCY, timeout=None, slide=None,
+                       canned=False):
+    """Yield (question, answer) pairs as they complete.
+
+    `chart_context` is one system context shared by all questions, or a list with one per question
+    (e.g. one analysis per slide). Cached answers are yielded first; only misses go to the API.
+    Each question is routed like chat_with_ai_enhanced(); `timeout` overrides the tiers' own limits.
+    """
+    contexts = chart_context if isinstance(chart_context, (list, tuple)) else [chart_context] * len(questions)
+    try:
+        api_key = _resolve_api_key()
+    except Exception:
+        api_key = None
+    if not api_key:
+        for question in questions:
+            yield question, "⚠️ AI functionality requires an OpenAI API key. Please set it up in .env, Streamlit Cloud secrets, or enter it in the app."
+        return
+
+    cache = get_response_cache()
+    jobs, cache_entries = [], {}
+    for index, (question, context) in enumerate(zip(questions, contexts)):
+        messages = _build_messages(question, context)
+        tier = classify_request(question, slide, canned)
+        if cache is not None:
+            cache_entries[index] = response_cache_key(MODEL_TIERS[tier]["model"], context, question, messages[1:-1])
+            cached = cache.get(cache_entries[index][0])
+            if cached is not None:
+                yield question, cached
+                continue
+        jobs.append((index, question, messages, tier))
+    if not jobs:
+        return
+
+    # Streamlit runs the script in a worker thread with no event loop, so drive a private one
+    loop = asyncio.new_event_loop()
+    results = analyze_questions_async(api_key, jobs, concurrency, timeout)
+    try:
+        while True:
+            try:
+                index, question, answer, ok = loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+            if ok and cache is not None and answer:
+                cache.put(cache_entries[index][0], cache_entries[index][1], question, answer)
+            yield question, answer
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.close()
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import time
+import pandas as pd
+from pathlib import Path
+
+# Typed columnar (Feather/Arrow) copies of the CSV inputs, reused while the source hash matches.
+# Build ahead of deploy with:  python -m src.utils.columnar_cache
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+CACHE_DIR = BASE_DIR / 'data' / 'cache' / 'columnar'
+MANIFEST_PATH = CACHE_DIR / 'manifest.json'
+
+DATASETS = {
+    'wb_indicators': {
+        'source': 'data/raw/wb_combined_indicators.csv',
+        'categorical': ['indicator', 'country_code', 'country_name'],
+    },
+    'msme': {
+        'source': 'data/processed/msme_cleaned.csv',
+        'categorical': ['state', 'fiscal_year'],
+    },
+    'growth': {
+        'source': 'data/processed/growth_cleaned.csv',
+        'categorical': ['state', 'fiscal_year'],
+    },
+}
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_manifest():
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_PATH.with_suffix('.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def apply_column_types(df, categorical=()):
+    """Categorical labels, int16 years, float32 measures, int32 counts"""
+    df = df.copy()
+    for col in df.columns:
+        if col in categorical:
+            df[col] = df[col].astype('category')
+        elif col == 'year':
+            df[col] = pd.to_numeric(df[col]).astype('int16')
+        elif pd.api.types.is_float_dtype(df[col]):
+            df[col] = df[col].astype('float32')
+        elif pd.api.types.is_integer_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def _source_fingerprint(source_path, entry):
+    """Return the source sha256, skipping the rehash when size and mtime are unchanged"""
+    stat = source_path.stat()
+    if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        return entry['sha256'], stat
+    return _file_sha256(source_path), stat
+
+
+def build_dataset(name, manifest=None, df=None):
+    spec = DATASETS[name]
+    source_path = BASE_DIR / spec['source']
+    manifest = _read_manifest() if manifest is None else manifest
+
+    df = apply_column_types(pd.read_csv(source_path) if df is None else df, spec.get('categorical', ()))
+    sha256, stat = _source_fingerprint(source_path, None)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path = CACHE_DIR / f'{name}.feather'
+    tmp_path = cache_path.with_suffix('.feather.tmp')
+    df.reset_index(drop=True).to_feather(tmp_path)
+    os.replace(tmp_path, cache_path)
+
+    manifest[name] = {
+        'source': spec['source'],
+        'sha256': sha256,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'file': cache_path.name,
+        'rows': len(df),
+        'built_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    return df, manifest
+
+
+def store_dataset(name, df):
+    """Cache rows the caller already parsed from dataset `name`'s source CSV"""
+    df, manifest = build_dataset(name, df=df)
+    _write_manifest(manifest)
+    return df
+
+
+def build_columnar_cache(names=None):
+    manifest = _read_manifest()
+    for name in names or DATASETS:
+        if not (BASE_DIR / DATASETS[name]['source']).exists():
+            print(f"⚠️ Skipping {name}: {DATASETS[name]['source']} not found")
+            continue
+        _, manifest = build_dataset(name, manifest)
+        print(f"✅ Cached {name}: {manifest[name]['rows']} rows -> {manifest[name]['file']}")
+    _write_manifest(manifest)
+    return manifest
+
+
+def source_fingerprints(names=None):
+    """{name: sha256 of its source CSV} (None when missing), reusing the manifest hash while size and mtime match"""
+    manifest = _read_manifest()
+    fingerprints = {}
+    for name in names or DATASETS:
+        try:
+            fingerprints[name], _ = _source_fingerprint(BASE_DIR / DATASETS[name]['source'], manifest.get(name))
+        except OSError:
+            fingerprints[name] = None
+    return fingerprints
+
+
+def load_dataset(name):
+    """Load a registered dataset from the columnar cache, rebuilding it when the source changed"""
+    spec = DATASETS[name]
+    source_path = BASE_DIR / spec['source']
+    manifest = _read_manifest()
+    entry = manifest.get(name)
+    cache_path = CACHE_DIR / f'{name}.feather'
+
+    if entry and cache_path.exists():
+        sha256, stat = _source_fingerprint(source_path, entry)
+        if sha256 == entry['sha256']:
+            if stat.st_mtime_ns != entry.get('mtime_ns'):
+                entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                _write_manifest(manifest)
+            return pd.read_feather(cache_path)
+
+    try:
+        df, manifest = build_dataset(name, manifest)
+        _write_manifest(manifest)
+        return df
+    except OSError:
+        # Read-only deploy: fall back to parsing the CSV directly
+        return apply_column_types(pd.read_csv(source_path), spec.get('categorical', ()))
+
+
+if __name__ == '__main__':
+    build_columnar_cache()
@@ -0,0 +1,195 @@
+import math
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to a ~4 chars/token estimate
+    tiktoken = None
+
+# Token budgets for what we send alongside the user's question
+SYSTEM_TOKEN_BUDGET = 450
+HISTORY_TOKEN_BUDGET = 400
+HISTORY_MAX_TURNS = 6
+HISTORY_REPLY_MAX_TOKENS = 80
+
+ANALYST_ROLE = """You are an advanced AI analyst specializing in India's MSME (Micro, Small & Medium Enterprises) ecosystem.
+You have access to real-time data and can provide deep insights with specific recommendations."""
+
+ANALYST_INSTRUCTIONS = """Provide actionable insights with specific numbers, policy recommendations,
+and investment strategies. Be conversational but data-driven."""
+
+# (heading, facts) in priority order; when the budget is tight, facts are dropped from the end
+KEY_FACTS = [
+    ("Key Economic Indicators (EXACT World Bank Data - Unified Story Aligned):", [
+        "India's GDP growth: 8.15% (2023, WB: 8.1529363109041) - EXACT from wb_combined_indicators.csv",
+        "Labor force: 607.7M workers (2024, WB: 607,691,498) - EXACT World Bank Official Data",
+        "MSME GDP contribution: 30.7% (2024 est.), stable at 29-30% range - MSME Ministry",
+        "Total MSME count: 57M+ registered enterprises (Dec 2024) - Udyam Portal",
+        "Export share: 21.85% of GDP (2023, WB: 21.8482115022381) - EXACT from World Bank",
+    ]),
+    ("Priority Growth Sectors (CORRECTED - Conservative Estimates):", [
+        "Digital Commerce: 18.5% CAGR potential, $189B market - IBEF/McKinsey Reports",
+        "Financial Services: 16.2% CAGR, $156B market - Industry Analysis",
+        "Healthcare Tech: 14.8% CAGR, 4.5x employment multiplier - Sector Studies",
+        "Agriculture Tech: 12.5% CAGR, high rural impact - Government Reports",
+    ]),
+    ("Strategic Context (DATA SOURCES VERIFIED):", [
+        "Digital adoption: 89% (2024) vs 12% (2010) - Estimated based on trends",
+        "FDI inflows: $83.5B (2024), steady growth - RBI Data",
+        "Export target: 23.6% of GDP by 2030 (current: 21.8%) - Conservative WB-aligned projection",
+        "Regional leaders: Maharashtra (3.7M), Tamil Nadu (2.2M), UP (2.0M) MSMEs - Udyam Data",
+    ]),
+]
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-4")
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text):
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return math.ceil(len(text) / 4)
+
+
+def truncate_to_tokens(text, max_tokens):
+    text = str(text)
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoding = _encoding()
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text)[:max_tokens]).rstrip() + "..."
+    return text[:max_tokens * 4].rstrip() + "..."
+
+
+def _pack_lines(lines, budget):
+    """Greedily keep lines in order while they fit; returns (kept_lines, tokens_used)"""
+    kept, used = [], 0
+    for line in lines:
+        cost = count_tokens(line) + 1
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+    return kept, used
+
+
+@lru_cache(maxsize=16)
+def static_facts_block(budget):
+    """The fixed fact list packed into `budget` tokens. Cached because it never changes between calls"""
+    blocks, remaining = [], budget
+    for heading, facts in KEY_FACTS:
+        heading_cost = count_tokens(heading) + 1
+        if remaining <= heading_cost:
+            break
+        kept, used = _pack_lines([f"- {fact}" for fact in facts], remaining - heading_cost)
+        if not kept:
+            break
+        blocks.append("\n".join([heading] + kept))
+        remaining -= heading_cost + used
+    return "\n\n".join(blocks)
+
+
+def format_filters(filters):
+    year_range = filters.get('year_range', (2010, 2024))
+    sectors = filters.get('sectors')
+    return "\n".join([
+        "Applied Filters:",
+        f"- Year Range: {year_range[0]}-{year_range[1]}",
+        f"- Analysis Type: {filters.get('analysis_type', 'Complete Analysis')}",
+        f"- Time Horizon: {filters.get('time_horizon', 'Current (2024)')}",
+        f"- Selected Sectors: {', '.join(sectors) if sectors else 'All sectors'}",
+    ])
+
+
+def build_system_context(chart_type, data_summary, filters, budget=SYSTEM_TOKEN_BUDGET, extra_sections=()):
+    """Pack the system prompt into `budget` tokens by priority.
+
+    Role and instructions are always sent; the current slide's data summary and filters come next,
+    then any `extra_sections` (e.g. retrieved report excerpts), and the static fact list fills what remains.
+    """
+    required = [ANALYST_ROLE, ANALYST_INSTRUCTIONS]
+    remaining = budget - sum(count_tokens(part) for part in required)
+
+    slide_block = f"Current Analysis Context: {chart_type}\nData Summary: {data_summary}"
+    slide_block = truncate_to_tokens(slide_block, max(remaining // 2, 40))
+    remaining -= count_tokens(slide_block)
+
+    filter_block = format_filters(filters)
+    if count_tokens(filter_block) <= remaining:
+        remaining -= count_tokens(filter_block)
+    else:
+        filter_block = ""
+
+    head = [ANALYST_ROLE, slide_block, filter_block]
+    return _fill(head, remaining, extra_sections)
+
+
+def _fill(head, remaining, extra_sections):
+    """Append the extra sections that fit, then static facts in what remains, then the instructions"""
+    extras = []
+    for section in extra_sections:
+        cost = count_tokens(section)
+        if cost <= remaining:
+            extras.append(section)
+            remaining -= cost
+
+    facts_block = static_facts_block(max(remaining, 0)) if remaining > 0 else ""
+    parts = [*head, *extras, facts_block, ANALYST_INSTRUCTIONS]
+    return "\n\n".join(part for part in parts if part)
+
+
+def with_sections(system_context, sections, budget=SYSTEM_TOKEN_BUDGET):
+    """Fit question-specific sections (e.g. retrieved report excerpts) into a build_system_context() prompt.
+
+    They take the place of static facts, so the prompt stays within `budget`; other prompts are returned as-is.
+    """
+    if not sections or not system_context.endswith(ANALYST_INSTRUCTIONS):
+        return system_context
+    head = system_context[:-len(ANALYST_INSTRUCTIONS)].split("\n\n" + KEY_FACTS[0][0])[0].rstrip()
+    remaining = budget - count_tokens(head) - count_tokens(ANALYST_INSTRUCTIONS)
+    return _fill([head], remaining, sections)
+
+
+def _history_turns(chat_history):
+    """Normalize the three chat_history formats the panels write into (role, text) pairs"""
+    turns = []
+    for item in chat_history:
+        if isinstance(item, dict) and 'question' in item and 'response' in item:
+            turns.append(("user", str(item['question'])))
+            turns.append(("assistant", str(item['response'])))
+        elif isinstance(item, dict) and 'text' in item:
+            turns.append(("user" if item.get('role', 'user') == 'user' else "assistant", str(item['text'])))
+        elif isinstance(item, tuple) and len(item) == 2:
+            role, text = item
+            turns.append(("user" if role == 'user' else "assistant", str(text)))
+    return turns
+
+
+def pack_history(chat_history, budget=HISTORY_TOKEN_BUDGET, max_turns=HISTORY_MAX_TURNS):
+    """Most recent turns that fit in `budget`, oldest first, with long replies trimmed"""
+    packed, used = [], 0
+    for role, text in reversed(_history_turns(chat_history)[-max_turns:]):
+        if role == "assistant":
+            text = truncate_to_tokens(text, HISTORY_REPLY_MAX_TOKENS)
+        cost = count_tokens(text) + 4  # per-message overhead
+        if used + cost > budget:
+            break
+        packed.append({"role": role, "content": text})
+        used += cost
+    packed.reverse()
+    return packed
+
+
+def build_messages(system_context, user_question, chat_history=(), history_budget=HISTORY_TOKEN_BUDGET):
+    return ([{"role": "system", "content": system_context}]
+            + pack_history(chat_history, history_budget)
+            + [{"role": "user", "content": user_question}])
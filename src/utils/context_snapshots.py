@@ -0,0 +1,216 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from src.utils.context_builder import build_system_context
+from src.utils.figures import normalize_filters
+from src.utils.regional_data import clamp_year_range
+
+# Data-derived summaries for the AI analyst, one compact block per slide and filter bucket
+# (the year range clamped to the slide's data, or the sector selection). Blocks are computed once
+# per dataset version -- the economic and regional year ranges and the all-sector view up front --
+# so asking a question looks its context up instead of re-slicing the frames and re-formatting it.
+
+# (column, label, kind) in prompt priority order: 'rate' series report deltas in points, 'level' series growth and CAGR
+ECONOMIC_METRICS = [
+    ('GDP_Growth', 'GDP growth %', 'rate'),
+    ('Labor_Force_Million', 'Labor force (M)', 'level'),
+    ('Exports_Percent_GDP', 'Exports % of GDP', 'rate'),
+    ('Unemployment_Rate', 'Unemployment %', 'rate'),
+    ('FDI_Inflow_Billion', 'FDI inflow ($B)', 'level'),
+    ('Digital_Adoption', 'Digital adoption %', 'rate'),
+]
+EXPORT_METRICS = [
+    ('Export_Percent_GDP', 'Exports % of GDP'),
+    ('MSME_Export_Share', 'MSME export share %'),
+    ('Digital_Export_Growth', 'Digital export growth %'),
+    ('Traditional_Export_Growth', 'Traditional export growth %'),
+    ('Services_Export_Share', 'Services export share %'),
+]
+TOP_SECTORS = 3
+TOP_STATES = 5
+MAX_CONTEXTS = 256  # assembled system prompts kept per snapshot, least recently used dropped first
+
+# Slideshow position -> slide id (the ids the figure cache uses)
+SLIDE_IDS = ['economic_foundation', 'msme_opportunities', 'export_pathway', 'regional_analysis']
+SLIDE_TITLES = {
+    'economic_foundation': 'Economic Foundation Analysis',
+    'msme_opportunities': 'MSME Opportunities Analysis',
+    'export_pathway': 'Export Pathway Analysis',
+    'regional_analysis': 'Regional Analysis',
+}
+
+
+def _cagr(first, last, years):
+    if years <= 0 or first <= 0 or last <= 0:
+        return None
+    return ((last / first) ** (1 / years) - 1) * 100
+
+
+def _metric_line(label, kind, years, values):
+    observed = ~np.isnan(values)
+    if not observed.any():
+        return None
+    years, values = years[observed], values[observed]
+    low, high = int(np.argmin(values)), int(np.argmax(values))
+    line = f"- {label}: {values[-1]:,.1f} in {years[-1]}"
+    if len(values) > 1:
+        if kind == 'rate':
+            line += f" ({values[-1] - values[0]:+.1f} pts vs {years[0]}, avg {values.mean():.1f})"
+        else:
+            change = f"{(values[-1] / values[0] - 1) * 100:+.1f}% vs {years[0]}" if values[0] else f"from {values[0]:,.1f}"
+            cagr = _cagr(values[0], values[-1], int(years[-1] - years[0]))
+            line += f" ({change}" + (f", CAGR {cagr:.1f}%)" if cagr is not None else ")")
+        line += f"; low {values[low]:,.1f} ({years[low]}), high {values[high]:,.1f} ({years[high]})"
+    return line
+
+
+def economic_summary(economic, start, end):
+    window = economic[(economic['Year'] >= start) & (economic['Year'] <= end)]
+    if window.empty:
+        return "Economic data for the selected range is currently unavailable."
+    years = window['Year'].to_numpy()
+    lines = [f"India economic indicators {start}-{end} (World Bank where available):"]
+    for column, label, kind in ECONOMIC_METRICS:
+        if column in window.columns:
+            lines.append(_metric_line(label, kind, years, window[column].to_numpy(dtype='float64')))
+    return "\n".join(line for line in lines if line)
+
+
+def sector_summary(sectors, selected=()):
+    view = sectors[sectors['Sector'].isin(selected)] if selected else sectors
+    if view.empty:
+        return "No sectors selected or data available for the current filter."
+    by_growth = view.sort_values('Growth_Potential', ascending=False).head(TOP_SECTORS)
+    lines = [f"MSME sectors ({'selected: ' + str(len(view)) if selected else f'all {len(view)}'}), "
+             f"total market ${view['Market_Size_Billion'].sum():,.0f}B, "
+             f"investment required ${view['Investment_Required'].sum():,.0f}B:",
+             "- Top growth: " + ", ".join(f"{row.Sector} {row.Growth_Potential:.1f}% CAGR, ${row.Market_Size_Billion:,.0f}B"
+                                          for row in by_growth.itertuples())]
+    for column, label, ascending in [('Market_Size_Billion', 'Largest market', False),
+                                     ('Employment_Multiplier', 'Highest employment multiplier', False),
+                                     ('Digital_Readiness', 'Most digitally ready', False),
+                                     ('Export_Potential', 'Highest export potential', False),
+                                     ('Risk_Factor', 'Lowest risk', True)]:
+        row = view.sort_values(column, ascending=ascending).iloc[0]
+        lines.append(f"- {label}: {row['Sector']} ({row[column]:,.1f})")
+    return "\n".join(lines)
+
+
+def export_summary(export_projection):
+    if export_projection.empty:
+        return "Export projection data is currently unavailable."
+    first, last = export_projection.iloc[0], export_projection.iloc[-1]
+    start, end = int(first['Year']), int(last['Year'])
+    lines = [f"Export pathway projection {start}-{end}:"]
+    for column, label in EXPORT_METRICS:
+        if column in export_projection.columns:
+            lines.append(f"- {label}: {first[column]:.1f} ({start}) -> {last[column]:.1f} ({end}), "
+                         f"{last[column] - first[column]:+.1f} pts")
+    return "\n".join(lines)
+
+
+def regional_summary(rollup, start, end):
+    if rollup.empty:
+        return "Regional MSME panel data is currently unavailable."
+    total = rollup['new_registrations'].sum()
+    top = rollup.head(TOP_STATES)
+    lines = [f"Regional MSME registrations, fiscal years ending {start}-{end}: "
+             f"{total:,.0f} new across {len(rollup)} states, {rollup['total_jobs_created'].sum():,.0f} jobs",
+             "- Top states: " + ", ".join(f"{row.state} {row.new_registrations:,.0f} ({row.new_registrations / total:.0%})"
+                                          for row in top.itertuples())]
+    for column, label, fmt in [('registration_growth_pct', 'Fastest registration growth', '{:+.1f}% YoY avg'),
+                               ('jobs_per_registration', 'Most jobs per registration', '{:.1f}'),
+                               ('credit_per_job_lakh', 'Most credit per job', '₹{:.1f} lakh')]:
+        ranked = rollup.dropna(subset=[column]).sort_values(column, ascending=False)
+        if not ranked.empty:
+            lines.append(f"- {label}: {ranked.iloc[0]['state']} ({fmt.format(ranked.iloc[0][column])})")
+    return "\n".join(lines)
+
+
+class ContextSnapshots:
+    """Precomputed per-slide summary blocks for one dataset version.
+
+    `regional` is the RegionalPanel, or the DuckDB backend when it serves the regional slide.
+    """
+
+    def __init__(self, economic, sectors, export_projection, regional=None):
+        self.economic = economic
+        self.sectors = sectors
+        self.export_projection = export_projection
+        self.regional = regional
+        self.year_span = (int(economic['Year'].min()), int(economic['Year'].max()))
+        self._blocks = {}
+        self._lock = threading.Lock()
+        self._contexts = OrderedDict()
+
+    def bucket(self, slide_id, filters):
+        """The filter bucket a slide's summary depends on"""
+        if slide_id == 'economic_foundation':
+            return clamp_year_range(*self.year_span, filters.get('year_range'))
+        if slide_id == 'regional_analysis':
+            return self.regional.clamp_years(filters.get('year_range')) if self.regional is not None else None
+        if slide_id == 'msme_opportunities':
+            return tuple(sorted(filters.get('sectors') or ()))
+        return None
+
+    def _build(self, slide_id, bucket):
+        if slide_id == 'economic_foundation':
+            return economic_summary(self.economic, *bucket)
+        if slide_id == 'msme_opportunities':
+            return sector_summary(self.sectors, bucket)
+        if slide_id == 'export_pathway':
+            return export_summary(self.export_projection)
+        if slide_id == 'regional_analysis':
+            if self.regional is None:
+                return "Regional MSME panel data is currently unavailable."
+            if hasattr(self.regional, 'state_rankings'):
+                rollup = self.regional.state_rankings(bucket)
+            else:
+                rollup = self.regional.query(bucket)
+            return regional_summary(rollup, *bucket)
+        raise KeyError(slide_id)
+
+    def summary(self, slide_id, filters):
+        key = (slide_id, self.bucket(slide_id, filters))
+        with self._lock:
+            block = self._blocks.get(key)
+        if block is None:
+            block = self._build(*key)
+            with self._lock:
+                self._blocks[key] = block
+        return block
+
+    def precompute(self):
+        """Fill every year-range bucket of the economic and regional slides, plus the unfiltered ones"""
+        first, last = self.year_span
+        ranges = [(start, end) for start in range(first, last + 1) for end in range(start, last + 1)]
+        for year_range in ranges:
+            self.summary('economic_foundation', {'year_range': year_range})
+        if self.regional is not None:
+            for year_range in sorted({self.regional.clamp_years(year_range) for year_range in ranges}):
+                self.summary('regional_analysis', {'year_range': year_range})
+        self.summary('msme_opportunities', {})
+        self.summary('export_pathway', {})
+        return len(self._blocks)
+
+    def system_context(self, slide_id, filters, chart_type=None):
+        """The analyst system prompt for a slide under `filters`, assembled once per distinct filter set"""
+        chart_type = chart_type or SLIDE_TITLES.get(slide_id, slide_id)
+        # Every filter is shown in the prompt, so all of them (not just the slide's bucket) go into the key
+        key = (slide_id, chart_type, normalize_filters(filters))
+        with self._lock:
+            context = self._contexts.get(key)
+            if context is not None:
+                self._contexts.move_to_end(key)
+                return context
+        context = build_system_context(chart_type, self.summary(slide_id, filters), filters)
+        with self._lock:
+            self._contexts[key] = context
+            while len(self._contexts) > MAX_CONTEXTS:
+                self._contexts.popitem(last=False)
+        return context
+
+
+def slide_id_for(index):
+    return SLIDE_IDS[index] if 0 <= index < len(SLIDE_IDS) else SLIDE_IDS[0]
+
@@ -1,44 +1,70 @@
+import hashlib
+import inspect
+from functools import lru_cache
 import pandas as pd
+import numpy as np
 import os
-import streamlit as st # For st.cache_data
+import streamlit as st # For st.cache_resource
 from pathlib import Path
+from src.utils.indicator_store import IndicatorStore
+from src.utils.columnar_cache import apply_column_types, load_dataset, source_fingerprints
+from src.utils.regional_data import RegionalPanel, merge_panel
+from src.utils.query_engine import QueryEngine
+from src.utils.context_snapshots import ContextSnapshots
+from src.utils.shared_frames import freeze
+from src.utils import duckdb_backend, shared_store
 
 # It's good practice to ensure data files are found relative to the script or a known path
 # For now, assume 'data/raw/wb_combined_indicators.csv' is accessible from where the main app runs.
 
-@st.cache_data
-def load_enhanced_msme_data():
+# Dashboard column -> (World Bank indicator code, divisor applied to the raw value)
+WB_SERIES = {
+    'GDP_Growth': ('NY.GDP.MKTP.KD.ZG', 1),
+    'Labor_Force_Million': ('SL.TLF.TOTL.IN', 1000000),
+    'Unemployment_Rate': ('SL.UEM.TOTL.ZS', 1),
+    'Exports_Percent_GDP': ('NE.EXP.GNFS.ZS', 1),
+}
+
+# 'duckdb' serves slide aggregates from the embedded analytics file (src/utils/duckdb_backend.py)
+# instead of holding the source tables in pandas; falls back to 'pandas' when duckdb is missing.
+ANALYTICS_BACKEND = os.environ.get('MSME_ANALYTICS_BACKEND', 'pandas').lower()
+
+def build_base_datasets():
+    """(frames, problems): the economic, sector, export-projection and regional panel frames built from
+    the sources, and a message for every source that could not be loaded (the dashboard shows them once)"""
     # Try to load the actual data file
+    store = None
+    problems = []
     try:
         # Locate data file relative to this module's location (project root)
         base_dir = Path(__file__).resolve().parents[2]
         wb_data_path = base_dir / 'data' / 'raw' / 'wb_combined_indicators.csv'
-        wb_data = pd.read_csv(wb_data_path)
-
-        gdp_growth_2023 = wb_data[(wb_data['indicator'] == 'NY.GDP.MKTP.KD.ZG') & (wb_data['year'] == 2023)]['value'].iloc[0]
-        labor_force_2024 = wb_data[(wb_data['indicator'] == 'SL.TLF.TOTL.IN') & (wb_data['year'] == 2024)]['value'].iloc[0] / 1000000
-        exports_2023 = wb_data[(wb_data['indicator'] == 'NE.EXP.GNFS.ZS') & (wb_data['year'] == 2023)]['value'].iloc[0]
-        unemployment_2024 = wb_data[(wb_data['indicator'] == 'SL.UEM.TOTL.ZS') & (wb_data['year'] == 2024)]['value'].iloc[0]
-
+        # Served from the typed columnar cache when the CSV hash is unchanged
+        store = IndicatorStore(load_dataset('wb_indicators'))
     except Exception as e:
-        st.error(f"Error loading World Bank data from {wb_data_path}: {e}. Using fallback values.")
-        gdp_growth_2023 = 8.15 # Fallback
-        labor_force_2024 = 607.7 # Fallback
-        exports_2023 = 21.85 # Fallback
-        unemployment_2024 = 4.2 # Fallback
+        problems.append(f"Error loading World Bank data from {wb_data_path}: {e}. Using fallback values. "
+                        "Build the extract from World Bank bulk downloads with `python -m src.utils.wb_ingest`.")
 
     years = list(range(2010, 2025))
     economic_data = pd.DataFrame({
         'Year': years,
-        'GDP_Growth': [8.5, 5.24, 5.46, 6.39, 7.41, 8.0, 8.26, 6.79, 6.45, 3.87, -5.78, 9.69, 6.99, gdp_growth_2023 if 'gdp_growth_2023' in locals() else 7.2, 7.2], # Use loaded or fallback
-        'Labor_Force_Million': [467.6, 471.9, 476.1, 484.5, 492.8, 500.8, 508.8, 516.8, 524.3, 531.4, 532.5, 550.4, 568.9, 589.0, labor_force_2024 if 'labor_force_2024' in locals() else 607.7],
-        'Unemployment_Rate': [7.65, 7.62, 7.67, 7.71, 7.67, 7.63, 7.60, 7.62, 7.65, 6.51, 7.86, 6.38, 4.82, 4.17, unemployment_2024 if 'unemployment_2024' in locals() else 4.20],
-        'Exports_Percent_GDP': [22.4, 24.54, 24.53, 25.43, 22.97, 19.81, 19.16, 18.79, 19.93, 18.66, 18.68, 21.40, 23.20, exports_2023 if 'exports_2023' in locals() else 21.85, 22.0],
+        'GDP_Growth': [8.5, 5.24, 5.46, 6.39, 7.41, 8.0, 8.26, 6.79, 6.45, 3.87, -5.78, 9.69, 6.99, 8.15, 7.2],
+        'Labor_Force_Million': [467.6, 471.9, 476.1, 484.5, 492.8, 500.8, 508.8, 516.8, 524.3, 531.4, 532.5, 550.4, 568.9, 589.0, 607.7],
+        'Unemployment_Rate': [7.65, 7.62, 7.67, 7.71, 7.67, 7.63, 7.60, 7.62, 7.65, 6.51, 7.86, 6.38, 4.82, 4.17, 4.20],
+        'Exports_Percent_GDP': [22.4, 24.54, 24.53, 25.43, 22.97, 19.81, 19.16, 18.79, 19.93, 18.66, 18.68, 21.40, 23.20, 21.85, 22.0],
         'FDI_Inflow_Billion': [27.4, 34.8, 28.2, 36.0, 55.5, 60.2, 43.5, 62.0, 50.6, 67.5, 82.0, 81.7, 71.4, 70.9, 83.5],
         'Digital_Adoption': [12, 15, 18, 22, 27, 33, 39, 45, 52, 58, 78, 82, 85, 87, 89],
         'MSME_Contribution_GDP': [29.7, 29.8, 29.9, 30.0, 30.1, 30.2, 30.3, 30.4, 30.5, 29.2, 29.5, 29.8, 30.1, 30.4, 30.7]
     })
 
+    # Overlay World Bank values wherever the extract has them; hardcoded values remain as fallback
+    if store is not None:
+        for column, (indicator, divisor) in WB_SERIES.items():
+            values = store.series(indicator, years) / divisor
+            economic_data[column] = np.where(np.isnan(values), economic_data[column], values)
+
+    exports_2023 = economic_data.loc[economic_data['Year'] == 2023, 'Exports_Percent_GDP'].iloc[0]
+
     msme_sectors = pd.DataFrame({
         'Sector': ['Digital Commerce', 'Financial Services', 'Healthcare Tech', 'Agriculture Tech',
                   'Manufacturing', 'Education Tech', 'Renewable Energy', 'Food Processing'],
@@ -51,22 +77,136 @@ def load_enhanced_msme_data():
         'Export_Potential': [85, 72, 68, 78, 89, 65, 45, 82]
     })
 
-    regional_data = pd.DataFrame({
-        'State': ['Maharashtra', 'Gujarat', 'Tamil Nadu', 'Karnataka', 'Uttar Pradesh',
-                 'Rajasthan', 'West Bengal', 'Andhra Pradesh', 'Telangana', 'Kerala'],
-        'MSME_Count': [3712000, 1553000, 2174000, 1286000, 2028000, 1557000, 1234000, 967000, 845000, 734000],
-        'GDP_Contribution': [14.2, 11.8, 10.4, 9.6, 8.2, 6.1, 5.8, 4.9, 4.3, 3.8],
-        'Export_Share': [18.5, 16.2, 14.8, 12.3, 8.9, 7.2, 6.8, 5.4, 4.9, 4.2],
-        'Digital_Score': [87, 82, 89, 91, 68, 72, 75, 78, 85, 83]
-    })
-
     export_projection = pd.DataFrame({
         'Year': [2024, 2025, 2026, 2027, 2028, 2029, 2030],
-        'Export_Percent_GDP': [exports_2023 if 'exports_2023' in locals() else 21.85, 22.1, 22.4, 22.7, 23.0, 23.3, 23.6],
+        'Export_Percent_GDP': [exports_2023, 22.1, 22.4, 22.7, 23.0, 23.3, 23.6],
         'MSME_Export_Share': [45.6, 46.5, 47.4, 48.3, 49.2, 50.1, 51.0],
         'Digital_Export_Growth': [15.2, 17.1, 19.2, 21.5, 24.0, 26.7, 29.6],
         'Traditional_Export_Growth': [8.5, 9.2, 9.8, 10.5, 11.1, 11.7, 12.3],
         'Services_Export_Share': [23.4, 24.1, 24.9, 25.8, 26.8, 27.9, 29.1]
     })
 
-    return economic_data, msme_sectors, export_projection, regional_data
+    frames = {'economic': economic_data, 'msme_sectors': msme_sectors, 'export_projection': export_projection}
+    try:
+        frames['regional_panel'] = merge_panel(load_dataset('msme'), load_dataset('growth'))
+    except (OSError, KeyError, ValueError) as e:
+        problems.append(f"Error loading the regional MSME panel: {e}")
+    return frames, problems
+
+
+# Source CSVs behind build_base_datasets(); their hashes version the published datasets
+BASE_SOURCES = ('wb_indicators', 'msme', 'growth')
+
+
+@lru_cache(maxsize=1)
+def _builder_fingerprint():
+    """Hash of the code that turns the sources into the base datasets, so editing it republishes too"""
+    code = [inspect.getsource(obj) for obj in (build_base_datasets, merge_panel, IndicatorStore, apply_column_types)]
+    return hashlib.sha256('\n'.join(code).encode()).hexdigest()
+
+
+def base_version():
+    """Version the base datasets should be at: the source CSV hashes plus the builder code.
+
+    Cheap enough for every rerun (a stat per source; files are only rehashed when they changed),
+    so a refreshed CSV or a code change reaches the next rerun of every worker.
+    """
+    digest = hashlib.sha256(_builder_fingerprint().encode())
+    for name, sha256 in sorted(source_fingerprints(BASE_SOURCES).items()):
+        digest.update(f"{name}:{sha256}".encode())
+    return digest.hexdigest()[:16]
+
+
+@st.cache_resource(max_entries=1)
+def load_base_datasets(version=None):
+    """(datasets, problems): base datasets attached from the host-wide shared store, building and
+    publishing `version` if it isn't current, plus the load problems recorded when it was built.
+
+    st.cache_data would pickle and copy these into every session; here every session of every
+    worker reads the same memory-mapped, read-only frames. max_entries=1 unmaps a replaced version.
+    Nothing here writes to the page: a cached st.error would be replayed on every call.
+    """
+    version = version or base_version()
+    pointer = shared_store.current()
+    if pointer is None or pointer['version'] != version:
+        frames, problems = build_base_datasets()
+        try:
+            pointer = shared_store.publish(version, frames, problems)
+        except OSError as e:
+            # Read-only deploy: this worker keeps its own frozen copy
+            problems = problems + [f"Could not publish shared datasets ({e}); using a per-process copy."]
+            return {name: freeze(frame, copy=False) for name, frame in frames.items()}, problems
+    return shared_store.attach(pointer), pointer.get('problems', [])
+
+
+def load_enhanced_msme_data(version=None):
+    datasets, _ = load_base_datasets(version)
+    return datasets['economic'], datasets['msme_sectors'], datasets['export_projection']
+
+
+def base_dataset_problems(version=None):
+    """Messages about sources the base datasets fell back from, for the page to show once"""
+    return load_base_datasets(version)[1]
+
+
+@st.cache_resource(max_entries=1)
+def load_regional_panel(version=None):
+    """State x fiscal-year MSME panel with precomputed rollups, built once per worker and dataset version"""
+    panel = load_base_datasets(version)[0].get('regional_panel')
+    return RegionalPanel(panel) if panel is not None else None
+
+
+@st.cache_resource(max_entries=1)
+def load_analytics_backend(frames_version, _economic_data, _msme_sectors, _export_projection):
+    """The DuckDB backend with this version of the dashboard tables, or None to stay on pandas.
+
+    A new frames_version publishes a new analytics file; max_entries=1 drops the backend (and its
+    read-only connection) attached to the replaced one.
+    """
+    if not duckdb_backend.available():
+        st.warning("MSME_ANALYTICS_BACKEND=duckdb but duckdb is not installed; using the pandas backend.")
+        return None
+    frames = {'economic': _economic_data, 'msme_sectors': _msme_sectors, 'export_projection': _export_projection}
+    backend = duckdb_backend.DuckDBBackend()
+    try:
+        backend.sync(frames, frames_version)
+    except (OSError, duckdb_backend.duckdb.Error) as e:
+        st.warning(f"DuckDB analytics file unavailable ({e}); using the pandas backend.")
+        return None
+    if backend.year_span is None:
+        return None  # no MSME panel in the file: the regional slide needs the pandas path
+    return backend
+
+
+@st.cache_resource
+def load_query_engine(data_version, _economic_data, _msme_sectors, _regional_panel=None, with_indicators=True):
+    """One shared QueryEngine per dataset version (the underscored frames are not hashed by Streamlit)"""
+    engine = QueryEngine()
+    engine.register('economic', _economic_data, year='Year')
+    engine.register('sectors', _msme_sectors, categories={'sector': 'Sector'})
+    if _regional_panel is not None:
+        engine.register('regional', _regional_panel.state_year.reset_index(), year='year', categories={'state': 'state'})
+    if not with_indicators:
+        return engine  # the World Bank extract is queried from DuckDB instead
+    try:
+        engine.register('indicators', load_dataset('wb_indicators'), year='year', categories={'indicator': 'indicator'})
+    except (OSError, KeyError, ValueError):
+        pass  # World Bank extract missing: the dashboard runs on its fallback values
+    return engine
+
+
+@st.cache_resource(max_entries=1)
+def load_context_snapshots(data_version, _economic_data, _msme_sectors, _export_projection, _regional=None):
+    """AI context blocks for every slide and year-range bucket, computed once per dataset version"""
+    snapshots = ContextSnapshots(_economic_data, _msme_sectors, _export_projection, _regional)
+    snapshots.precompute()
+    return snapshots
+
+
+def compute_data_version(*frames, salt=''):
+    """Short content hash of the dashboard datasets, used to key derived caches (figures, AI context)"""
+    digest = hashlib.sha256(salt.encode())
+    for frame in frames:
+        digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+        digest.update(','.join(map(str, frame.columns)).encode())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,260 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from src.utils.columnar_cache import BASE_DIR, DATASETS, source_fingerprints
+from src.utils.indicator_store import DEFAULT_COUNTRY
+from src.utils.regional_data import clamp_year_range
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# Optional analytics backend (MSME_ANALYTICS_BACKEND=duckdb). The World Bank extract, the state MSME
+# panel and the dashboard's own tables live in one embedded DuckDB file; each slide runs a
+# parameterized aggregate and gets back only the rows its chart draws. Workers attach the file
+# read-only, so table data stays on disk / in the OS page cache instead of in every process's heap.
+# Like shared_store, every version is its own file under data/cache/analytics/ and a CURRENT pointer
+# is swapped to publish it: a refresh never reopens a file some worker still has attached (DuckDB
+# refuses a writer on a file open read-only, in this process or another), and old readers keep
+# their file until they are dropped. Build the source tables ahead of deploy with:
+#   python -m src.utils.duckdb_backend
+
+DB_DIR = BASE_DIR / 'data' / 'cache' / 'analytics'
+MEMORY_LIMIT = '256MB'
+LOCK_RETRIES = 5
+KEEP_VERSIONS = 2  # the current file plus the one workers may still have attached
+
+# Columnar-cache dataset -> DuckDB table loaded straight from its source CSV
+SOURCE_TABLES = {
+    'wb_indicators': 'wb_indicators',
+    'msme': 'msme_panel',
+    'growth': 'msme_growth',
+}
+
+ECONOMIC_COLUMNS = ['Year', 'GDP_Growth', 'Labor_Force_Million', 'Exports_Percent_GDP', 'Digital_Adoption']
+SECTOR_COLUMNS = ['Sector', 'Growth_Potential', 'Market_Size_Billion', 'Employment_Multiplier',
+                  'Digital_Readiness', 'Export_Potential', 'Risk_Factor']
+EXPORT_COLUMNS = ['Year', 'Export_Percent_GDP', 'MSME_Export_Share']
+
+STATE_RANKINGS_SQL = """
+WITH in_range AS (
+    SELECT m.state, m.year, m.new_registrations, m.total_jobs_created, m.credit_outstanding_crores,
+           g.registration_growth_pct, g.job_growth_pct, g.credit_growth_pct
+    FROM msme_panel m LEFT JOIN msme_growth g USING (state, year)
+    WHERE m.year BETWEEN $start AND $end
+),
+states AS (
+    SELECT state, first(is_industrial_state) AS is_industrial_state FROM msme_panel GROUP BY state
+),
+rollup AS (
+    SELECT s.state,
+           COALESCE(SUM(r.new_registrations), 0)::BIGINT AS new_registrations,
+           COALESCE(SUM(r.total_jobs_created), 0)::BIGINT AS total_jobs_created,
+           MAX(r.credit_outstanding_crores) FILTER (WHERE r.year = $end) AS credit_outstanding_crores,
+           s.is_industrial_state,
+           AVG(r.registration_growth_pct) AS registration_growth_pct,
+           AVG(r.job_growth_pct) AS job_growth_pct,
+           AVG(r.credit_growth_pct) AS credit_growth_pct
+    FROM states s LEFT JOIN in_range r USING (state)
+    WHERE $states IS NULL OR list_contains($states, s.state)
+    GROUP BY s.state, s.is_industrial_state
+)
+SELECT *,
+       total_jobs_created / NULLIF(new_registrations, 0) AS jobs_per_registration,
+       credit_outstanding_crores * 100 / NULLIF(total_jobs_created, 0) AS credit_per_job_lakh
+FROM rollup
+ORDER BY new_registrations DESC, state
+LIMIT $limit
+"""
+
+
+def available():
+    return duckdb is not None
+
+
+def _connect(path, read_only):
+    """Open the file, waiting briefly while another process holds the write lock"""
+    for attempt in range(LOCK_RETRIES):
+        try:
+            return duckdb.connect(str(path), read_only=read_only, config={'memory_limit': MEMORY_LIMIT})
+        except duckdb.IOException:
+            if attempt == LOCK_RETRIES - 1:
+                raise
+            time.sleep(0.2 * (attempt + 1))
+
+
+def _version(sources, frames_version):
+    digest = hashlib.sha256(json.dumps([sorted(sources.items()), frames_version]).encode())
+    return digest.hexdigest()[:16]
+
+
+class DuckDBBackend:
+    """Per-slide aggregate queries against the shared analytics file"""
+
+    def __init__(self, directory=DB_DIR):
+        self.directory = directory
+        self.pointer_path = directory / 'CURRENT'
+        self.path = None
+        self._con = None
+        self._lock = threading.Lock()
+        self.sources_version = ''
+        self.year_span = None
+        self.multi_country = False
+
+    def current(self):
+        """The published pointer {'file', 'sources': {table: sha256}, 'frames_version'}, or None"""
+        try:
+            with open(self.pointer_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def sync(self, frames=None, frames_version=None):
+        """Attach the file holding the current source CSVs (and `frames` at frames_version), building it if needed.
+
+        A file is never written once published, so workers starting together only open files
+        read-only. Returns the tables written (none when an existing file was reused).
+        """
+        sources = {SOURCE_TABLES[name]: sha256 for name, sha256 in source_fingerprints(SOURCE_TABLES).items()
+                   if sha256 is not None}
+        pointer = self.current()
+        if (pointer and pointer['sources'] == sources and (frames is None or pointer['frames_version'] == frames_version)
+                and (self.directory / pointer['file']).exists()):
+            self.attach(self.directory / pointer['file'])
+            return []
+
+        frames_version = frames_version if frames else None
+        path = self.directory / f'analytics-{_version(sources, frames_version)}.duckdb'
+        written = []
+        if not path.exists():  # another worker may have built this version already
+            written = self._build(path, sources, frames or {}, frames_version)
+        pointer = {'file': path.name, 'sources': sources, 'frames_version': frames_version,
+                   'published_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+        tmp_path = self.pointer_path.with_name(f'CURRENT.{os.getpid()}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(pointer, f, indent=2)
+        os.replace(tmp_path, self.pointer_path)
+        self._prune(keep=path)
+        self.attach(path)
+        return written
+
+    def _build(self, path, sources, frames, frames_version):
+        """Write every table into a private temp file, then move it into place complete"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        tmp_path.unlink(missing_ok=True)
+        con = _connect(tmp_path, read_only=False)
+        try:
+            con.execute("CREATE TABLE _meta (name VARCHAR PRIMARY KEY, version VARCHAR)")
+            for dataset, table in SOURCE_TABLES.items():
+                if table in sources:
+                    source_path = BASE_DIR / DATASETS[dataset]['source']
+                    con.execute(f"CREATE TABLE {table} AS SELECT * FROM read_csv_auto(?)", [str(source_path)])
+                    con.execute("INSERT INTO _meta VALUES (?, ?)", [table, sources[table]])
+            for table, frame in frames.items():
+                # _row keeps the frame's order for queries that don't sort on a column
+                con.register('_frame', frame.reset_index(drop=True).rename_axis('_row').reset_index())
+                con.execute(f"CREATE TABLE {table} AS SELECT * FROM _frame")
+                con.unregister('_frame')
+                con.execute("INSERT INTO _meta VALUES (?, ?)", [table, frames_version])
+            con.execute("CHECKPOINT")
+        finally:
+            con.close()
+        os.replace(tmp_path, path)
+        return [table for table in SOURCE_TABLES.values() if table in sources] + list(frames)
+
+    def _prune(self, keep):
+        files = sorted(self.directory.glob('analytics-*.duckdb'), key=lambda path: path.stat().st_mtime)
+        for path in files[:-KEEP_VERSIONS]:
+            if path != keep:
+                # Workers that still have it attached keep reading it (POSIX); elsewhere the delete just fails
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def attach(self, path):
+        """Open the shared read-only connection and read the version/year span the queries depend on"""
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+            self._con = _connect(path, read_only=True)
+            self.path = path
+        tables = self._tables()
+        versions = self._query("SELECT name, version FROM _meta ORDER BY name").itertuples(index=False)
+        sources = [f"{name}={version}" for name, version in versions if name in SOURCE_TABLES.values()]
+        self.sources_version = hashlib.sha256('|'.join(sources).encode()).hexdigest()[:16]
+        self.multi_country = not self._query("SELECT 1 FROM information_schema.columns WHERE "
+                                             "table_name = 'wb_indicators' AND column_name = 'country_code'").empty
+        if 'msme_panel' in tables:
+            first, last = self._query("SELECT MIN(year), MAX(year) FROM msme_panel").iloc[0]
+            self.year_span = (int(first), int(last))
+        return self
+
+    def close(self):
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
+    def _query(self, sql, params=None):
+        # One cursor per call: a DuckDB connection is not safe to share between session threads
+        with self._lock:
+            cursor = self._con.cursor()
+        try:
+            return cursor.execute(sql, params or []).df()
+        finally:
+            cursor.close()
+
+    def _tables(self):
+        return set(self._query("SELECT table_name FROM information_schema.tables")['table_name'])
+
+    def economic_series(self, year_range=None, columns=ECONOMIC_COLUMNS):
+        """Economic foundation slide: GDP growth, labour force, exports and digital adoption per year in the range"""
+        start, end = year_range or (None, None)
+        return self._query(f"SELECT {', '.join(columns)} FROM economic "
+                           "WHERE ($start IS NULL OR Year BETWEEN $start AND $end) ORDER BY Year",
+                           {'start': start, 'end': end})
+
+    def indicator_series(self, indicator, year_range=None, country=DEFAULT_COUNTRY):
+        """(year, value) rows of one World Bank indicator; `country` only applies to multi-country extracts"""
+        start, end = year_range or (None, None)
+        params = {'indicator': indicator, 'start': start, 'end': end}
+        country_filter = ''
+        if self.multi_country and country is not None:
+            country_filter, params['country'] = "AND country_code = $country ", country
+        return self._query("SELECT year, value FROM wb_indicators WHERE indicator = $indicator " + country_filter +
+                           "AND ($start IS NULL OR year BETWEEN $start AND $end) ORDER BY year", params)
+
+    def sector_metrics(self, sectors=None, columns=SECTOR_COLUMNS):
+        """MSME opportunities slide: bubble metrics for the selected sectors (all when none selected)"""
+        return self._query(f"SELECT {', '.join(columns)} FROM msme_sectors "
+                           "WHERE $sectors IS NULL OR list_contains($sectors, Sector) ORDER BY _row",
+                           {'sectors': list(sectors) if sectors else None})
+
+    def export_projection(self, columns=EXPORT_COLUMNS):
+        """Export pathway slide: projected export shares per year"""
+        return self._query(f"SELECT {', '.join(columns)} FROM export_projection ORDER BY Year")
+
+    def clamp_years(self, year_range=None):
+        return clamp_year_range(*self.year_span, year_range)
+
+    def state_rankings(self, year_range=None, states=None, limit=None):
+        """Regional slide: the RegionalPanel.query() rollup computed in SQL, top `limit` states first"""
+        start, end = self.clamp_years(year_range)
+        return self._query(STATE_RANKINGS_SQL, {'start': start, 'end': end, 'limit': limit,
+                                                'states': list(states) if states else None})
+
+
+if __name__ == '__main__':
+    if not available():
+        raise SystemExit("duckdb is not installed: pip install duckdb")
+    backend = DuckDBBackend()
+    rewritten = backend.sync()
+    for table in sorted(SOURCE_TABLES.values()):
+        status = 'rebuilt' if table in rewritten else 'up to date'
+        print(f"✅ {table}: {status}")
+    print(f"📦 {backend.path}")
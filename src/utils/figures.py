@@ -0,0 +1,335 @@
+import json
+import threading
+from collections import OrderedDict
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Builders for the interactive slideshow charts. Pure functions of the data they are given,
+# so the slideshow only builds the figure for the slide that is actually on screen.
+
+def build_economic_foundation_figure(filtered_economic):
+    fig_growth = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('GDP Growth Rate (% annually)', 'Labor Force Size (millions)',
+                      'Export Performance (% of GDP)', 'Digital Adoption Progress (%)'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"secondary_y": False}]],
+        vertical_spacing=0.15,
+        horizontal_spacing=0.12
+    )
+
+    # GDP Growth Rate
+    fig_growth.add_trace(
+        go.Scatter(
+            x=filtered_economic['Year'],
+            y=filtered_economic['GDP_Growth'],
+            mode='lines+markers',
+            name='GDP Growth Rate',
+            line=dict(color='#2E8B57', width=3),
+            marker=dict(size=8, color='#2E8B57', line=dict(width=2, color='white')),
+            hovertemplate='<b>GDP Growth</b><br>Year: %{x}<br>Growth Rate: %{y:.1f}%<extra></extra>',
+            showlegend=False
+        ),
+        row=1, col=1
+    )
+
+    # Labor Force
+    fig_growth.add_trace(
+        go.Scatter(
+            x=filtered_economic['Year'],
+            y=filtered_economic['Labor_Force_Million'],
+            mode='lines+markers',
+            name='Labor Force',
+            line=dict(color='#4169E1', width=3),
+            marker=dict(size=8, color='#4169E1', line=dict(width=2, color='white')),
+            hovertemplate='<b>Labor Force</b><br>Year: %{x}<br>Workers: %{y:.0f} million<extra></extra>',
+            showlegend=False
+        ),
+        row=1, col=2
+    )
+
+    # Export Performance
+    fig_growth.add_trace(
+        go.Scatter(
+            x=filtered_economic['Year'],
+            y=filtered_economic['Exports_Percent_GDP'],
+            mode='lines+markers',
+            name='Export Performance',
+            line=dict(color='#DC143C', width=3),
+            marker=dict(size=8, color='#DC143C', line=dict(width=2, color='white')),
+            hovertemplate='<b>Export Performance</b><br>Year: %{x}<br>Exports: %{y:.1f}% of GDP<extra></extra>',
+            showlegend=False
+        ),
+        row=2, col=1
+    )
+
+    # Digital Adoption
+    fig_growth.add_trace(
+        go.Scatter(
+            x=filtered_economic['Year'],
+            y=filtered_economic['Digital_Adoption'],
+            mode='lines+markers',
+            name='Digital Adoption',
+            line=dict(color='#FF8C00', width=3),
+            marker=dict(size=8, color='#FF8C00', line=dict(width=2, color='white')),
+            hovertemplate='<b>Digital Adoption</b><br>Year: %{x}<br>Adoption: %{y}%<extra></extra>',
+            showlegend=False
+        ),
+        row=2, col=2
+    )
+
+    fig_growth.update_layout(
+        height=500,
+        font=dict(family="Inter, sans-serif", color="#00cccc", size=11),
+        paper_bgcolor='rgba(5, 5, 5, 0.95)',
+        plot_bgcolor='rgba(0, 0, 0, 0.3)',
+        hovermode='closest',
+        showlegend=False
+    )
+
+    for row, col in [(1,1), (1,2), (2,1), (2,2)]:
+        fig_growth.update_xaxes(
+            title_text="Year",
+            gridcolor='rgba(0, 204, 204, 0.2)',
+            showgrid=True,
+            title_font=dict(size=12, color="#00cccc"),
+            tickfont=dict(color="#00cccc"),
+            row=row, col=col
+        )
+
+    fig_growth.update_yaxes(title_text="GDP Growth (%)", gridcolor='rgba(204, 102, 153, 0.1)',
+                           title_font=dict(size=12, color="#00cccc"), tickfont=dict(color="#00cccc"),
+                           row=1, col=1)
+    fig_growth.update_yaxes(title_text="Workers (Millions)", gridcolor='rgba(204, 102, 153, 0.1)',
+                           title_font=dict(size=12, color="#00cccc"), tickfont=dict(color="#00cccc"),
+                           row=1, col=2)
+    fig_growth.update_yaxes(title_text="Exports (% of GDP)", gridcolor='rgba(204, 102, 153, 0.1)',
+                           title_font=dict(size=12, color="#00cccc"), tickfont=dict(color="#00cccc"),
+                           row=2, col=1)
+    fig_growth.update_yaxes(title_text="Digital Adoption (%)", gridcolor='rgba(204, 102, 153, 0.1)',
+                           title_font=dict(size=12, color="#00cccc"), tickfont=dict(color="#00cccc"),
+                           row=2, col=2)
+    return fig_growth
+
+
+def build_msme_opportunities_figure(display_sectors):
+    fig_bubble = go.Figure()
+    if not display_sectors.empty:
+        fig_bubble.add_trace(go.Scatter(
+            x=display_sectors['Growth_Potential'],
+            y=display_sectors['Market_Size_Billion'],
+            mode='markers+text',
+            marker=dict(
+                size=display_sectors['Employment_Multiplier'] * 18, # Adjusted size
+                color=display_sectors['Digital_Readiness'],
+                colorscale='Plasma',
+                showscale=True,
+                colorbar=dict(title="Digital Readiness %", x=1.05, thickness=15, tickfont=dict(color="#00cccc"), titlefont=dict(color="#00cccc")),
+                line=dict(width=1, color='rgba(255,255,255,0.3)')
+            ),
+            text=display_sectors['Sector'],
+            textposition="middle center", # Centered text on bubbles
+            textfont=dict(size=9, color='rgba(255,255,255,0.9)', family="Inter"),
+            customdata=display_sectors[['Employment_Multiplier', 'Export_Potential', 'Risk_Factor']],
+            hovertemplate='<b>%{text}</b><br>' +
+                         '📈 Growth: %{x:.1f}%<br>' +
+                         '💰 Market: $%{y}B<br>' +
+                         '👥 Emp. X: %{customdata[0]:.1f}x<br>' +
+                         '🌍 Export Pot.: %{customdata[1]}%<br>' +
+                         '🎲 Risk Factor: %{customdata[2]:.1f}<extra></extra>'
+        ))
+
+    fig_bubble.update_layout(
+        title_text="MSME Sector Opportunities Matrix",
+        xaxis_title_text="Annual Growth Potential (%)",
+        yaxis_title_text="Total Market Size ($ Billions)",
+        height=650, # Increased height slightly
+        font=dict(family="Inter", color="#00cccc", size=12),
+        paper_bgcolor='rgba(5,5,5,0.95)',
+        plot_bgcolor='rgba(10,10,20,0.6)', # Slightly darker plot bg
+        showlegend=False,
+        xaxis=dict(gridcolor='rgba(0,204,204,0.1)', zerolinecolor='rgba(204,102,153,0.2)', color="#00cccc", tickfont=dict(color="#00cccc")),
+        yaxis=dict(gridcolor='rgba(0,204,204,0.1)', zerolinecolor='rgba(204,102,153,0.2)', color="#00cccc", tickfont=dict(color="#00cccc")),
+        hoverlabel=dict(bgcolor="rgba(5,5,5,0.8)", font_size=13, font_family="Inter", bordercolor="#00cccc")
+    )
+    return fig_bubble
+
+
+def build_export_pathway_figure(export_projection):
+    fig_export = go.Figure()
+    fig_export.add_trace(go.Scatter(
+        x=export_projection['Year'],
+        y=export_projection['Export_Percent_GDP'],
+        mode='lines+markers',
+        name='Total Exports (% GDP)',
+        line=dict(color='#1ABC9C', width=3),
+        marker=dict(size=9, symbol="star-diamond"),
+        fill='tozeroy', # Fill to y=0
+        fillcolor='rgba(26,188,156,0.15)',
+        hovertemplate='<b>Total Exports:</b> %{y:.2f}% of GDP<br>Year: %{x}<extra></extra>'
+    ))
+    fig_export.add_trace(go.Scatter(
+        x=export_projection['Year'],
+        y=export_projection['MSME_Export_Share'],
+        mode='lines+markers',
+        name='MSME Export Share (%)',
+        line=dict(color='#9B59B6', width=3, dash='dash'),
+        marker=dict(size=9, symbol="triangle-up"),
+        yaxis='y2',
+        hovertemplate='<b>MSME Share:</b> %{y:.1f}%<br>Year: %{x}<extra></extra>'
+    ))
+    fig_export.add_hline(y=25, line_dash="dot", line_color="#E74C3C", line_width=2,
+                         annotation_text="Target: 25% of GDP by 2030",
+                         annotation_position="bottom right",
+                         annotation_font=dict(color="#E74C3C"))
+
+    fig_export.update_layout(
+        height=600,
+        font=dict(family="Inter", color="#00cccc", size=12),
+        paper_bgcolor='rgba(5,5,5,0.95)',
+        plot_bgcolor='rgba(10,10,20,0.6)',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(size=11, color="#00cccc"), bgcolor="rgba(5,5,5,0.7)"),
+        xaxis=dict(title="Year", gridcolor='rgba(0,204,204,0.1)', zerolinecolor='rgba(204,102,153,0.2)', color="#00cccc"),
+        yaxis=dict(title="Total Exports (% GDP)", gridcolor='rgba(0,204,204,0.1)', zerolinecolor='rgba(204,102,153,0.2)', color="#00cccc"),
+        yaxis2=dict(title="MSME Export Share (%)", overlaying="y", side="right", color="#9B59B6", gridcolor='rgba(155,89,182,0.1)', showgrid=False, tickfont=dict(color="#9B59B6")),
+        hovermode='x unified'
+    )
+    return fig_export
+
+
+def build_regional_figure(state_rollup):
+    """Bars of new MSME registrations per state from a RegionalPanel.query() / DuckDBBackend.state_rankings() rollup"""
+    fig_regional = go.Figure()
+
+    # Top N states for clarity, e.g., top 6 or 10
+    top_n_states = state_rollup.nlargest(10, 'new_registrations')
+
+    # Define a more vibrant and distinct color palette for cyberpunk theme
+    cyber_colors = ['#FF00FF', '#00FFFF', '#FFFF00', '#FF6B35', '#20C997', '#6F42C1', '#E83E8C', '#FD7E14', '#007BFF', '#343A40']
+
+    fig_regional.add_trace(go.Bar(
+        x=top_n_states['state'],
+        y=top_n_states['new_registrations'],
+        name='New MSME Registrations by State',
+        marker=dict(
+            color=cyber_colors[:len(top_n_states)], # Apply colors
+            line=dict(color='rgba(255,255,255,0.5)', width=1)
+        ),
+        text=[f'{count/1000:.1f}K' for count in top_n_states['new_registrations']], # Format text as thousands
+        textposition='outside', # Position text above bars
+        textfont=dict(size=10, color='#00cccc'),
+        hovertemplate=('<b>%{x}</b><br>New Registrations: %{y:,}<br>Jobs per Registration: %{customdata[0]:.1f}'
+                       '<br>Credit per Job: ₹%{customdata[1]:.1f} lakh<br>Registration Growth: %{customdata[2]:+.1f}% YoY<extra></extra>'),
+        customdata=top_n_states[['jobs_per_registration', 'credit_per_job_lakh', 'registration_growth_pct']]
+    ))
+
+    fig_regional.update_layout(
+        height=600,
+        font=dict(family="Inter", color="#00cccc", size=12),
+        paper_bgcolor='rgba(5,5,5,0.95)',
+        plot_bgcolor='rgba(10,10,20,0.6)',
+        showlegend=False, # Bar charts often don't need a legend for a single trace
+        xaxis=dict(
+            title="State / Union Territory",
+            gridcolor='rgba(0,204,204,0.1)',
+            color="#00cccc",
+            tickangle=-45, # Angled ticks for better readability
+            tickfont=dict(size=11)
+        ),
+        yaxis=dict(
+            title="New MSME Registrations",
+            gridcolor='rgba(0,204,204,0.1)',
+            color="#00cccc",
+            tickformat=',.0f' # Format y-axis ticks with commas
+        ),
+        hoverlabel=dict(bgcolor="rgba(5,5,5,0.8)", font_size=13, font_family="Inter")
+    )
+    return fig_regional
+
+
+# --- Memoized figure payloads -------------------------------------------------------------
+# Figures are cached keyed on (slide id, normalized filters, data version) and sized by their
+# serialized JSON. Each entry is a go.Figure rehydrated once from that JSON without re-validation:
+# st.plotly_chart rebuilds and re-validates a dict on every call (~30 ms for the economic slide) but
+# only copies a Figure via to_dict() (~1 ms). The cache lives at module level, so every session in
+# this server process shares it: callers hand the figure to st.plotly_chart and must not modify it.
+
+# Only the filters a slide actually reads go into its key, so unrelated filter changes still hit
+SLIDE_FILTER_KEYS = {
+    'economic_foundation': ('year_range',),
+    'msme_opportunities': ('sectors',),
+    'export_pathway': (),
+    'regional_analysis': ('year_range',),
+}
+
+
+class FigureCache:
+    """Thread-safe LRU of figures, bounded by entry count and total JSON bytes"""
+
+    def __init__(self, max_entries=64, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, payload, size):
+        """Store `payload`, counting `size` bytes (its serialized length) against max_bytes"""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (payload, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_FIGURE_CACHE = FigureCache()
+
+
+def normalize_filters(filters, keys=None):
+    """Hashable, order-insensitive form of st.session_state.filters"""
+    normalized = []
+    for name in sorted(keys if keys is not None else filters):
+        value = filters.get(name)
+        if name == 'year_range' and value is not None:
+            value = (int(value[0]), int(value[1]))
+        elif isinstance(value, (list, tuple, set)):
+            value = tuple(sorted(value))
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+def get_slide_figure(slide_id, filters, data_version, build):
+    """Return the slide's figure as a shared go.Figure, building it with `build()` only on a cache miss"""
+    key = (slide_id, normalize_filters(filters, SLIDE_FILTER_KEYS.get(slide_id)), data_version)
+    figure = _FIGURE_CACHE.get(key)
+    if figure is None:
+        payload = build().to_json()
+        # Already validated by build(); skip the property checks when rehydrating the JSON
+        figure = go.Figure(json.loads(payload), skip_invalid=True, _validate=False)
+        _FIGURE_CACHE.put(key, figure, len(payload))
+    return figure
@@ -0,0 +1,19 @@
+import streamlit as st
+
+# st.fragment landed in Streamlit 1.37 (st.experimental_fragment in 1.33). On older runtimes
+# the decorated functions simply render inline as part of the full script run.
+
+def _inline(func=None, **kwargs):
+    if func is None:
+        return lambda f: f
+    return func
+
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or _inline
+
+
+def rerun_fragment():
+    """Rerun only the enclosing fragment where supported, otherwise the whole script"""
+    try:
+        st.rerun(scope="fragment")
+    except TypeError:
+        st.rerun()
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import plotly
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+# Lean HTML export for the story chapters. plotly.js and each layout template are written once
+# as content-hashed assets that every page references (so a static host can cache them forever);
+# the pages themselves only carry compact figure JSON.
+
+ASSET_DIR = 'assets'
+FLOAT_SIGNIFICANT_DIGITS = 6
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+{scripts}
+<style>body {{ margin: 0; font-family: Arial, sans-serif; }} .chapter {{ width: 100%; }}</style>
+</head>
+<body>
+{body}
+<script>
+(function () {{
+  var templates = window.PLOTLY_TEMPLATES || {{}};
+  document.querySelectorAll('script[data-plot]').forEach(function (node) {{
+    var spec = JSON.parse(node.textContent);
+    if (spec.template) spec.layout.template = templates[spec.template];
+    Plotly.newPlot(node.getAttribute('data-plot'), spec.data, spec.layout, {{responsive: true}});
+  }});
+}})();
+</script>
+</body>
+</html>
+"""
+
+CHAPTER_BLOCK = """<div id="{div_id}" class="chapter" style="height: {height};"></div>
+<script type="application/json" data-plot="{div_id}">{spec}</script>"""
+
+
+def _digest(content):
+    return hashlib.sha256(content.encode()).hexdigest()[:12]
+
+
+def _compact_json(payload):
+    # "</" inside an inline <script> would end the tag early
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False).replace('</', '<\\/')
+
+
+def write_asset(out_dir, stem, content, ext='js'):
+    """Write `content` as assets/<stem>.<hash>.<ext> unless it already exists; returns the path relative to out_dir"""
+    rel_path = f"{ASSET_DIR}/{stem}.{_digest(content)}.{ext}"
+    path = os.path.join(out_dir, rel_path)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    return rel_path
+
+
+def plotly_asset(out_dir):
+    return write_asset(out_dir, f"plotly-{plotly.__version__}.min", get_plotlyjs())
+
+
+def _round_floats(value, digits):
+    if isinstance(value, float):
+        return float(f"{value:.{digits}g}")
+    if isinstance(value, list):
+        return [_round_floats(item, digits) for item in value]
+    if isinstance(value, dict):
+        return {key: _round_floats(item, digits) for key, item in value.items()}
+    return value
+
+
+def compact_figure(fig, digits=FLOAT_SIGNIFICANT_DIGITS):
+    """(spec, template): the figure as plain JSON with rounded floats, and its layout template split out"""
+    spec = json.loads(pio.to_json(fig, validate=False))
+    layout = spec.get('layout', {})
+    template = layout.pop('template', None)
+    spec = {'data': _round_floats(spec.get('data', []), digits), 'layout': _round_floats(layout, digits)}
+    return spec, template
+
+
+def template_asset(out_dir, template):
+    """Register a layout template once under window.PLOTLY_TEMPLATES; returns (template_id, asset path)"""
+    payload = _compact_json(template)
+    template_id = _digest(payload)
+    script = f"(window.PLOTLY_TEMPLATES = window.PLOTLY_TEMPLATES || {{}})['{template_id}'] = {payload};\n"
+    return template_id, write_asset(out_dir, 'plotly-template', script)
+
+
+def render_page(title, chapters, out_dir):
+    """HTML page for [(div_id, spec, template)] referencing shared assets; returns (html, asset paths)"""
+    assets = [plotly_asset(out_dir)]
+    blocks = []
+    for div_id, spec, template in chapters:
+        spec = dict(spec)
+        if template:
+            spec['template'], asset = template_asset(out_dir, template)
+            if asset not in assets:
+                assets.append(asset)
+        height = spec['layout'].get('height')
+        blocks.append(CHAPTER_BLOCK.format(div_id=div_id, height=f"{height}px" if height else '100vh',
+                                           spec=_compact_json(spec)))
+    scripts = "\n".join(f'<script src="{asset}"></script>' for asset in assets)
+    return PAGE_TEMPLATE.format(title=title, scripts=scripts, body="\n".join(blocks)), assets
+
+
+def write_page(path, title, chapters):
+    """Write a page into its directory's shared asset tree; returns every file the page needs"""
+    out_dir = os.path.dirname(path) or '.'
+    html, assets = render_page(title, chapters, out_dir)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    return [path] + [os.path.join(out_dir, asset) for asset in assets]
@@ -0,0 +1,171 @@
+import html
+import io
+import os
+import shutil
+import sys
+import threading
+from PIL import Image, features
+
+try:
+    import pillow_avif  # noqa: F401  (registers AVIF on Pillow < 11.2)
+except ImportError:
+    pass
+
+# Size-tiered chapter images. The story build writes every tier next to the full-size PNG:
+#   <name>.<tier>.webp / .avif (when this Pillow build can encode it) / .jpg
+# The dashboard shows the WebP tiers through a <picture> element, from copies published into
+# static/chapters/ (Streamlit serves ./static at app/static when server.enableStaticServing is on).
+# st.image can't be used for them: it re-encodes WebP/AVIF bytes to JPEG on every rerun. Streamlit's
+# static handler only sends image types for .webp/.jpg/.png/.gif, so AVIF is left to the static host
+# and the JPEG tiers are the fallback. Tiers are build output, not committed: the dashboard builds
+# missing ones from the PNG the first time they are asked for.
+# Regenerate tiers for existing PNGs with:  python -m src.utils.image_cache output/images
+
+IMAGE_TIERS = {'thumb': 480, '1x': 1400, '2x': 2800}
+SAVE_OPTIONS = {
+    'webp': dict(format='WEBP', quality=82, method=4),
+    'avif': dict(format='AVIF', quality=60),
+    'jpg': dict(format='JPEG', quality=85, optimize=True, progressive=True),
+}
+BROWSER_FORMATS = ('webp', 'jpg')  # what the dashboard's <picture> offers, best first
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'static', 'chapters')
+STATIC_URL = 'app/static/chapters'
+
+
+def avif_supported():
+    # Native in Pillow >= 11.2; older builds only with the pillow-avif-plugin installed
+    return 'avif' in features.get_supported_features()
+
+
+def tier_formats():
+    return ('webp', 'avif', 'jpg') if avif_supported() else ('webp', 'jpg')
+
+
+def tier_path(images_dir, name, tier, fmt='jpg'):
+    return os.path.join(images_dir, f"{name}.{tier}.{fmt}")
+
+
+def _flatten(image):
+    """Composite transparency onto white so every format renders the same"""
+    if image.mode in ('RGBA', 'LA', 'P'):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def write_image_tiers(png_bytes, images_dir, name, formats=None):
+    """Write every tier of one chapter image in each of `formats` (default: all this build can encode); returns the paths written"""
+    source = _flatten(Image.open(io.BytesIO(png_bytes)))
+    paths = []
+    for tier, width in IMAGE_TIERS.items():
+        image = source
+        if source.width > width:
+            image = source.resize((width, round(source.height * width / source.width)), Image.LANCZOS)
+        for fmt in formats or tier_formats():
+            path = tier_path(images_dir, name, tier, fmt)
+            tmp_path = f"{path}.{os.getpid()}.tmp"  # sessions may read the tier while it is written
+            image.save(tmp_path, **SAVE_OPTIONS[fmt])
+            os.replace(tmp_path, path)
+            paths.append(path)
+    return paths
+
+
+class ImageBytesCache:
+    """Process-wide image bytes keyed by path, re-read only when the file's mtime or size changes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+        with open(path, 'rb') as f:
+            data = f.read()
+        with self._lock:
+            self._entries[path] = (stamp, data)
+            self.misses += 1
+        return data
+
+
+_IMAGE_CACHE = ImageBytesCache()
+
+
+def load_chapter_image(name, tier='1x', images_dir='output/images'):
+    """JPEG bytes for a chapter image tier, writing the tiers from the full-size PNG if they were never built"""
+    data = _IMAGE_CACHE.get(tier_path(images_dir, name, tier))
+    if data is not None:
+        return data
+    png = _IMAGE_CACHE.get(os.path.join(images_dir, f"{name}.png"))
+    if png is None:
+        raise FileNotFoundError(f"No image found for {name} in {images_dir}")
+    try:
+        write_image_tiers(png, images_dir, name, ('jpg',))
+    except OSError:
+        return png  # read-only deploy: serve the full-size PNG
+    return _IMAGE_CACHE.get(tier_path(images_dir, name, tier)) or png
+
+
+_published = {}  # (images_dir, name) -> PNG mtime the static copies were made from
+_publish_lock = threading.Lock()
+
+
+def publish_static_tiers(name, images_dir='output/images'):
+    """Copy a chapter's browser tiers into static/chapters, building them from the PNG when missing or
+    older than it; returns the PNG's mtime, used to version the URLs. A rerun costs one stat."""
+    png_path = os.path.join(images_dir, f"{name}.png")
+    try:
+        version = os.stat(png_path).st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"No image found for {name} in {images_dir}")
+    key = (os.path.abspath(images_dir), name)
+    if _published.get(key) == version:
+        return version
+    with _publish_lock:
+        if _published.get(key) != version:
+            paths = [tier_path(images_dir, name, tier, fmt) for tier in IMAGE_TIERS for fmt in BROWSER_FORMATS]
+            if any(not os.path.exists(path) or os.stat(path).st_mtime_ns < version for path in paths):
+                with open(png_path, 'rb') as f:
+                    write_image_tiers(f.read(), images_dir, name, BROWSER_FORMATS)
+            os.makedirs(STATIC_DIR, exist_ok=True)
+            for path in paths:
+                target = os.path.join(STATIC_DIR, os.path.basename(path))
+                tmp_path = f"{target}.{os.getpid()}.tmp"
+                shutil.copyfile(path, tmp_path)
+                os.replace(tmp_path, target)
+            _published[key] = version
+    return version
+
+
+def chapter_picture_html(name, alt='', images_dir='output/images'):
+    """A <picture> serving the WebP tiers (JPEG fallback) from Streamlit's static route; the browser picks the size"""
+    version = publish_static_tiers(name, images_dir)
+    sizes = "(max-width: 1400px) 100vw, 1400px"
+
+    def srcset(fmt):
+        return ", ".join(f"{STATIC_URL}/{name}.{tier}.{fmt}?v={version} {width}w" for tier, width in IMAGE_TIERS.items())
+
+    return (f'<picture><source type="image/webp" srcset="{srcset("webp")}" sizes="{sizes}">'
+            f'<img src="{STATIC_URL}/{name}.1x.jpg?v={version}" srcset="{srcset("jpg")}" sizes="{sizes}" '
+            f'alt="{html.escape(alt)}" loading="lazy" style="width:100%;height:auto"></picture>')
+
+
+if __name__ == '__main__':
+    images_dir = sys.argv[1] if len(sys.argv) > 1 else 'output/images'
+    for file_name in sorted(os.listdir(images_dir)):
+        if file_name.endswith('.png'):
+            with open(os.path.join(images_dir, file_name), 'rb') as f:
+                written = write_image_tiers(f.read(), images_dir, file_name[:-len('.png')])
+            print(f"✅ {file_name}: {len(written)} tiers")
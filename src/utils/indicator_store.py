@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Long-format World Bank extract: one row per (indicator, year) with a 'value' column.
+# Multi-country extracts carry a 'country_code' column; the dashboard only needs India.
+DEFAULT_COUNTRY = 'IND'
+
+
+class IndicatorStore:
+    """Wide (year x indicator) view of the World Bank extract with O(1) lookups"""
+
+    def __init__(self, long_df, country=DEFAULT_COUNTRY):
+        df = long_df
+        if 'country_code' in df.columns and country is not None:
+            df = df[df['country_code'] == country]
+        df = df[['indicator', 'year', 'value']].dropna(subset=['year'])
+        df = df.astype({'year': 'int64', 'value': 'float64'})
+
+        # Pivot once; duplicates keep the last value so refreshed rows win
+        wide = df.drop_duplicates(['indicator', 'year'], keep='last').pivot(index='year', columns='indicator', values='value')
+        wide = wide.sort_index()
+        wide.columns = wide.columns.astype(str)
+
+        self.country = country
+        self.years = wide.index.to_numpy()
+        self.indicators = list(wide.columns)
+        self._values = wide.to_numpy(dtype='float64')
+        self._year_pos = {int(year): i for i, year in enumerate(self.years)}
+        self._indicator_pos = {indicator: j for j, indicator in enumerate(self.indicators)}
+
+    def __contains__(self, indicator):
+        return indicator in self._indicator_pos
+
+    def __len__(self):
+        return int(np.count_nonzero(~np.isnan(self._values)))
+
+    def get(self, indicator, year, default=None):
+        i = self._year_pos.get(int(year))
+        j = self._indicator_pos.get(indicator)
+        if i is None or j is None:
+            return default
+        value = self._values[i, j]
+        return default if np.isnan(value) else float(value)
+
+    def series(self, indicator, years=None):
+        """Values for `indicator` aligned to `years` (NaN where missing)"""
+        if years is None:
+            years = self.years
+        years = np.asarray(years, dtype='int64')
+        out = np.full(len(years), np.nan)
+        j = self._indicator_pos.get(indicator)
+        if j is None or len(self.years) == 0:
+            return out
+        pos = np.searchsorted(self.years, years)
+        pos_clipped = np.clip(pos, 0, len(self.years) - 1)
+        hit = self.years[pos_clipped] == years
+        out[hit] = self._values[pos_clipped[hit], j]
+        return out
+
+    def frame(self, indicators=None):
+        """Wide DataFrame (index: year) for the requested indicators"""
+        indicators = self.indicators if indicators is None else list(indicators)
+        cols = [self._indicator_pos[ind] for ind in indicators if ind in self._indicator_pos]
+        return pd.DataFrame(self._values[:, cols], index=pd.Index(self.years, name='year'),
+                            columns=[self.indicators[c] for c in cols])
+
+
+def load_indicator_store(path, country=DEFAULT_COUNTRY):
+    return IndicatorStore(pd.read_csv(Path(path)), country=country)
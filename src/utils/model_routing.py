@@ -0,0 +1,69 @@
+import os
+import re
+
+# Model tiers for the AI analyst. Each request is classified by a local heuristic (canned quick
+# question, question length and wording, slide) and sent to its tier's model with that tier's
+# token and time limits. When a tier's model doesn't answer in time the request is retried once on
+# its fallback tier, so a slow primary costs at most one timeout. Models can be overridden per
+# deployment with MSME_AI_MODEL_QUICK / _STANDARD / _DEEP.
+
+MODEL_TIERS = {
+    'quick': dict(model=os.environ.get('MSME_AI_MODEL_QUICK', 'gpt-4o-mini'), max_tokens=350, timeout=20.0,
+                  fallback=None),
+    'standard': dict(model=os.environ.get('MSME_AI_MODEL_STANDARD', 'gpt-4o'), max_tokens=500, timeout=30.0,
+                     fallback='quick'),
+    'deep': dict(model=os.environ.get('MSME_AI_MODEL_DEEP', 'gpt-4'), max_tokens=600, timeout=45.0,
+                 fallback='standard'),
+}
+
+SHORT_QUESTION_WORDS = 10
+LONG_QUESTION_WORDS = 35
+# Asking for a plan, comparison or forecast needs multi-step reasoning however short the question is
+DEEP_TERMS = re.compile(r"\b(strateg\w*|roadmap|plan|compare|comparison|versus|vs|trade-?offs?|scenario\w*|"
+                        r"forecast\w*|project(ion|ed)?|recommend\w*|why|explain|policy|policies)\b", re.IGNORECASE)
+# Slides whose answers lean on projections start at the standard tier even for short questions
+SLIDE_MIN_TIER = {'export_pathway': 'standard'}
+TIER_ORDER = ['quick', 'standard', 'deep']
+
+
+def _base_tier(question, canned):
+    if canned:
+        return 'quick'
+    words = len(str(question).split())
+    if words > LONG_QUESTION_WORDS or DEEP_TERMS.search(str(question)):
+        return 'deep'
+    if words <= SHORT_QUESTION_WORDS:
+        return 'quick'
+    return 'standard'
+
+
+def classify_request(question, slide=None, canned=False):
+    """Tier name for a question: canned buttons are quick, long or analytical questions deep.
+
+    Every path is raised to the slide's SLIDE_MIN_TIER, canned buttons included.
+    """
+    tier = _base_tier(question, canned)
+    floor = SLIDE_MIN_TIER.get(slide, TIER_ORDER[0])
+    return max(tier, floor, key=TIER_ORDER.index)
+
+
+def completion_params(tier, base_params):
+    """chat.completions.create() arguments for a tier: the shared settings plus its model and token limit"""
+    settings = MODEL_TIERS[tier]
+    return dict(base_params, model=settings['model'], max_tokens=settings['max_tokens'])
+
+
+if __name__ == '__main__':
+    # Routing sanity check:  python -m src.utils.model_routing
+    checks = [
+        ("💰 Investment opportunities?", None, True, 'quick'),
+        ("🌍 Export potential?", 'export_pathway', True, 'standard'),
+        ("What is GDP growth?", None, False, 'quick'),
+        ("What is the export share?", 'export_pathway', False, 'standard'),
+        ("Why did exports fall after 2014?", 'export_pathway', False, 'deep'),
+        ("Which states added the most new registrations over the selected years overall?", None, False, 'standard'),
+    ]
+    for question, slide, canned, expected in checks:
+        tier = classify_request(question, slide, canned)
+        assert tier == expected, (question, slide, canned, tier)
+        print(f"✅ {tier:<8} {MODEL_TIERS[tier]['model']:<12} {question} (slide={slide}, canned={canned})")
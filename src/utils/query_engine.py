@@ -0,0 +1,134 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from src.utils.shared_frames import freeze
+
+# Row selection for the dashboard's filter dict (st.session_state.filters and friends).
+# Each registered table is sorted once by (category code, year), with codes in order of first
+# appearance so unfiltered row order is kept. A category's rows then form one contiguous block and
+# a year range is a binary search inside it, so a filter resolves to a few row slices instead of a
+# boolean mask over the whole frame. A single slice comes back as an iloc view, not a copy. Tables and
+# results are frozen (src/utils/shared_frames.py) since every session shares them.
+
+# Filter key -> dimension it selects on; filters a table has no dimension for are ignored
+FILTER_DIMENSIONS = {
+    'year_range': 'year',
+    'sectors': 'sector',
+    'states': 'state',
+    'indicators': 'indicator',
+}
+
+
+class _TableIndex:
+    def __init__(self, frame, year=None, categories=None):
+        categories = categories or {}
+        self.year_column = year
+        self.category_dimension, self.category_column = next(iter(categories.items()), (None, None))
+        if len(categories) > 1:
+            raise ValueError("A table is indexed on at most one categorical dimension")
+
+        self.category_filter = {dim: key for key, dim in FILTER_DIMENSIONS.items()}.get(self.category_dimension)
+
+        keys = []
+        if year:
+            keys.append(frame[year].to_numpy())
+        if self.category_column:
+            values = frame[self.category_column]
+            codes = pd.Categorical(values, categories=pd.unique(values.dropna())).codes
+            keys.append(codes)
+        if keys:
+            frame = frame.take(np.lexsort(keys)).reset_index(drop=True)
+        self.frame = freeze(frame, copy=False)
+
+        # Category -> [start, stop) block of rows
+        self.blocks = {}
+        if self.category_column and len(frame):
+            values = frame[self.category_column].to_numpy()
+            changes = np.flatnonzero(values[1:] != values[:-1]) + 1
+            starts = np.concatenate([[0], changes])
+            stops = np.concatenate([changes, [len(frame)]])
+            self.blocks = {values[start]: (int(start), int(stop)) for start, stop in zip(starts, stops)}
+        self.years = frame[year].to_numpy() if year else None
+
+    def dimensions(self):
+        return {dim for dim, present in (('year', self.year_column), (self.category_dimension, self.category_column))
+                if dim and present}
+
+    def slices(self, year_range=None, members=None):
+        blocks = [(0, len(self.frame))] if members is None else \
+            sorted(self.blocks[member] for member in members if member in self.blocks)
+        if year_range is None or self.years is None:
+            return blocks
+        result = []
+        for start, stop in blocks:
+            lo = start + int(np.searchsorted(self.years[start:stop], year_range[0], side='left'))
+            hi = start + int(np.searchsorted(self.years[start:stop], year_range[1], side='right'))
+            if lo < hi:
+                result.append((lo, hi))
+        return result
+
+
+class QueryEngine:
+    """Registered tables answering filter dicts with memoized, read-only results"""
+
+    def __init__(self, max_results=256):
+        self.max_results = max_results
+        self._tables = {}
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, name, frame, year=None, categories=None):
+        """categories maps a dimension ('sector', 'state', 'indicator') to the column holding it"""
+        self._tables[name] = _TableIndex(frame, year, categories)
+        with self._lock:
+            self._results = OrderedDict((key, value) for key, value in self._results.items() if key[0] != name)
+
+    def __contains__(self, name):
+        return name in self._tables
+
+    def signature(self, name, filters):
+        """The part of `filters` this table actually selects on, normalized and hashable"""
+        dimensions = self._tables[name].dimensions()
+        signature = []
+        for key, dimension in FILTER_DIMENSIONS.items():
+            value = filters.get(key)
+            if dimension not in dimensions or value is None:
+                continue
+            if key == 'year_range':
+                value = (int(value[0]), int(value[1]))
+            elif not value:
+                continue  # an empty multiselect means "all"
+            else:
+                value = tuple(sorted(value))
+            signature.append((key, value))
+        return tuple(signature)
+
+    def select(self, name, filters):
+        """Rows of table `name` matching `filters`, read-only: the result is shared and may be a view"""
+        key = (name, self.signature(name, filters))
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._results[key]
+
+        table = self._tables[name]
+        selection = dict(key[1])
+        slices = table.slices(selection.get('year_range'), selection.get(table.category_filter))
+        if len(slices) == 1:
+            result = table.frame.iloc[slices[0][0]:slices[0][1]]
+        elif slices:
+            result = table.frame.take(np.concatenate([np.arange(start, stop) for start, stop in slices]))
+        else:
+            result = table.frame.iloc[0:0]
+        result = freeze(result, copy=False)
+
+        with self._lock:
+            self.misses += 1
+            self._results[key] = result
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+        return result
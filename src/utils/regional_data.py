@@ -0,0 +1,98 @@
+import threading
+import numpy as np
+import pandas as pd
+from src.utils.shared_frames import freeze
+
+# State x fiscal-year MSME panel (data/processed/msme_cleaned.csv + growth_cleaned.csv).
+# Everything the regional slide needs is rolled up once at load time: dense state x year grids
+# with prefix sums over the year axis, so any year-range query is a subtraction per state.
+
+ADDITIVE_COLUMNS = ['new_registrations', 'total_jobs_created']
+GROWTH_COLUMNS = ['registration_growth_pct', 'job_growth_pct', 'credit_growth_pct']
+
+
+def _with_ratios(frame):
+    """jobs_per_registration and credit_per_job_lakh (1 crore = 100 lakh) from the summed columns"""
+    registrations = frame['new_registrations'].replace(0, np.nan)
+    jobs = frame['total_jobs_created'].replace(0, np.nan)
+    return frame.assign(jobs_per_registration=frame['total_jobs_created'] / registrations,
+                        credit_per_job_lakh=frame['credit_outstanding_crores'] * 100 / jobs)
+
+
+def clamp_year_range(first, last, year_range=None):
+    """Intersect a (start, end) year filter with [first, last]; the full span when they don't overlap"""
+    if year_range is None:
+        return first, last
+    start, end = max(int(year_range[0]), first), min(int(year_range[1]), last)
+    return (start, end) if start <= end else (first, last)
+
+
+def merge_panel(msme, growth):
+    """One row per (state, year): the msme_cleaned columns plus the YoY growth columns"""
+    panel = msme.merge(growth[['state', 'year'] + GROWTH_COLUMNS], on=['state', 'year'], how='left')
+    return panel.astype({'state': str, 'year': 'int64'}).sort_values(['state', 'year']).reset_index(drop=True)
+
+
+class RegionalPanel:
+    """Per-state and per-year MSME rollups with memoized year-range queries, from a merge_panel() frame"""
+
+    def __init__(self, panel):
+        self.years = np.sort(panel['year'].unique())
+        totals = panel.groupby('state')['new_registrations'].sum().sort_values(ascending=False)
+        self.states = list(totals.index)
+
+        def grid(column):
+            wide = panel.pivot(index='state', columns='year', values=column)
+            return wide.reindex(index=self.states, columns=self.years).to_numpy(dtype='float64')
+
+        self._cumulative = {column: np.nancumsum(grid(column), axis=1) for column in ADDITIVE_COLUMNS + GROWTH_COLUMNS}
+        self._observed = {column: np.cumsum(~np.isnan(grid(column)), axis=1) for column in GROWTH_COLUMNS}
+        self._credit = grid('credit_outstanding_crores')  # a stock: read at the end of the range
+        self._industrial = panel.groupby('state')['is_industrial_state'].first().reindex(self.states).to_numpy()
+        self._memo = {}
+        self._lock = threading.Lock()
+
+        # Rollup tables
+        self.state_year = freeze(panel.set_index(['state', 'year']), copy=False)
+        by_year = panel.groupby('year')[ADDITIVE_COLUMNS + ['credit_outstanding_crores']].sum()
+        by_year = _with_ratios(by_year)
+        self.by_year = freeze(by_year.assign(registration_growth_pct=by_year['new_registrations'].pct_change() * 100),
+                              copy=False)
+        self.by_state = self.query()
+
+    def clamp_years(self, year_range=None):
+        return clamp_year_range(int(self.years[0]), int(self.years[-1]), year_range)
+
+    def query(self, year_range=None, states=None):
+        """Per-state rollup over the year range: summed flows, end-of-range credit, mean YoY growth"""
+        start, end = self.clamp_years(year_range)
+        key = (start, end, tuple(sorted(states)) if states else None)
+        with self._lock:
+            cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        first = int(np.searchsorted(self.years, start, side='left'))
+        last = int(np.searchsorted(self.years, end, side='right')) - 1
+
+        def window(cumulative):
+            return cumulative[:, last] - (cumulative[:, first - 1] if first > 0 else 0)
+
+        frame = pd.DataFrame({
+            'state': self.states,
+            'new_registrations': window(self._cumulative['new_registrations']).astype('int64'),
+            'total_jobs_created': window(self._cumulative['total_jobs_created']).astype('int64'),
+            'credit_outstanding_crores': self._credit[:, last],
+            'is_industrial_state': self._industrial,
+        })
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for column in GROWTH_COLUMNS:
+                frame[column] = window(self._cumulative[column]) / window(self._observed[column])
+        frame = _with_ratios(frame)
+        if states:
+            frame = frame[frame['state'].isin(states)]
+        frame = freeze(frame.sort_values('new_registrations', ascending=False).reset_index(drop=True), copy=False)
+
+        with self._lock:
+            self._memo[key] = frame
+        return frame
@@ -0,0 +1,235 @@
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from src.utils.columnar_cache import BASE_DIR, _source_fingerprint
+from src.utils.context_builder import count_tokens
+
+# BM25 retrieval over the generated reports and the panel's key insights, so the AI analyst is
+# grounded in the long-form analysis without sending all of it. Sources are split into short
+# heading-labelled chunks; the index is persisted to data/cache/report_index.json and rebuilt only
+# when a source file's content changes. Rebuild by hand with:  python -m src.utils.report_index
+
+SOURCES = [
+    'output/reports/bcg_msme_executive_report.md',
+    'output/reports/unified_msme_story.md',
+    'output/reports/unified_reflection_essay.md',
+    'data/processed/key_insights.json',
+]
+INDEX_PATH = BASE_DIR / 'data' / 'cache' / 'report_index.json'
+INDEX_FORMAT = 1
+CHUNK_TOKENS = 90
+DEFAULT_TOP_K = 3
+MIN_SCORE = 1.0  # below this a chunk shares only a common word or two with the question
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+STOPWORDS = set("""a an and are as at be by for from has have how in into is it its of on or our that the their this
+to was were what when where which while who why will with can could should would do does did about vs per""".split())
+HEADING = re.compile(r'^(#{1,6})\s+(.*)$')
+
+
+def tokenize(text):
+    """Lowercased word and number terms, stopwords dropped, plural 's' folded ('exports' ~ 'export')"""
+    terms = []
+    for word in re.findall(r"[a-z0-9]+(?:\.[0-9]+)?", str(text).lower()):
+        if word in STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def _clean(text):
+    return re.sub(r'\*\*|__|`', '', text).strip()
+
+
+def _pack(label, paragraphs, max_tokens=CHUNK_TOKENS):
+    """Group paragraphs into chunks of about max_tokens, splitting long ones into lines, then sentences"""
+    pieces = []
+    for paragraph in paragraphs:
+        if count_tokens(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+        for line in paragraph.splitlines():
+            pieces.extend(re.split(r'(?<=[.!?])\s+', line) if count_tokens(line) > max_tokens else [line])
+    chunks, current, used = [], [], 0
+    for piece in pieces:
+        cost = count_tokens(piece)
+        if current and used + cost > max_tokens:
+            chunks.append({'heading': label, 'text': '\n'.join(current)})
+            current, used = [], 0
+        current.append(piece)
+        used += cost
+    if current:
+        chunks.append({'heading': label, 'text': '\n'.join(current)})
+    return chunks
+
+
+def chunk_markdown(text, title):
+    """Chunks per section, each labelled 'Report title > Section heading'"""
+    chunks, heading, paragraphs, lines = [], None, [], []
+
+    def flush():
+        if lines:
+            paragraphs.append(_clean('\n'.join(lines)))
+            lines.clear()
+
+    def close_section():
+        flush()
+        body = [paragraph for paragraph in paragraphs if paragraph]
+        if body:
+            chunks.extend(_pack(f"{title} > {heading}" if heading else title, body))
+        paragraphs.clear()
+
+    for line in text.splitlines():
+        match = HEADING.match(line)
+        if match:
+            close_section()
+            if match.group(1) == '#' and title is None:
+                title = _clean(match.group(2))
+            else:
+                heading = _clean(match.group(2))
+        elif line.strip():
+            lines.append(line.rstrip())
+        else:
+            flush()
+    close_section()
+    return chunks
+
+
+def _flatten(value, path=()):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _flatten(item, path + (key.replace('_', ' '),))
+    else:
+        yield f"{' - '.join(path)}: {value:,.2f}" if isinstance(value, float) else f"{' - '.join(path)}: {value}"
+
+
+def chunk_json(text, title):
+    """One 'key: value' line per (nested) field of an insights file"""
+    return _pack(title, list(_flatten(json.loads(text))))
+
+
+def _chunk_source(rel_path):
+    path = BASE_DIR / rel_path
+    text = path.read_text(encoding='utf-8')
+    if path.suffix == '.json':
+        chunks = chunk_json(text, path.stem.replace('_', ' ').capitalize())
+    else:
+        chunks = chunk_markdown(text, None)
+    for chunk in chunks:
+        chunk['source'] = rel_path
+        chunk['heading'] = chunk['heading'] or path.stem
+        chunk['terms'] = dict(Counter(tokenize(f"{chunk['heading']} {chunk['text']}")))
+    return chunks
+
+
+class ReportIndex:
+    """Okapi BM25 over the report chunks, kept in step with the source files"""
+
+    def __init__(self, path=INDEX_PATH, sources=SOURCES):
+        self.path = path
+        self.sources = list(sources)
+        self._lock = threading.Lock()
+        self._stats = {}  # rel_path -> (size, mtime_ns) the index was built from
+        self._load_or_build()
+
+    def _fingerprints(self, previous):
+        fingerprints = {}
+        for rel_path in self.sources:
+            try:
+                sha256, stat = _source_fingerprint(BASE_DIR / rel_path, previous.get(rel_path))
+            except OSError:
+                continue  # a report that hasn't been generated yet
+            fingerprints[rel_path] = {'sha256': sha256, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        return fingerprints
+
+    def _load_or_build(self):
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            stored = {}
+        if stored.get('format') != INDEX_FORMAT:
+            stored = {}
+        previous = stored.get('sources', {})
+        fingerprints = self._fingerprints(previous)
+        hashes = {rel_path: entry['sha256'] for rel_path, entry in fingerprints.items()}
+        if stored and hashes == {rel_path: entry['sha256'] for rel_path, entry in previous.items()}:
+            chunks = stored['chunks']
+            if fingerprints != previous:
+                self._save(fingerprints, chunks)  # touched but unchanged: re-stamp so the next check skips hashing
+        else:
+            chunks = [chunk for rel_path in fingerprints for chunk in _chunk_source(rel_path)]
+            self._save(fingerprints, chunks)
+        self._set_chunks(chunks)
+        self._stats = {rel_path: (entry['size'], entry['mtime_ns']) for rel_path, entry in fingerprints.items()}
+
+    def _save(self, fingerprints, chunks):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'format': INDEX_FORMAT, 'sources': fingerprints, 'chunks': chunks,
+                           'built_at': time.strftime('%Y-%m-%d %H:%M:%S')}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # read-only deploy: the in-memory index still works
+
+    def _set_chunks(self, chunks):
+        self.chunks = chunks
+        self._lengths = [sum(chunk['terms'].values()) for chunk in chunks]
+        self._avg_length = (sum(self._lengths) / len(chunks)) if chunks else 0.0
+        postings = {}
+        for i, chunk in enumerate(chunks):
+            for term, tf in chunk['terms'].items():
+                postings.setdefault(term, []).append((i, tf))
+        self._postings = postings
+        n = len(chunks)
+        self._idf = {term: math.log(1 + (n - len(hits) + 0.5) / (len(hits) + 0.5)) for term, hits in postings.items()}
+
+    def refresh(self):
+        """Rebuild if a source file changed since the index was loaded (a few stat calls when nothing did)"""
+        current = {}
+        for rel_path in self.sources:
+            try:
+                stat = (BASE_DIR / rel_path).stat()
+            except OSError:
+                continue
+            current[rel_path] = (stat.st_size, stat.st_mtime_ns)
+        if current != self._stats:
+            self._load_or_build()
+
+    def search(self, query, k=DEFAULT_TOP_K, min_score=MIN_SCORE):
+        """Top-k chunks for `query` scoring at least min_score, as (score, chunk) pairs, best first"""
+        with self._lock:  # shared by every session; a rebuild swaps the postings underneath
+            self.refresh()
+            scores = {}
+            for term in set(tokenize(query)):
+                idf = self._idf.get(term)
+                if idf is None:
+                    continue
+                for i, tf in self._postings[term]:
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[i] / self._avg_length)
+                    scores[i] = scores.get(i, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+            best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+            return [(score, self.chunks[i]) for i, score in best if score >= min_score]
+
+
+def format_excerpt(chunk):
+    return f"Report excerpt ({chunk['heading']}):\n{chunk['text']}"
+
+
+if __name__ == '__main__':
+    import sys
+
+    index = ReportIndex()
+    print(f"✅ {len(index.chunks)} chunks from {len(index._stats)} source(s) -> {index.path}")
+    if len(sys.argv) > 1:
+        for score, chunk in index.search(' '.join(sys.argv[1:])):
+            print(f"\n🔎 {score:.2f}  {chunk['heading']}\n{chunk['text']}")
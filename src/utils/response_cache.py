@@ -0,0 +1,125 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import numpy as np
+from pathlib import Path
+
+# Disk-backed cache of AI answers shared by every session (and every worker on the host).
+# Exact hits are keyed on (model, system context, normalized question, trimmed history);
+# near-duplicate questions can optionally be matched by embedding similarity within the same scope.
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+CACHE_PATH = BASE_DIR / 'data' / 'cache' / 'ai_responses.sqlite3'
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+
+def normalize_question(question):
+    """Lowercase, drop emoji/punctuation and collapse whitespace"""
+    question = re.sub(r"[^\w\s%$.-]", " ", str(question).lower())
+    return re.sub(r"\s+", " ", question).strip(" .")
+
+
+def _sha256(payload):
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+def response_cache_key(model, system_context, question, history):
+    """Return (key, scope): the exact-match key and the context scope used for similarity lookups"""
+    scope = _sha256([model, system_context, history])
+    return _sha256([scope, normalize_question(question)]), scope
+
+
+class ResponseCache:
+    def __init__(self, path=CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT NOT NULL,
+                    question TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    embedding BLOB,
+                    created_at REAL NOT NULL,
+                    last_hit REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_hit ON responses (last_hit)")
+
+    def _touch(self, key, now):
+        self._conn.execute("UPDATE responses SET last_hit = ?, hits = hits + 1 WHERE key = ?", (now, key))
+
+    def get(self, key):
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT response FROM responses WHERE key = ? AND created_at >= ?",
+                    (key, now - self.ttl_seconds)).fetchone()
+                if row is None:
+                    return None
+                self._touch(key, now)
+                return row[0]
+        except sqlite3.Error:
+            return None
+
+    def find_similar(self, scope, embedding, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+        """Best cached answer in `scope` whose question embedding has cosine similarity >= threshold"""
+        now = time.time()
+        query = np.asarray(embedding, dtype='float32')
+        query = query / (np.linalg.norm(query) or 1.0)
+        try:
+            with self._lock, self._conn:
+                rows = self._conn.execute(
+                    "SELECT key, response, embedding FROM responses "
+                    "WHERE scope = ? AND embedding IS NOT NULL AND created_at >= ?",
+                    (scope, now - self.ttl_seconds)).fetchall()
+                if not rows:
+                    return None
+                matrix = np.vstack([np.frombuffer(row[2], dtype='float32') for row in rows])
+                scores = matrix @ query / np.maximum(np.linalg.norm(matrix, axis=1), 1e-12)
+                best = int(np.argmax(scores))
+                if scores[best] < threshold:
+                    return None
+                self._touch(rows[best][0], now)
+                return rows[best][1]
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def put(self, key, scope, question, response, embedding=None):
+        now = time.time()
+        blob = None if embedding is None else np.asarray(embedding, dtype='float32').tobytes()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, scope, question, response, embedding, created_at, last_hit, hits) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                    (key, scope, normalize_question(question), response, blob, now, now))
+                self._evict(now)
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, now):
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        if count > self.max_entries:
+            # Least recently used answers go first
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_hit ASC LIMIT ?)",
+                (count - self.max_entries,))
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,104 @@
+import functools
+import inspect
+import numpy as np
+import pandas as pd
+
+# Process-wide datasets (st.cache_resource) reach every session as the same objects, never copies.
+# freeze() write-protects the shared buffers so an in-place edit fails loudly instead of leaking
+# into every other session. The dashboard also turns on Copy-on-Write at startup (see
+# enable_copy_on_write), which makes each slice or filter of them a cheap view that is only copied
+# if a session writes to it; the protection here holds with or without it.
+
+
+READ_ONLY_MESSAGE = "Shared dataset is read-only; take .copy() before modifying it"
+
+
+class _ReadOnlyIndexer:
+    """.loc/.iloc/.at/.iat for reading only"""
+
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __call__(self, axis=None):
+        # .loc(axis=...) returns a new indexer, which pandas itself uses (e.g. dropna(subset=...))
+        return _ReadOnlyIndexer(self._indexer(axis))
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    def __getattr__(self, name):
+        return getattr(self._indexer, name)  # pandas reaches into indexers internally
+
+    def __setitem__(self, key, value):
+        raise TypeError(READ_ONLY_MESSAGE)
+
+
+class ReadOnlyFrame(pd.DataFrame):
+    """A shared dataset: no assignment, axis relabelling or inplace=True, and frames derived from it are plain DataFrames.
+
+    The indexers need guarding too: under Copy-on-Write a write through .loc/.iloc to a frame that
+    has views copies the frame's own buffers first, which would still change it for every session.
+    inplace=True is refused before pandas runs, since some methods (rename) relabel the frame first.
+    """
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(READ_ONLY_MESSAGE)
+
+    __setitem__ = __delitem__ = insert = _update_inplace = _set_axis = _read_only
+
+    def __setattr__(self, name, value):
+        if name in ('columns', 'index'):
+            raise TypeError(READ_ONLY_MESSAGE)
+        super().__setattr__(name, value)
+
+    def _set_axis_nocheck(self, labels, axis, inplace, copy):
+        if inplace:
+            raise TypeError(READ_ONLY_MESSAGE)
+        return super()._set_axis_nocheck(labels, axis, inplace, copy)
+
+    loc = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.loc.fget(self)))
+    iloc = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.iloc.fget(self)))
+    at = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.at.fget(self)))
+    iat = property(lambda self: _ReadOnlyIndexer(pd.DataFrame.iat.fget(self)))
+
+
+def _refuse_inplace(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if kwargs.get('inplace'):
+            raise TypeError(READ_ONLY_MESSAGE)
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+# Every public DataFrame method that takes inplace= (keyword-only in pandas 2: rename, reset_index, fillna, ...)
+for _name, _method in inspect.getmembers(pd.DataFrame, inspect.isfunction):
+    if not _name.startswith('_') and 'inplace' in inspect.signature(_method).parameters:
+        setattr(ReadOnlyFrame, _name, _refuse_inplace(_method))
+
+
+def enable_copy_on_write():
+    """Turn on pandas Copy-on-Write for the whole process (the default from pandas 3).
+
+    An app-startup setting, not an import side effect: call it once before any frames are built.
+    """
+    pd.set_option('mode.copy_on_write', True)
+
+
+def freeze(frame, copy=True):
+    """Read-only version of `frame` whose numpy buffers reject writes.
+
+    copy=False skips the defensive copy and write-protects `frame`'s own buffers, for frames that
+    were just built and that nothing else holds.
+    """
+    frame = ReadOnlyFrame(frame.copy(deep=True) if copy else frame)
+    for block in frame._mgr.blocks:
+        # Categorical codes and other numpy-backed extension arrays keep their buffer in _ndarray
+        values = getattr(block.values, '_ndarray', block.values)
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+    return frame
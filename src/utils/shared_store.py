@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+import time
+import pyarrow as pa
+from src.utils.columnar_cache import BASE_DIR
+from src.utils.shared_frames import freeze
+
+# Base datasets shared by every Streamlit worker on the host. One worker publishes each dataset
+# version as Arrow IPC files under data/cache/shared/<version>/ and then swaps the CURRENT pointer
+# (write + os.replace, so readers see the old or the new version, never a mix). Workers attach by
+# memory-mapping the files: numeric and categorical columns become numpy arrays over the shared
+# page-cache pages (zero-copy, read-only); only string labels and bools are materialized per worker.
+# The version is data_loader.base_version() (source CSV hashes + builder code), so the first worker to
+# see a refreshed source republishes; publish ahead of a deploy with:  python -m src.utils.shared_store
+
+SHARED_DIR = BASE_DIR / 'data' / 'cache' / 'shared'
+POINTER_PATH = SHARED_DIR / 'CURRENT'
+KEEP_VERSIONS = 2  # the current version plus the one workers may still have mapped
+
+
+def current():
+    """The published pointer {'version', 'datasets': {name: file}, 'published_at'}, or None"""
+    try:
+        with open(POINTER_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def current_version():
+    pointer = current()
+    return pointer['version'] if pointer else None
+
+
+def _write_table(path, frame):
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with pa.OSFile(str(tmp_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def _prune(keep):
+    versions = sorted((path for path in SHARED_DIR.iterdir() if path.is_dir()), key=lambda path: path.stat().st_mtime)
+    for path in versions[:-KEEP_VERSIONS]:
+        if path.name != keep:
+            # Workers that still map these files keep their pages (POSIX); elsewhere the delete just fails
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def publish(version, frames, problems=()):
+    """Write {name: DataFrame} as `version` and point CURRENT at it; a no-op when already current.
+
+    `problems` (source load messages) travel in the pointer so attaching workers can show them too.
+    """
+    pointer = current()
+    if pointer and pointer['version'] == version:
+        return pointer
+
+    version_dir = SHARED_DIR / version
+    version_dir.mkdir(parents=True, exist_ok=True)
+    datasets = {}
+    for name, frame in frames.items():
+        path = version_dir / f'{name}.arrow'
+        if not path.exists():  # another worker may have written this version already
+            _write_table(path, frame)
+        datasets[name] = f'{version}/{path.name}'
+
+    pointer = {'version': version, 'datasets': datasets, 'problems': list(problems),
+               'published_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+    tmp_path = POINTER_PATH.with_name(f'CURRENT.{os.getpid()}.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(pointer, f, indent=2)
+    os.replace(tmp_path, POINTER_PATH)
+    _prune(keep=version)
+    return pointer
+
+
+def attach(pointer=None):
+    """{name: read-only DataFrame} memory-mapped from the published version (CURRENT by default)"""
+    pointer = pointer or current()
+    if pointer is None:
+        return None
+    frames = {}
+    for name, rel_path in pointer['datasets'].items():
+        with pa.memory_map(str(SHARED_DIR / rel_path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+        # split_blocks keeps each column on its own Arrow buffer instead of consolidating into a copy
+        frames[name] = freeze(table.to_pandas(split_blocks=True), copy=False)
+    return frames
+
+
+if __name__ == '__main__':
+    from src.utils.data_loader import build_base_datasets, base_version
+
+    pointer = publish(base_version(), *build_base_datasets())
+    print(f"✅ Published {pointer['version']}: {', '.join(pointer['datasets'])}")
+    for problem in pointer['problems']:
+        print(f"⚠️ {problem}")
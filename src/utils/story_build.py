@@ -0,0 +1,92 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+import pandas as pd
+import plotly
+
+# Dependency tracking for the unified story build. Every artifact records the input indicators,
+# code and upstream artifacts it was built from (as content hashes) in a manifest next to the
+# outputs; a re-run only rebuilds artifacts whose recorded hashes no longer match.
+
+MANIFEST_PATH = 'output/.story_build.json'
+MANIFEST_VERSION = 1
+
+
+def _sha256(payload):
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def indicator_hashes(source, frames, indicators):
+    """{'<source>::<indicator>': content hash} over each indicator's (year, value) rows, from {indicator: frame}.
+
+    Values are hashed at 12 significant digits so CSV round-trip noise does not count as a change.
+    """
+    hashes = {}
+    for indicator in indicators:
+        rows = frames.get(indicator)
+        if rows is None or rows.empty:
+            digest = 'missing'
+        else:
+            rows = rows[['year', 'value']].sort_values('year')
+            rows = rows.assign(value=rows['value'].map('{:.12g}'.format)).reset_index(drop=True)
+            row_hashes = pd.util.hash_pandas_object(rows, index=False)
+            digest = hashlib.sha256(row_hashes.values.tobytes()).hexdigest()
+        hashes[f"{source}::{indicator}"] = digest
+    return hashes
+
+
+def code_hash(*parts):
+    """Hash of function/method source plus any plain constants, tied to the plotly version"""
+    payload = [plotly.__version__]
+    for part in parts:
+        payload.append(inspect.getsource(part) if callable(part) else part)
+    return _sha256(payload)
+
+
+def artifact_digest(entry):
+    """Stable fingerprint of a built artifact, used as the dependency of downstream artifacts"""
+    return _sha256([entry.get('deps'), entry.get('insights')])
+
+
+class BuildManifest:
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.artifacts = {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.artifacts = data.get('artifacts', {})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, name):
+        return self.artifacts.get(name)
+
+    def stale_reasons(self, name, deps, outputs):
+        """Why `name` needs rebuilding; an empty list means it is up to date"""
+        entry = self.artifacts.get(name)
+        if entry is None:
+            return ["not built yet"]
+        expected = list(dict.fromkeys(list(outputs) + entry.get('outputs', [])))
+        reasons = [f"missing output {path}" for path in expected if not os.path.exists(path)]
+        old = entry.get('deps', {})
+        if old.get('code') != deps.get('code'):
+            reasons.append("code changed")
+        for group in ('indicators', 'artifacts'):
+            before, now = old.get(group, {}), deps.get(group, {})
+            reasons.extend(f"{group[:-1]} changed: {key}" for key in sorted(now) if before.get(key) != now[key])
+        return reasons
+
+    def record(self, name, deps, outputs, **extra):
+        self.artifacts[name] = dict(deps=deps, outputs=list(outputs),
+                                    built_at=time.strftime('%Y-%m-%d %H:%M:%S'), **extra)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'artifacts': self.artifacts}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,223 @@
+import argparse
+import io
+import json
+import os
+import re
+import time
+import zipfile
+import numpy as np
+import pandas as pd
+from src.utils.columnar_cache import BASE_DIR, DATASETS, store_dataset
+from src.utils.indicator_store import DEFAULT_COUNTRY
+
+# Offline World Bank ingestion: builds data/raw/wb_combined_indicators.csv (long format) from bulk
+# downloads dropped into data/raw/wb_bulk/ -- per-indicator API_<code>_DS2_*.zip archives, the full
+# WDI_CSV.zip (WDICSV.csv / WDIData.csv), or those CSVs unzipped. Files are read in bounded chunks
+# (iter_long_chunks) keeping only the requested indicators and countries, so the multi-hundred-MB
+# WDI bulk CSV never sits in memory. A refresh skips archives that are unchanged since the last run,
+# appends rows for new (country, indicator, year) keys and only rewrites the file when the World
+# Bank revised a value we already hold; the dashboard's indicator store is updated from the same rows.
+# Run with:  python -m src.utils.wb_ingest [--countries IND,CHN,...] [--indicators ...]
+
+BULK_DIR = BASE_DIR / 'data' / 'raw' / 'wb_bulk'
+OUTPUT_PATH = BASE_DIR / 'data' / 'raw' / 'wb_combined_indicators.csv'
+STORE_SOURCE = BASE_DIR / DATASETS['wb_indicators']['source']  # what load_dataset('wb_indicators') caches
+STATE_FILE = '.ingested.json'
+
+# What the dashboard (data_loader.WB_SERIES) and the story (REPORT_INDICATORS) read
+DEFAULT_INDICATORS = ['NY.GDP.MKTP.KD.ZG', 'NY.GDP.MKTP.CD', 'SL.TLF.TOTL.IN', 'SL.UEM.TOTL.ZS', 'NE.EXP.GNFS.ZS']
+# India plus its reference export peers (unified_msme_story.FALLBACK_PEER_SHARES)
+DEFAULT_COUNTRIES = ['IND', 'CHN', 'VNM', 'THA', 'MYS', 'IDN']
+
+COLUMNS = ['country_code', 'country_name', 'indicator', 'year', 'value']
+KEY = ['country_code', 'indicator', 'year']
+ID_COLUMNS = ['Country Code', 'Country Name', 'Indicator Code']
+YEAR_COLUMN = re.compile(r'^\d{4}$')
+API_ARCHIVE = re.compile(r'^API_(.+?)_DS2_')
+CHUNK_ROWS = 20_000
+
+
+def _data_members(archive):
+    """Wide data CSVs inside a bulk zip (skips the Metadata_*.csv sidecars)"""
+    return [name for name in archive.namelist()
+            if name.lower().endswith('.csv') and not os.path.basename(name).startswith('Metadata_')
+            and not os.path.basename(name).lower().startswith(('wdicountry', 'wdiseries', 'wdifootnote'))]
+
+
+def _records(stream, needles):
+    """Raw CSV records that mention any of `needles`, re-joining quoted fields that span lines"""
+    pending = ''
+    for line in stream:
+        line = pending + line
+        if line.count('"') % 2:
+            pending = line
+            continue
+        pending = ''
+        if any(needle in line for needle in needles):
+            yield line
+
+
+def _melt_chunk(header_line, records, indicators, countries):
+    chunk = pd.read_csv(io.StringIO(header_line + ''.join(records)), dtype=dict.fromkeys(ID_COLUMNS, str),
+                        usecols=lambda column: column in ID_COLUMNS or YEAR_COLUMN.match(column) is not None)
+    # The substring pre-filter can match inside other fields; this is the exact selection
+    keep = chunk['Indicator Code'].isin(indicators)
+    if countries:
+        keep &= chunk['Country Code'].isin(countries)
+    long = chunk[keep].melt(id_vars=ID_COLUMNS, var_name='year', value_name='value').dropna(subset=['value'])
+    long = long.rename(columns=dict(zip(ID_COLUMNS, ['country_code', 'country_name', 'indicator'])))
+    return long.astype({'year': 'int64', 'value': 'float64'})[COLUMNS]
+
+
+def iter_long_chunks(stream, indicators, countries, chunk_rows=CHUNK_ROWS):
+    """Long-format frames (COLUMNS) for the requested rows of a wide WB CSV, at most chunk_rows records at a time.
+
+    API downloads open with a few lines of preamble before the 'Country Name' header; WDI bulk
+    files start with it. Records that don't even contain a requested indicator code are dropped
+    before parsing, so pandas only tokenizes candidate rows; memory is bounded by chunk_rows.
+    """
+    for header_line in stream:
+        if header_line.lstrip('"').startswith('Country Name'):
+            break
+    else:
+        return
+    if not header_line.endswith('\n'):
+        header_line += '\n'
+    records = []
+    for record in _records(stream, indicators):
+        records.append(record)
+        if len(records) >= chunk_rows:
+            yield _melt_chunk(header_line, records, indicators, countries)
+            records = []
+    if records:
+        yield _melt_chunk(header_line, records, indicators, countries)
+
+
+def read_bulk_file(path, indicators, countries):
+    """Stream one archive or CSV; returns its matching rows in long format"""
+    match = API_ARCHIVE.match(path.name)
+    if match and match.group(1) not in indicators:
+        return _empty()  # per-indicator download for something we don't track
+    chunks = []
+    if path.suffix.lower() == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            for member in _data_members(archive):
+                with archive.open(member) as raw:
+                    chunks.extend(iter_long_chunks(io.TextIOWrapper(raw, encoding='utf-8-sig', newline=''),
+                                                   indicators, countries))
+    else:
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            chunks.extend(iter_long_chunks(f, indicators, countries))
+    return pd.concat(chunks, ignore_index=True) if chunks else _empty()
+
+
+def _read_state(bulk_dir):
+    try:
+        with open(bulk_dir / STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(bulk_dir, state):
+    tmp_path = bulk_dir / f'{STATE_FILE}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, bulk_dir / STATE_FILE)
+
+
+def _covers(ingested, requested):
+    # An empty country list means every country
+    return not ingested or (bool(requested) and requested <= set(ingested))
+
+
+def _empty():
+    return pd.DataFrame(columns=COLUMNS).astype({'year': 'int64', 'value': 'float64'})
+
+
+def _read_existing(output_path):
+    """(rows, legacy): legacy single-country extracts (no country_code) are India's and get upgraded"""
+    if not output_path.exists():
+        return _empty(), False
+    existing = pd.read_csv(output_path, dtype={'country_code': str, 'country_name': str, 'indicator': str})
+    legacy = 'country_code' not in existing.columns
+    if legacy:
+        existing = existing.assign(country_code=DEFAULT_COUNTRY, country_name='India')
+    return existing[COLUMNS], legacy
+
+
+def _write_frame(frame, output_path):
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    frame.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, output_path)
+
+
+def ingest(bulk_dir=BULK_DIR, output_path=OUTPUT_PATH, indicators=DEFAULT_INDICATORS, countries=DEFAULT_COUNTRIES,
+           full=False):
+    """Merge the requested rows of every new or changed bulk file into output_path; returns a summary dict"""
+    if not bulk_dir.is_dir():
+        raise FileNotFoundError(f"{bulk_dir} not found: download World Bank bulk CSV archives into it first")
+    indicators, countries = set(indicators), set(countries or ())
+    state = {} if full else _read_state(bulk_dir)
+    summary = {'scanned': [], 'skipped': [], 'added': 0, 'revised': 0}
+
+    frames = []
+    for path in sorted(bulk_dir.iterdir()):
+        if path.suffix.lower() not in ('.zip', '.csv') or path.name.startswith('.'):
+            continue
+        stat = path.stat()
+        entry = state.get(path.name)
+        if (entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
+                and indicators <= set(entry['indicators']) and _covers(entry['countries'], countries)):
+            summary['skipped'].append(path.name)
+            continue
+        frames.append(read_bulk_file(path, indicators, countries))
+        summary['scanned'].append(path.name)
+        state[path.name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                            'indicators': sorted(indicators), 'countries': sorted(countries),
+                            'ingested_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+
+    frames = [frame for frame in frames if len(frame)]
+    if frames:
+        incoming = pd.concat(frames, ignore_index=True).drop_duplicates(KEY, keep='last')
+        existing, legacy = (_empty(), False) if full else _read_existing(output_path)
+        merged = incoming.merge(existing[KEY + ['value']], on=KEY, how='left', suffixes=('', '_old'), indicator=True)
+        new_rows = merged[merged['_merge'] == 'left_only'][COLUMNS]
+        held = merged[merged['_merge'] == 'both']
+        revised = held[~np.isclose(held['value'], held['value_old'].astype('float64'), rtol=1e-12, atol=0)]
+        summary['added'], summary['revised'] = len(new_rows), len(revised)
+
+        combined = pd.concat([frame for frame in (existing, incoming) if len(frame)]).drop_duplicates(KEY, keep='last')
+        if full or legacy or not output_path.exists() or len(revised):
+            combined = combined.sort_values(KEY).reset_index(drop=True)
+            _write_frame(combined, output_path)
+        elif len(new_rows):
+            # Only new keys: append instead of rewriting the file
+            new_rows.sort_values(KEY).to_csv(output_path, mode='a', header=False, index=False)
+            combined = pd.concat([existing, new_rows.sort_values(KEY)], ignore_index=True)
+
+        if (len(new_rows) or len(revised) or legacy) and output_path.resolve() == STORE_SOURCE.resolve():
+            # Hand the rows straight to the dashboard's indicator store instead of having it re-parse the CSV
+            store_dataset('wb_indicators', combined)
+
+    _write_state(bulk_dir, state)
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the World Bank long-format extract from bulk downloads")
+    parser.add_argument('--bulk-dir', default=str(BULK_DIR), help="Directory holding API_*.zip / WDI_CSV.zip / CSVs")
+    parser.add_argument('--output', default=str(OUTPUT_PATH))
+    parser.add_argument('--indicators', default=','.join(DEFAULT_INDICATORS), help="Comma-separated indicator codes")
+    parser.add_argument('--countries', default=','.join(DEFAULT_COUNTRIES),
+                        help="Comma-separated ISO3 codes, or 'all'")
+    parser.add_argument('--full', action='store_true', help="Ignore previous runs and rebuild the output from scratch")
+    args = parser.parse_args()
+
+    from pathlib import Path
+    countries = [] if args.countries == 'all' else args.countries.split(',')
+    result = ingest(Path(args.bulk_dir), Path(args.output), args.indicators.split(','), countries, args.full)
+    print(f"✅ Scanned {len(result['scanned'])} bulk file(s), skipped {len(result['skipped'])} unchanged")
+    print(f"📊 {result['added']} new rows, {result['revised']} revised values -> {args.output}")
+    if result['added'] or result['revised']:
+        print("↻ Running dashboards republish their shared datasets on the next rerun")
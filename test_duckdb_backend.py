@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+from src.utils import duckdb_backend
+
+pytestmark = pytest.mark.skipif(not duckdb_backend.available(), reason="duckdb is not installed")
+
+
+def frames(growth):
+    return {
+        'economic': pd.DataFrame({'Year': [2022, 2023], 'GDP_Growth': [growth, growth + 1.0],
+                                  'Labor_Force_Million': [500.0, 510.0], 'Exports_Percent_GDP': [21.0, 22.0],
+                                  'Digital_Adoption': [40, 45]}),
+    }
+
+
+def test_sync_twice_with_different_versions(tmp_path):
+    first = duckdb_backend.DuckDBBackend(tmp_path)
+    assert 'economic' in first.sync(frames(6.0), 'v1')
+
+    # The first backend stays attached read-only, as a cached worker backend would after a refresh
+    second = duckdb_backend.DuckDBBackend(tmp_path)
+    assert 'economic' in second.sync(frames(7.0), 'v2')
+
+    assert second.path != first.path
+    assert second.current()['file'] == second.path.name
+    assert second.economic_series()['GDP_Growth'].tolist() == [7.0, 8.0]
+    assert first.economic_series()['GDP_Growth'].tolist() == [6.0, 7.0]
+
+
+def test_sync_reuses_the_published_file(tmp_path):
+    first = duckdb_backend.DuckDBBackend(tmp_path)
+    first.sync(frames(6.0), 'v1')
+    again = duckdb_backend.DuckDBBackend(tmp_path)
+    assert again.sync(frames(6.0), 'v1') == []
+    assert again.path == first.path
+    assert again.sources_version == first.sources_version
+
+
+def test_old_versions_are_pruned(tmp_path):
+    backends = [duckdb_backend.DuckDBBackend(tmp_path) for _ in range(4)]
+    for i, backend in enumerate(backends):
+        backend.sync(frames(float(i)), f'v{i}')
+    assert len(list(tmp_path.glob('analytics-*.duckdb'))) == duckdb_backend.KEEP_VERSIONS
+    assert backends[-1].economic_series()['GDP_Growth'].tolist() == [3.0, 4.0]
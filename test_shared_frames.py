@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils.shared_frames import ReadOnlyFrame, freeze
+
+
+@pytest.fixture
+def shared():
+    frame = pd.DataFrame({'state': ['A', 'B', 'C'], 'value': [1.0, np.nan, 3.0]}).astype({'state': 'category'})
+    return frame, freeze(frame)
+
+
+def assert_unchanged(frame, frozen):
+    pd.testing.assert_frame_equal(pd.DataFrame(frozen), frame)
+
+
+@pytest.mark.parametrize('write', [
+    lambda f: f.__setitem__('value', 0.0),
+    lambda f: f.__delitem__('value'),
+    lambda f: f.insert(0, 'extra', 1),
+    lambda f: f.loc.__setitem__((0, 'value'), 9.0),
+    lambda f: f.iloc.__setitem__((0, 1), 9.0),
+    lambda f: f.at.__setitem__((0, 'value'), 9.0),
+    lambda f: setattr(f, 'columns', ['x', 'y']),
+    lambda f: setattr(f, 'index', [7, 8, 9]),
+    lambda f: f.rename(columns={'value': 'renamed'}, inplace=True),
+    lambda f: f.reset_index(drop=True, inplace=True),
+    lambda f: f.set_index('state', inplace=True),
+    lambda f: f.fillna(0.0, inplace=True),
+    lambda f: f.dropna(inplace=True),
+    lambda f: f.sort_values('value', ascending=False, inplace=True),
+    lambda f: f.rename_axis('row', inplace=True),
+    lambda f: f._set_axis_nocheck(['x', 'y'], 1, True, False),
+], ids=['setitem', 'delitem', 'insert', 'loc', 'iloc', 'at', 'columns', 'index', 'rename', 'reset_index',
+        'set_index', 'fillna', 'dropna', 'sort_values', 'rename_axis', 'set_axis_nocheck'])
+def test_writes_are_refused(shared, write):
+    frame, frozen = shared
+    with pytest.raises(TypeError, match='read-only'):
+        write(frozen)
+    assert_unchanged(frame, frozen)
+
+
+def test_buffers_are_write_protected(shared):
+    _, frozen = shared
+    with pytest.raises(ValueError):
+        frozen['value'].to_numpy()[0] = 9.0
+
+
+def test_reads_and_derived_frames_work(shared):
+    frame, frozen = shared
+    assert len(frozen.dropna(subset=['value'])) == 2
+    assert len(frozen.loc(axis=0)[0:1]) == 2
+    assert list(frozen.set_axis(['x', 'y'], axis=1).columns) == ['x', 'y']
+    derived = frozen.rename(columns={'value': 'renamed'}).reset_index(drop=True)
+    assert type(derived) is pd.DataFrame
+    derived['renamed'] = 0.0
+    derived.columns = ['a', 'b']
+    assert_unchanged(frame, frozen)
+    assert isinstance(frozen, ReadOnlyFrame)
@@ -12,8 +12,15 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.io as pio
+import os
 import warnings
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from src.utils import html_export
+from src.utils.image_cache import IMAGE_TIERS, SAVE_OPTIONS, write_image_tiers
+from src.utils.story_build import BuildManifest, artifact_digest, code_hash, indicator_hashes
 
 warnings.filterwarnings('ignore')
 
@@ -26,23 +33,705 @@ STORY_COLORS = {
     'neutral': '#7f7f7f'        # Gray - Supporting data
 }
 
+# Period boundaries used to colour yearly points: (last year of the period, STORY_COLORS key).
+# The final period is open-ended.
+GDP_PERIODS = [(2013, 'foundation'), (2019, 'growth'), (2020, 'challenge'), (None, 'opportunity')]
+EXPORT_PERIODS = [(2014, 'foundation'), (2020, 'challenge'), (None, 'growth')]  # India: 2015-19 decline + COVID
+COVID_EXPORT_PERIODS = [(2019, 'foundation'), (2020, 'challenge'), (None, 'growth')]  # other economies
+
+
+def period_colors(years, periods):
+    """Colour every year by the period it falls in, in one pd.cut pass"""
+    bins = [-np.inf] + [end for end, _ in periods[:-1]] + [np.inf]
+    labels = [STORY_COLORS[key] for _, key in periods]
+    return np.asarray(pd.cut(np.asarray(years), bins=bins, labels=labels, ordered=False), dtype=object).tolist()
+
+
+def export_periods(code):
+    """EXPORT_PERIODS tells India's export story; other economies only get the COVID split"""
+    return EXPORT_PERIODS if code == DEFAULT_COUNTRY else COVID_EXPORT_PERIODS
+
+
+def covid_shock(gdp_data, shock_year=2020, rebound_years=2):
+    """(year, growth) of the COVID trough and of the strongest rebound after it, or None when there was none.
+
+    The trough is the lowest growth in `shock_year` or the year after, and only counts if growth
+    actually fell below the year before the shock; the rebound is the highest in the
+    `rebound_years` that follow it.
+    """
+    observed = gdp_data.dropna(subset=['value'])
+    before = observed.loc[observed['year'] == shock_year - 1, 'value']
+    window = observed[observed['year'].between(shock_year, shock_year + 1)]
+    if before.empty or window.empty:
+        return None
+    trough = window.loc[window['value'].idxmin()]
+    if trough['value'] >= before.iloc[0]:
+        return None
+    after = observed[observed['year'].between(trough['year'] + 1, trough['year'] + rebound_years)]
+    if after.empty:
+        return None
+    rebound = after.loc[after['value'].idxmax()]
+    return (int(trough['year']), float(trough['value'])), (int(rebound['year']), float(rebound['value']))
+
+
+def split_indicators(wb_data):
+    """{indicator: its rows sorted by year}, computed once so chapters never re-filter the long frame"""
+    return {indicator: group.sort_values('year').reset_index(drop=True)
+            for indicator, group in wb_data.groupby('indicator', sort=False, observed=True)}
+
+
+def indicator_frame(frames, indicator):
+    return frames.get(indicator, pd.DataFrame(columns=['indicator', 'year', 'value']))
+
+
+def value_at(frame, year):
+    """Value for `year`, or the latest earlier observation when that year is not published yet"""
+    return frame.loc[frame['year'] <= year, 'value'].iloc[-1]
+
+
+DEFAULT_COUNTRY = 'IND'
+COUNTRY_NAMES = {'IND': 'India', 'CHN': 'China', 'VNM': 'Vietnam', 'THA': 'Thailand',
+                 'MYS': 'Malaysia', 'IDN': 'Indonesia'}
+
+# Chapter 3 "Global Market Position" compares the focus economy with the PEER_COUNT economies in the
+# extract closest to it in GDP. India's legacy single-country extract has nobody to compare against,
+# so India alone falls back to these reference export shares (% of GDP) of its regional peers.
+PEER_COUNT = 5
+FALLBACK_PEER_SHARES = {'CHN': 35.2, 'VNM': 95.8, 'THA': 68.4, 'MYS': 73.1, 'IDN': 21.9}
+
+
+def latest_values(wb_data, indicator):
+    """{country_code: latest value of `indicator`} across a multi-country extract"""
+    if 'country_code' not in wb_data.columns:
+        return {}
+    rows = wb_data[wb_data['indicator'] == indicator].dropna(subset=['value']).sort_values('year')
+    return rows.groupby('country_code', observed=True)['value'].last().to_dict()
+
+
+def size_peers(code, candidates, gdp_usd, count=PEER_COUNT):
+    """The `count` candidates closest to `code` in GDP (log scale), nearest first; extract order without GDP data"""
+    size = gdp_usd.get(code)
+    if not size or size <= 0:
+        return list(candidates)[:count]
+
+    def distance(peer):
+        other = gdp_usd.get(peer)
+        return abs(np.log(other / size)) if other and other > 0 else np.inf
+    return sorted(candidates, key=distance)[:count]
+
+
+def story_country(code=DEFAULT_COUNTRY, name=None, export_shares=None, names=None, gdp_usd=None):
+    """Narrative context for one economy: its display name and the export-share peers for chapter 3.
+
+    export_shares/gdp_usd ({ISO3: latest value}, see latest_values) come from a multi-country extract
+    and the peers are the economies in it nearest in size; without them only India gets peers, from
+    FALLBACK_PEER_SHARES. `names` ({ISO3: display name}, e.g. the extract's country_name) overrides COUNTRY_NAMES.
+    """
+    names = {**COUNTRY_NAMES, **(names or {})}
+    if export_shares:
+        shares = {peer: share for peer, share in export_shares.items() if peer != code}
+    else:
+        shares = FALLBACK_PEER_SHARES if code == DEFAULT_COUNTRY else {}
+    peers = size_peers(code, shares, gdp_usd or {})
+    return {
+        'code': code,
+        'name': name or names.get(code, code),
+        'peers': [(names.get(peer, peer), round(float(shares[peer]), 1)) for peer in peers],
+    }
+
+
+def extract_countries(wb_data):
+    """(export_shares, gdp_usd, names) for story_country() from a multi-country extract"""
+    names = {}
+    if 'country_name' in wb_data.columns:
+        names = wb_data.drop_duplicates('country_code').set_index('country_code')['country_name'].to_dict()
+    return latest_values(wb_data, 'NE.EXP.GNFS.ZS'), latest_values(wb_data, 'NY.GDP.MKTP.CD'), names
+
+
+def build_chapter_1_foundation(frames, country=None):
+    """Chapter 1: The Economic Foundation Sets the Stage (2010-2024)"""
+    country = country or story_country()
+    print("\n📖 Chapter 1: Building the Economic Foundation...")
+
+    # Create a focused foundation story
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=(
+            'GDP Growth: The Resilience Story',
+            'Labor Force: The Demographic Dividend',
+            'Economic Size: Growing Market Power',
+            'Key Milestones: Critical Inflection Points'
+        ),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"secondary_y": False}]]
+    )
+
+    # GDP Growth Story with clear narrative
+    gdp_data = indicator_frame(frames, 'NY.GDP.MKTP.KD.ZG')
+
+    # Color code the periods for storytelling: foundation, growth, COVID challenge, recovery
+    colors = period_colors(gdp_data['year'], GDP_PERIODS)
+
+    fig.add_trace(
+        go.Scatter(
+            x=gdp_data['year'],
+            y=gdp_data['value'],
+            mode='lines+markers',
+            name='GDP Growth %',
+            line=dict(color=STORY_COLORS['foundation'], width=3),
+            marker=dict(size=8, color=colors),
+            hovertemplate='<b>%{x}</b><br>GDP Growth: %{y:.1f}%<extra></extra>'
+        ),
+        row=1, col=1
+    )
+
+    # Annotate this economy's own COVID trough and rebound
+    shock = covid_shock(gdp_data)
+    if shock:
+        (trough_year, trough), (rebound_year, rebound) = shock
+        fig.add_annotation(x=trough_year, y=trough, text="COVID Impact",
+                          showarrow=True, arrowcolor=STORY_COLORS['challenge'],
+                          row=1, col=1)
+        fig.add_annotation(x=rebound_year, y=rebound, text="Recovery",
+                          showarrow=True, arrowcolor=STORY_COLORS['growth'],
+                          row=1, col=1)
+
+    # Labor Force Growth
+    labor_data = indicator_frame(frames, 'SL.TLF.TOTL.IN')
+    labor_data = labor_data.assign(labor_millions=labor_data['value'] / 1000000)
+
+    fig.add_trace(
+        go.Scatter(
+            x=labor_data['year'],
+            y=labor_data['labor_millions'],
+            mode='lines+markers',
+            name='Labor Force (Millions)',
+            line=dict(color=STORY_COLORS['growth'], width=3),
+            marker=dict(size=8),
+            fill='tonexty',
+            fillcolor='rgba(44,160,44,0.1)',
+            hovertemplate='<b>%{x}</b><br>Labor Force: %{y:.0f}M<extra></extra>'
+        ),
+        row=1, col=2
+    )
+
+    # Economic Size (GDP in USD)
+    gdp_usd_data = indicator_frame(frames, 'NY.GDP.MKTP.CD')
+    gdp_usd_data = gdp_usd_data.assign(gdp_trillions=gdp_usd_data['value'] / 1000000000000)
+
+    fig.add_trace(
+        go.Scatter(
+            x=gdp_usd_data['year'],
+            y=gdp_usd_data['gdp_trillions'],
+            mode='lines+markers',
+            name='GDP (Trillion USD)',
+            line=dict(color=STORY_COLORS['opportunity'], width=3),
+            marker=dict(size=8),
+            hovertemplate='<b>%{x}</b><br>GDP: $%{y:.1f}T<extra></extra>'
+        ),
+        row=2, col=1
+    )
+
+    # Key Economic Ratios Over Time
+    unemployment = indicator_frame(frames, 'SL.UEM.TOTL.ZS')
+    exports = indicator_frame(frames, 'NE.EXP.GNFS.ZS')
+
+    if not unemployment.empty:
+        fig.add_trace(
+            go.Scatter(
+                x=unemployment['year'],
+                y=unemployment['value'],
+                mode='lines+markers',
+                name='Unemployment %',
+                line=dict(color=STORY_COLORS['challenge'], width=2),
+                marker=dict(size=6),
+                hovertemplate='<b>%{x}</b><br>Unemployment: %{y:.1f}%<extra></extra>'
+            ),
+            row=2, col=2
+        )
+
+    if not exports.empty:
+        fig.add_trace(
+            go.Scatter(
+                x=exports['year'],
+                y=exports['value'],
+                mode='lines+markers',
+                name='Exports % of GDP',
+                line=dict(color=STORY_COLORS['opportunity'], width=2),
+                marker=dict(size=6),
+                yaxis='y2',
+                hovertemplate='<b>%{x}</b><br>Exports: %{y:.1f}% of GDP<extra></extra>'
+            ),
+            row=2, col=2
+        )
+
+    # Update layout with story narrative
+    fig.update_layout(
+        title=f"Chapter 1: {country['name']}'s Economic Foundation for MSME Growth (2010-2024)<br>" +
+              "<sub>Setting the stage for unprecedented MSME expansion</sub>",
+        title_font=dict(size=20, family="Arial Black"),
+        height=800,
+        showlegend=True,
+        template="plotly_white"
+    )
+
+    # Generate story insights for Chapter 1
+    avg_growth = gdp_data['value'].mean()
+    growth_volatility = gdp_data['value'].std()
+    labor_growth = ((labor_data['labor_millions'].iloc[-1] / labor_data['labor_millions'].iloc[0]) - 1) * 100
+    economic_size_growth = ((gdp_usd_data['gdp_trillions'].iloc[-1] / gdp_usd_data['gdp_trillions'].iloc[0]) - 1) * 100
+
+    insights = [
+        f"Economic Foundation: {country['name']} averaged {avg_growth:.1f}% GDP growth (2010-2024)",
+        f"Demographic Dividend: Labor force expanded {labor_growth:.1f}% over 14 years",
+        f"Economic Scale: Economy grew {economic_size_growth:.1f}% to ${gdp_usd_data['gdp_trillions'].iloc[-1]:.1f}T",
+    ]
+    if shock:
+        verb = "Recovered from a COVID contraction" if trough < 0 else "Rebounded from a COVID slowdown"
+        insights.append(f"Resilience Factor: {verb} ({trough:.1f}% in {trough_year}) "
+                        f"to {rebound:.1f}% growth in {rebound_year}")
+
+    return fig, insights
+
+
+def build_chapter_2_opportunity(frames, country=None):
+    """Chapter 2: MSME Sector Opportunities Aligned with Economic Trends"""
+    print("\n📖 Chapter 2: Mapping MSME Opportunities...")
+
+    # Create MSME opportunities based on our economic foundation data
+    # Using economic indicators to inform realistic sector potential
+
+    gdp_data = indicator_frame(frames, 'NY.GDP.MKTP.KD.ZG')
+    labor_data = indicator_frame(frames, 'SL.TLF.TOTL.IN')
+    exports_data = indicator_frame(frames, 'NE.EXP.GNFS.ZS')
+
+    # Calculate recent trends to inform sector opportunities
+    recent_growth = gdp_data[gdp_data['year'] >= 2021]['value'].mean()
+    labor_growth_rate = 2.8  # Annual growth rate from our data
+    export_recovery = exports_data[exports_data['year'] >= 2021]['value'].mean()
+
+    # Create realistic MSME sectors based on economic fundamentals
+    sectors = {
+        'Digital Services': {
+            'growth_potential': min(recent_growth * 1.8, 18), # 1.8x GDP growth rate
+            'market_size': 75,
+            'employment_potential': labor_growth_rate * 3.2,
+            'export_alignment': export_recovery * 1.4
+        },
+        'Manufacturing': {
+            'growth_potential': recent_growth * 1.2,
+            'market_size': 88,
+            'employment_potential': labor_growth_rate * 4.1,
+            'export_alignment': export_recovery * 1.1
+        },
+        'Financial Services': {
+            'growth_potential': recent_growth * 1.5,
+            'market_size': 72,
+            'employment_potential': labor_growth_rate * 2.8,
+            'export_alignment': export_recovery * 0.8
+        },
+        'Healthcare Tech': {
+            'growth_potential': recent_growth * 1.6,
+            'market_size': 58,
+            'employment_potential': labor_growth_rate * 3.5,
+            'export_alignment': export_recovery * 1.3
+        },
+        'Agriculture Tech': {
+            'growth_potential': recent_growth * 1.4,
+            'market_size': 45,
+            'employment_potential': labor_growth_rate * 5.2,
+            'export_alignment': export_recovery * 1.0
+        },
+        'Education Services': {
+            'growth_potential': recent_growth * 1.3,
+            'market_size': 52,
+            'employment_potential': labor_growth_rate * 3.8,
+            'export_alignment': export_recovery * 1.6
+        },
+        'Green Energy': {
+            'growth_potential': recent_growth * 2.1,
+            'market_size': 35,
+            'employment_potential': labor_growth_rate * 4.5,
+            'export_alignment': export_recovery * 1.9
+        },
+        'Food Processing': {
+            'growth_potential': recent_growth * 0.9,
+            'market_size': 92,
+            'employment_potential': labor_growth_rate * 3.9,
+            'export_alignment': export_recovery * 1.2
+        },
+        'Textiles': {
+            'growth_potential': recent_growth * 0.8,
+            'market_size': 78,
+            'employment_potential': labor_growth_rate * 3.1,
+            'export_alignment': export_recovery * 1.5
+        },
+        'Logistics': {
+            'growth_potential': recent_growth * 1.1,
+            'market_size': 65,
+            'employment_potential': labor_growth_rate * 2.9,
+            'export_alignment': export_recovery * 1.1
+        }
+    }
+
+    # Create the opportunity matrix with economic grounding
+    fig = go.Figure()
+
+    # Prepare data
+    sector_names = list(sectors.keys())
+    x_vals = [sectors[sector]['market_size'] for sector in sectors]
+    y_vals = [sectors[sector]['growth_potential'] for sector in sectors]
+    bubble_sizes = [sectors[sector]['employment_potential'] * 8 for sector in sectors]
+
+    # Color based on export potential alignment with our trade data
+    export_scores = np.array([sectors[sector]['export_alignment'] for sector in sectors])
+    colors = np.select(
+        [export_scores >= export_recovery * 1.4, export_scores >= export_recovery * 1.1],
+        [STORY_COLORS['opportunity'], STORY_COLORS['growth']],  # High / good export potential
+        default=STORY_COLORS['foundation']                      # Domestic focus
+    ).tolist()
+
+    fig.add_trace(go.Scatter(
+        x=x_vals, y=y_vals,
+        mode='markers+text',
+        marker=dict(
+            size=bubble_sizes,
+            color=colors,
+            opacity=0.7,
+            line=dict(width=2, color='white')
+        ),
+        text=sector_names,
+        textposition="middle center",
+        textfont=dict(size=9, color='white', family="Arial Black"),
+        hovertemplate='<b>%{text}</b><br>' +
+                     'Market Size: %{x}<br>' +
+                     'Growth Potential: %{y:.1f}%<br>' +
+                     'Employment Multiplier: High<br>' +
+                     '<extra></extra>'
+    ))
+
+    # Add strategic quadrant lines based on median values
+    median_market = np.median(x_vals)
+    median_growth = np.median(y_vals)
+
+    fig.add_hline(y=median_growth, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.add_vline(x=median_market, line_dash="dash", line_color="gray", opacity=0.5)
+
+    # Add data-driven quadrant labels
+    fig.add_annotation(x=85, y=15, text="PRIORITY SECTORS<br>(High Scale + High Growth)",
+                      showarrow=False, font=dict(size=11, color=STORY_COLORS['growth']))
+    fig.add_annotation(x=85, y=8, text="STABLE SECTORS<br>(High Scale + Steady Growth)",
+                      showarrow=False, font=dict(size=11, color=STORY_COLORS['foundation']))
+    fig.add_annotation(x=45, y=15, text="EMERGING SECTORS<br>(High Growth + Scaling Up)",
+                      showarrow=False, font=dict(size=11, color=STORY_COLORS['opportunity']))
+    fig.add_annotation(x=45, y=8, text="NICHE SECTORS<br>(Focused Opportunities)",
+                      showarrow=False, font=dict(size=11, color=STORY_COLORS['neutral']))
+
+    fig.update_layout(
+        title="Chapter 2: MSME Opportunity Matrix - Data-Driven Sector Analysis<br>" +
+              f"<sub>Based on {recent_growth:.1f}% recent GDP growth and {export_recovery:.1f}% export performance</sub>",
+        title_font=dict(size=18, family="Arial Black"),
+        xaxis_title="Market Size Index (Based on Economic Scale)",
+        yaxis_title="Growth Potential % (Aligned with GDP Trends)",
+        width=1100, height=700,
+        template="plotly_white",
+        showlegend=False
+    )
+
+    # Identify priority sectors
+    priority_sectors = [sector for sector in sectors
+                      if sectors[sector]['market_size'] > median_market
+                      and sectors[sector]['growth_potential'] > median_growth]
+
+    emerging_sectors = [sector for sector in sectors
+                      if sectors[sector]['market_size'] <= median_market
+                      and sectors[sector]['growth_potential'] > median_growth]
+
+    insights = [
+        f"Priority MSME Sectors: {', '.join(priority_sectors[:3])} (high scale + growth)",
+        f"Emerging Opportunities: {', '.join(emerging_sectors[:2])} (high growth potential)",
+        f"Employment Multiplier: MSME sectors could generate {labor_growth_rate*3.5:.1f}x labor force growth",
+        f"Export Alignment: {len([s for s in sectors if sectors[s]['export_alignment'] >= export_recovery*1.3])} sectors show strong export potential"
+    ]
+
+    return fig, insights
+
+
+def build_chapter_3_trade_pathway(frames, country=None):
+    """Chapter 3: Export Growth - The Path to Global Integration"""
+    country = country or story_country()
+    print("\n📖 Chapter 3: Charting the Export Growth Path...")
+
+    exports_data = indicator_frame(frames, 'NE.EXP.GNFS.ZS')
+    gdp_growth_data = indicator_frame(frames, 'NY.GDP.MKTP.KD.ZG')
+    gdp_usd_data = indicator_frame(frames, 'NY.GDP.MKTP.CD')
+
+    # Create comprehensive trade story
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=(
+            'Export Performance: The Journey (2010-2024)',
+            'Export-Growth Correlation: Finding the Pattern',
+            'Global Market Position: Where We Stand',
+            'Future Trajectory: 2025-2030 Projections'
+        ),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"secondary_y": False}]]
+    )
+
+    # Export performance with period coloring
+    export_colors = period_colors(exports_data['year'], export_periods(country['code']))
+
+    fig.add_trace(
+        go.Scatter(
+            x=exports_data['year'],
+            y=exports_data['value'],
+            mode='lines+markers',
+            name='Exports % of GDP',
+            line=dict(color=STORY_COLORS['opportunity'], width=3),
+            marker=dict(size=8, color=export_colors),
+            hovertemplate='<b>%{x}</b><br>Exports: %{y:.1f}% of GDP<extra></extra>'
+        ),
+        row=1, col=1
+    )
+
+    # Add trend line
+    from sklearn.linear_model import LinearRegression
+    X = exports_data['year'].values.reshape(-1, 1)
+    y = exports_data['value'].values
+    reg = LinearRegression().fit(X, y)
+    trend_line = reg.predict(X)
+
+    fig.add_trace(
+        go.Scatter(
+            x=exports_data['year'],
+            y=trend_line,
+            mode='lines',
+            name='Trend',
+            line=dict(color=STORY_COLORS['neutral'], dash='dash', width=2),
+            hovertemplate='Trend: %{y:.1f}%<extra></extra>'
+        ),
+        row=1, col=1
+    )
+
+    # Export vs GDP Growth correlation
+    merged_data = pd.merge(exports_data, gdp_growth_data, on='year', suffixes=('_exports', '_gdp'))
+
+    fig.add_trace(
+        go.Scatter(
+            x=merged_data['value_exports'],
+            y=merged_data['value_gdp'],
+            mode='markers',
+            name='Export-Growth Relationship',
+            marker=dict(
+                size=10,
+                color=merged_data['year'],
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title="Year")
+            ),
+            text=merged_data['year'],
+            hovertemplate='<b>%{text}</b><br>Exports: %{x:.1f}%<br>GDP Growth: %{y:.1f}%<extra></extra>'
+        ),
+        row=1, col=2
+    )
+
+    # Global comparison (data-driven)
+    current_export_share = value_at(exports_data, 2023)
+
+    # Benchmark against the economies nearest in size (latest World Bank values from the extract)
+    countries = [country['name']] + [name for name, _ in country['peers']]
+    export_shares = [current_export_share] + [share for _, share in country['peers']]
+
+    colors_global = [STORY_COLORS['opportunity'] if c == country['name'] else STORY_COLORS['neutral'] for c in countries]
+
+    fig.add_trace(
+        go.Bar(
+            x=countries,
+            y=export_shares,
+            marker_color=colors_global,
+            name='Export Share Comparison',
+            hovertemplate='<b>%{x}</b><br>Exports: %{y:.1f}% of GDP<extra></extra>'
+        ),
+        row=2, col=1
+    )
+
+    # Future projections based on trend
+    future_years = list(range(2025, 2031))
+    future_X = np.array(future_years).reshape(-1, 1)
+    future_projections = reg.predict(future_X)
+
+    # Adjust projections based on MSME policy interventions
+    policy_boost = [1.02, 1.05, 1.08, 1.12, 1.15, 1.18]  # Progressive improvement
+    adjusted_projections = [proj * boost for proj, boost in zip(future_projections, policy_boost)]
+
+    fig.add_trace(
+        go.Scatter(
+            x=future_years,
+            y=adjusted_projections,
+            mode='lines+markers',
+            name='Projected Growth with MSME Focus',
+            line=dict(color=STORY_COLORS['growth'], dash='dot', width=3),
+            marker=dict(size=8),
+            hovertemplate='<b>%{x}</b><br>Projected: %{y:.1f}% of GDP<extra></extra>'
+        ),
+        row=2, col=2
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            x=future_years,
+            y=future_projections,
+            mode='lines',
+            name='Baseline Projection',
+            line=dict(color=STORY_COLORS['neutral'], dash='dash', width=2),
+            hovertemplate='Baseline: %{y:.1f}%<extra></extra>'
+        ),
+        row=2, col=2
+    )
+
+    fig.update_layout(
+        title=f"Chapter 3: {country['name']}'s Export Growth Journey & MSME Potential (2010-2030)<br>" +
+              f"<sub>Current position: {current_export_share:.1f}% of GDP | Target: Enhanced through MSME growth</sub>",
+        title_font=dict(size=18, family="Arial Black"),
+        height=800,
+        showlegend=True,
+        template="plotly_white"
+    )
+
+    # Calculate story insights
+    export_trend = reg.coef_[0]
+    current_vs_peak = current_export_share / exports_data['value'].max()
+
+    insights = [
+        f"Export Trajectory: {export_trend:+.2f} percentage points per year trend (2010-2024)",
+        f"Current Position: {current_export_share:.1f}% of GDP, {current_vs_peak:.1%} of historical peak",
+        f"2030 Potential: {adjusted_projections[-1]:.1f}% of GDP with focused MSME export strategy"
+    ]
+
+    if country['peers']:
+        leader, leader_share = max(country['peers'], key=lambda peer: peer[1])
+        gap = leader_share - current_export_share
+        insights.insert(2, f"Global Gap: {abs(gap):.1f} percentage points {'behind' if gap > 0 else 'ahead of'} "
+                           f"{leader}, the most export-intensive of its size peers")
+
+    return fig, insights
+
+
+WB_SOURCE = 'data/raw/wb_combined_indicators.csv'
+
+# (artifact name, builder, indicators it reads) in story order; builders are pure functions of the World Bank frame
+CHAPTERS = [
+    ('chapter1_economic_foundation', build_chapter_1_foundation,
+     ['NY.GDP.MKTP.KD.ZG', 'SL.TLF.TOTL.IN', 'NY.GDP.MKTP.CD', 'SL.UEM.TOTL.ZS', 'NE.EXP.GNFS.ZS']),
+    ('chapter2_msme_opportunities', build_chapter_2_opportunity,
+     ['NY.GDP.MKTP.KD.ZG', 'SL.TLF.TOTL.IN', 'NE.EXP.GNFS.ZS']),
+    ('chapter3_export_pathway', build_chapter_3_trade_pathway,
+     ['NE.EXP.GNFS.ZS', 'NY.GDP.MKTP.KD.ZG', 'NY.GDP.MKTP.CD']),
+]
+
+REPORT_NAME = 'unified_msme_story'
+BUNDLE_NAME = 'story_bundle'
+REPORT_INDICATORS = ['NY.GDP.MKTP.KD.ZG', 'SL.TLF.TOTL.IN', 'NE.EXP.GNFS.ZS', 'NY.GDP.MKTP.CD']
+
+IMAGE_EXPORT = dict(width=1400, height=900, scale=2)
+
+
+def kaleido_scope():
+    """This process's Kaleido scope, reused for every image it exports.
+
+    The renderer subprocess starts on first use; a forked pool worker drops any handle inherited
+    from its parent so it starts its own instead of sharing the parent's pipes.
+    """
+    scope = pio.kaleido.scope
+    if scope is None:
+        raise ValueError("Image export requires the kaleido package: pip install -U kaleido")
+    if getattr(scope, '_owner_pid', None) != os.getpid():
+        scope._proc = None
+        scope._owner_pid = os.getpid()
+    return scope
+
+
+def _run_chapter_builder(name, builder, frames, country, images_dir):
+    """Process-pool entry point: build one chapter and export its images with this worker's Kaleido.
+
+    Figures cross the process boundary as plain dicts; returns (fig dict, insights, image paths).
+    """
+    fig, insights = builder(frames, country)
+    return fig.to_dict(), insights, export_chapter_images({name: fig}, images_dir)[name]
+
+
+def export_chapter_images(figures, images_dir):
+    """Write PNGs plus their JPEG size tiers for {name: fig} through this process's Kaleido scope.
+
+    Returns {name: [paths written]}.
+    """
+    scope = kaleido_scope()
+    written = {}
+    for name, fig in figures.items():
+        image = scope.transform(fig.to_plotly_json(), format='png', **IMAGE_EXPORT)
+        png_path = os.path.join(images_dir, f"{name}.png")
+        with open(png_path, 'wb') as f:
+            f.write(image)
+        written[name] = [png_path] + write_image_tiers(image, images_dir, name)
+    return written
+
+
 class UnifiedMSMEStory:
-    def __init__(self):
+    def __init__(self, images_dir='output/images', reports_dir='output/reports', manifest_path=None,
+                 html_mode='inline', bundle=False, country=None, source=WB_SOURCE, wb_data=None):
+        """html_mode='inline' (the committed chapter pages) embeds the full bundle in every chapter; 'shared' writes
+        plotly.js and layout templates once as hashed assets under images_dir/assets, which must be deployed with
+        the pages. bundle=True also writes all chapters on one page (shared mode).
+
+        country is a story_country() context (India by default). wb_data, when given, is used instead of
+        reading `source` (the batch mode hands each worker its country's slice of one shared extract).
+        """
+        if html_mode not in ('shared', 'inline'):
+            raise ValueError(f"Unknown html_mode: {html_mode}")
+        if bundle and html_mode != 'shared':
+            raise ValueError("The single-page bundle requires html_mode='shared'")
         self.wb_data = None
+        self.source_data = wb_data
+        self.source = source
+        self.country = country or story_country()
+        self.indicator_frames = {}
         self.story_insights = []
+        self.images_dir = images_dir
+        self.reports_dir = reports_dir
+        self.html_mode = html_mode
+        self.bundle = bundle
+        if manifest_path is None:
+            manifest_path = os.path.join(os.path.dirname(os.path.normpath(images_dir)), '.story_build.json')
+        self.manifest = BuildManifest(manifest_path)
         
     def load_data(self):
         """Load and validate our unified dataset"""
         print("📚 Loading unified World Bank data (2010-2024)...")
         
         try:
-            self.wb_data = pd.read_csv('data/raw/wb_combined_indicators.csv')
+            if self.source_data is not None:
+                self.wb_data = self.source_data.copy()
+            else:
+                self.wb_data = pd.read_csv(self.source)
+                code = self.country['code']
+                if 'country_code' in self.wb_data.columns:
+                    # Multi-country extract: benchmark against it, then keep this story's economy
+                    if code not in set(self.wb_data['country_code']):
+                        raise ValueError(f"{code} is not in {self.source}")
+                    export_shares, gdp_usd, names = extract_countries(self.wb_data)
+                    self.country = story_country(code, self.country['name'], export_shares, names, gdp_usd)
+                    self.wb_data = self.wb_data[self.wb_data['country_code'] == code]
+                elif code != DEFAULT_COUNTRY:
+                    raise ValueError(f"{self.source} is India's single-country extract (no country_code column); "
+                                     f"{code} needs a multi-country extract")
             self.wb_data['year'] = pd.to_numeric(self.wb_data['year'])
             self.wb_data['value'] = pd.to_numeric(self.wb_data['value'])
             
             # Validate we have consistent timeframe
             year_range = f"{self.wb_data['year'].min()}-{self.wb_data['year'].max()}"
-            indicators = self.wb_data['indicator'].nunique()
+            self.indicator_frames = split_indicators(self.wb_data)
+            indicators = len(self.indicator_frames)
             
             print(f"✅ Loaded {len(self.wb_data)} records spanning {year_range}")
             print(f"📊 Covering {indicators} economic indicators")
@@ -51,534 +740,162 @@ class UnifiedMSMEStory:
             
         except Exception as e:
             print(f"❌ Error loading data: {e}")
+            if isinstance(e, FileNotFoundError):
+                print("   Build it from World Bank bulk downloads with:  python -m src.utils.wb_ingest")
             return False
     
+    def _spec_path(self, name):
+        return os.path.join(self.images_dir, f"{name}.figure.json")
+
+    def _write_chapter_html(self, name, fig):
+        """Write the chapter page; returns every file it produced or references"""
+        path = os.path.join(self.images_dir, f"{name}.html")
+        if self.html_mode == 'inline':
+            fig.write_html(path)
+            return [path]
+
+        # The compact spec is kept next to the page so the bundle can be assembled without rebuilding figures
+        spec, template = html_export.compact_figure(fig)
+        with open(self._spec_path(name), 'w', encoding='utf-8') as f:
+            json.dump({'spec': spec, 'template': template}, f, separators=(',', ':'))
+        return html_export.write_page(path, name, [(name, spec, template)]) + [self._spec_path(name)]
+
+    def _write_bundle(self):
+        chapters = []
+        for name, _, _ in CHAPTERS:
+            with open(self._spec_path(name), encoding='utf-8') as f:
+                saved = json.load(f)
+            chapters.append((name, saved['spec'], saved['template']))
+        return html_export.write_page(self._bundle_path(), f"{self.country['name']}'s MSME Story", chapters)
+
+    def _save_chapter(self, name, fig, insights):
+        self._write_chapter_html(name, fig)
+        export_chapter_images({name: fig}, self.images_dir)
+        self.story_insights.extend(insights)
+
     def create_story_chapter_1_foundation(self):
-        """Chapter 1: India's Economic Foundation Sets the Stage (2010-2024)"""
-        print("\n📖 Chapter 1: Building the Economic Foundation...")
-        
-        # Create a focused foundation story
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=(
-                'GDP Growth: The Resilience Story', 
-                'Labor Force: The Demographic Dividend',
-                'Economic Size: Growing Market Power', 
-                'Key Milestones: Critical Inflection Points'
-            ),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                   [{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        # GDP Growth Story with clear narrative
-        gdp_data = self.wb_data[self.wb_data['indicator'] == 'NY.GDP.MKTP.KD.ZG'].copy()
-        gdp_data = gdp_data.sort_values('year')
-        
-        # Color code the periods for storytelling
-        colors = []
-        for year in gdp_data['year']:
-            if year <= 2013:
-                colors.append(STORY_COLORS['foundation'])  # Foundation period
-            elif year <= 2019:
-                colors.append(STORY_COLORS['growth'])      # Growth period  
-            elif year == 2020:
-                colors.append(STORY_COLORS['challenge'])   # COVID challenge
-            else:
-                colors.append(STORY_COLORS['opportunity']) # Recovery period
-        
-        fig.add_trace(
-            go.Scatter(
-                x=gdp_data['year'], 
-                y=gdp_data['value'],
-                mode='lines+markers',
-                name='GDP Growth %',
-                line=dict(color=STORY_COLORS['foundation'], width=3),
-                marker=dict(size=8, color=colors),
-                hovertemplate='<b>%{x}</b><br>GDP Growth: %{y:.1f}%<extra></extra>'
-            ),
-            row=1, col=1
-        )
-        
-        # Add annotations for key events
-        fig.add_annotation(x=2020, y=-5.8, text="COVID Impact", 
-                          showarrow=True, arrowcolor=STORY_COLORS['challenge'],
-                          row=1, col=1)
-        fig.add_annotation(x=2021, y=9.7, text="Recovery", 
-                          showarrow=True, arrowcolor=STORY_COLORS['growth'],
-                          row=1, col=1)
-        
-        # Labor Force Growth
-        labor_data = self.wb_data[self.wb_data['indicator'] == 'SL.TLF.TOTL.IN'].copy()
-        labor_data = labor_data.sort_values('year')
-        labor_data['labor_millions'] = labor_data['value'] / 1000000
-        
-        fig.add_trace(
-            go.Scatter(
-                x=labor_data['year'], 
-                y=labor_data['labor_millions'],
-                mode='lines+markers',
-                name='Labor Force (Millions)',
-                line=dict(color=STORY_COLORS['growth'], width=3),
-                marker=dict(size=8),
-                fill='tonexty',
-                fillcolor='rgba(44,160,44,0.1)',
-                hovertemplate='<b>%{x}</b><br>Labor Force: %{y:.0f}M<extra></extra>'
-            ),
-            row=1, col=2
-        )
-        
-        # Economic Size (GDP in USD)
-        gdp_usd_data = self.wb_data[self.wb_data['indicator'] == 'NY.GDP.MKTP.CD'].copy()
-        gdp_usd_data = gdp_usd_data.sort_values('year')
-        gdp_usd_data['gdp_trillions'] = gdp_usd_data['value'] / 1000000000000
-        
-        fig.add_trace(
-            go.Scatter(
-                x=gdp_usd_data['year'], 
-                y=gdp_usd_data['gdp_trillions'],
-                mode='lines+markers',
-                name='GDP (Trillion USD)',
-                line=dict(color=STORY_COLORS['opportunity'], width=3),
-                marker=dict(size=8),
-                hovertemplate='<b>%{x}</b><br>GDP: $%{y:.1f}T<extra></extra>'
-            ),
-            row=2, col=1
-        )
-        
-        # Key Economic Ratios Over Time
-        unemployment = self.wb_data[self.wb_data['indicator'] == 'SL.UEM.TOTL.ZS'].copy()
-        exports = self.wb_data[self.wb_data['indicator'] == 'NE.EXP.GNFS.ZS'].copy()
-        
-        if not unemployment.empty:
-            unemployment = unemployment.sort_values('year')
-            fig.add_trace(
-                go.Scatter(
-                    x=unemployment['year'], 
-                    y=unemployment['value'],
-                    mode='lines+markers',
-                    name='Unemployment %',
-                    line=dict(color=STORY_COLORS['challenge'], width=2),
-                    marker=dict(size=6),
-                    hovertemplate='<b>%{x}</b><br>Unemployment: %{y:.1f}%<extra></extra>'
-                ),
-                row=2, col=2
-            )
-        
-        if not exports.empty:
-            exports = exports.sort_values('year')
-            fig.add_trace(
-                go.Scatter(
-                    x=exports['year'], 
-                    y=exports['value'],
-                    mode='lines+markers',
-                    name='Exports % of GDP',
-                    line=dict(color=STORY_COLORS['opportunity'], width=2),
-                    marker=dict(size=6),
-                    yaxis='y2',
-                    hovertemplate='<b>%{x}</b><br>Exports: %{y:.1f}% of GDP<extra></extra>'
-                ),
-                row=2, col=2
-            )
-        
-        # Update layout with story narrative
-        fig.update_layout(
-            title="Chapter 1: India's Economic Foundation for MSME Growth (2010-2024)<br>" +
-                  "<sub>Setting the stage for unprecedented MSME expansion</sub>",
-            title_font=dict(size=20, family="Arial Black"),
-            height=800,
-            showlegend=True,
-            template="plotly_white"
-        )
-        
-        # Save Chapter 1
-        fig.write_html("output/images/chapter1_economic_foundation.html")
-        fig.write_image("output/images/chapter1_economic_foundation.png", width=1400, height=900, scale=2)
-        
-        # Generate story insights for Chapter 1
-        avg_growth = gdp_data['value'].mean()
-        growth_volatility = gdp_data['value'].std()
-        labor_growth = ((labor_data['labor_millions'].iloc[-1] / labor_data['labor_millions'].iloc[0]) - 1) * 100
-        economic_size_growth = ((gdp_usd_data['gdp_trillions'].iloc[-1] / gdp_usd_data['gdp_trillions'].iloc[0]) - 1) * 100
-        
-        self.story_insights.extend([
-            f"Economic Foundation: India averaged {avg_growth:.1f}% GDP growth (2010-2024)",
-            f"Demographic Dividend: Labor force expanded {labor_growth:.1f}% over 14 years",
-            f"Economic Scale: Economy grew {economic_size_growth:.1f}% to ${gdp_usd_data['gdp_trillions'].iloc[-1]:.1f}T",
-            f"Resilience Factor: Recovered from COVID (-5.8%) to strong growth (8.2%)"
-        ])
-        
+        """Chapter 1: The Economic Foundation Sets the Stage (2010-2024)"""
+        self._save_chapter('chapter1_economic_foundation', *build_chapter_1_foundation(self.indicator_frames, self.country))
         print("✅ Chapter 1 completed: Economic Foundation")
-    
+
     def create_story_chapter_2_opportunity(self):
         """Chapter 2: MSME Sector Opportunities Aligned with Economic Trends"""
-        print("\n📖 Chapter 2: Mapping MSME Opportunities...")
-        
-        # Create MSME opportunities based on our economic foundation data
-        # Using economic indicators to inform realistic sector potential
-        
-        gdp_data = self.wb_data[self.wb_data['indicator'] == 'NY.GDP.MKTP.KD.ZG'].copy()
-        labor_data = self.wb_data[self.wb_data['indicator'] == 'SL.TLF.TOTL.IN'].copy()
-        exports_data = self.wb_data[self.wb_data['indicator'] == 'NE.EXP.GNFS.ZS'].copy()
-        
-        # Calculate recent trends to inform sector opportunities
-        recent_growth = gdp_data[gdp_data['year'] >= 2021]['value'].mean()
-        labor_growth_rate = 2.8  # Annual growth rate from our data
-        export_recovery = exports_data[exports_data['year'] >= 2021]['value'].mean()
-        
-        # Create realistic MSME sectors based on economic fundamentals
-        sectors = {
-            'Digital Services': {
-                'growth_potential': min(recent_growth * 1.8, 18), # 1.8x GDP growth rate
-                'market_size': 75, 
-                'employment_potential': labor_growth_rate * 3.2,
-                'export_alignment': export_recovery * 1.4
-            },
-            'Manufacturing': {
-                'growth_potential': recent_growth * 1.2,
-                'market_size': 88,
-                'employment_potential': labor_growth_rate * 4.1,
-                'export_alignment': export_recovery * 1.1
-            },
-            'Financial Services': {
-                'growth_potential': recent_growth * 1.5,
-                'market_size': 72,
-                'employment_potential': labor_growth_rate * 2.8,
-                'export_alignment': export_recovery * 0.8
-            },
-            'Healthcare Tech': {
-                'growth_potential': recent_growth * 1.6,
-                'market_size': 58,
-                'employment_potential': labor_growth_rate * 3.5,
-                'export_alignment': export_recovery * 1.3
-            },
-            'Agriculture Tech': {
-                'growth_potential': recent_growth * 1.4,
-                'market_size': 45,
-                'employment_potential': labor_growth_rate * 5.2,
-                'export_alignment': export_recovery * 1.0
-            },
-            'Education Services': {
-                'growth_potential': recent_growth * 1.3,
-                'market_size': 52,
-                'employment_potential': labor_growth_rate * 3.8,
-                'export_alignment': export_recovery * 1.6
-            },
-            'Green Energy': {
-                'growth_potential': recent_growth * 2.1,
-                'market_size': 35,
-                'employment_potential': labor_growth_rate * 4.5,
-                'export_alignment': export_recovery * 1.9
-            },
-            'Food Processing': {
-                'growth_potential': recent_growth * 0.9,
-                'market_size': 92,
-                'employment_potential': labor_growth_rate * 3.9,
-                'export_alignment': export_recovery * 1.2
-            },
-            'Textiles': {
-                'growth_potential': recent_growth * 0.8,
-                'market_size': 78,
-                'employment_potential': labor_growth_rate * 3.1,
-                'export_alignment': export_recovery * 1.5
-            },
-            'Logistics': {
-                'growth_potential': recent_growth * 1.1,
-                'market_size': 65,
-                'employment_potential': labor_growth_rate * 2.9,
-                'export_alignment': export_recovery * 1.1
-            }
-        }
-        
-        # Create the opportunity matrix with economic grounding
-        fig = go.Figure()
-        
-        # Prepare data
-        sector_names = list(sectors.keys())
-        x_vals = [sectors[sector]['market_size'] for sector in sectors]
-        y_vals = [sectors[sector]['growth_potential'] for sector in sectors]
-        bubble_sizes = [sectors[sector]['employment_potential'] * 8 for sector in sectors]
-        
-        # Color based on export potential alignment with our trade data
-        colors = []
-        for sector in sectors:
-            export_score = sectors[sector]['export_alignment']
-            if export_score >= export_recovery * 1.4:
-                colors.append(STORY_COLORS['opportunity'])  # High export potential
-            elif export_score >= export_recovery * 1.1:
-                colors.append(STORY_COLORS['growth'])       # Good export potential
-            else:
-                colors.append(STORY_COLORS['foundation'])   # Domestic focus
-        
-        fig.add_trace(go.Scatter(
-            x=x_vals, y=y_vals,
-            mode='markers+text',
-            marker=dict(
-                size=bubble_sizes, 
-                color=colors, 
-                opacity=0.7,
-                line=dict(width=2, color='white')
-            ),
-            text=sector_names,
-            textposition="middle center",
-            textfont=dict(size=9, color='white', family="Arial Black"),
-            hovertemplate='<b>%{text}</b><br>' +
-                         'Market Size: %{x}<br>' +
-                         'Growth Potential: %{y:.1f}%<br>' +
-                         'Employment Multiplier: High<br>' +
-                         '<extra></extra>'
-        ))
-        
-        # Add strategic quadrant lines based on median values
-        median_market = np.median(x_vals)
-        median_growth = np.median(y_vals)
-        
-        fig.add_hline(y=median_growth, line_dash="dash", line_color="gray", opacity=0.5)
-        fig.add_vline(x=median_market, line_dash="dash", line_color="gray", opacity=0.5)
-        
-        # Add data-driven quadrant labels
-        fig.add_annotation(x=85, y=15, text="PRIORITY SECTORS<br>(High Scale + High Growth)", 
-                          showarrow=False, font=dict(size=11, color=STORY_COLORS['growth']))
-        fig.add_annotation(x=85, y=8, text="STABLE SECTORS<br>(High Scale + Steady Growth)", 
-                          showarrow=False, font=dict(size=11, color=STORY_COLORS['foundation']))
-        fig.add_annotation(x=45, y=15, text="EMERGING SECTORS<br>(High Growth + Scaling Up)", 
-                          showarrow=False, font=dict(size=11, color=STORY_COLORS['opportunity']))
-        fig.add_annotation(x=45, y=8, text="NICHE SECTORS<br>(Focused Opportunities)", 
-                          showarrow=False, font=dict(size=11, color=STORY_COLORS['neutral']))
-        
-        fig.update_layout(
-            title="Chapter 2: MSME Opportunity Matrix - Data-Driven Sector Analysis<br>" +
-                  f"<sub>Based on {recent_growth:.1f}% recent GDP growth and {export_recovery:.1f}% export performance</sub>",
-            title_font=dict(size=18, family="Arial Black"),
-            xaxis_title="Market Size Index (Based on Economic Scale)",
-            yaxis_title="Growth Potential % (Aligned with GDP Trends)",
-            width=1100, height=700,
-            template="plotly_white",
-            showlegend=False
-        )
-        
-        # Save Chapter 2
-        fig.write_html("output/images/chapter2_msme_opportunities.html")
-        fig.write_image("output/images/chapter2_msme_opportunities.png", width=1400, height=900, scale=2)
-        
-        # Identify priority sectors
-        priority_sectors = [sector for sector in sectors 
-                          if sectors[sector]['market_size'] > median_market 
-                          and sectors[sector]['growth_potential'] > median_growth]
-        
-        emerging_sectors = [sector for sector in sectors 
-                          if sectors[sector]['market_size'] <= median_market 
-                          and sectors[sector]['growth_potential'] > median_growth]
-        
-        self.story_insights.extend([
-            f"Priority MSME Sectors: {', '.join(priority_sectors[:3])} (high scale + growth)",
-            f"Emerging Opportunities: {', '.join(emerging_sectors[:2])} (high growth potential)",
-            f"Employment Multiplier: MSME sectors could generate {labor_growth_rate*3.5:.1f}x labor force growth",
-            f"Export Alignment: {len([s for s in sectors if sectors[s]['export_alignment'] >= export_recovery*1.3])} sectors show strong export potential"
-        ])
-        
+        self._save_chapter('chapter2_msme_opportunities', *build_chapter_2_opportunity(self.indicator_frames, self.country))
         print("✅ Chapter 2 completed: MSME Opportunities")
-    
+
     def create_story_chapter_3_trade_pathway(self):
         """Chapter 3: Export Growth - The Path to Global Integration"""
-        print("\n📖 Chapter 3: Charting the Export Growth Path...")
-        
-        exports_data = self.wb_data[self.wb_data['indicator'] == 'NE.EXP.GNFS.ZS'].copy()
-        gdp_growth_data = self.wb_data[self.wb_data['indicator'] == 'NY.GDP.MKTP.KD.ZG'].copy()
-        gdp_usd_data = self.wb_data[self.wb_data['indicator'] == 'NY.GDP.MKTP.CD'].copy()
-        
-        exports_data = exports_data.sort_values('year')
-        gdp_growth_data = gdp_growth_data.sort_values('year')
-        gdp_usd_data = gdp_usd_data.sort_values('year')
-        
-        # Create comprehensive trade story
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=(
-                'Export Performance: The Journey (2010-2024)',
-                'Export-Growth Correlation: Finding the Pattern',
-                'Global Market Position: Where We Stand',
-                'Future Trajectory: 2025-2030 Projections'
-            ),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                   [{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        # Export performance with period coloring
-        export_colors = []
-        for year in exports_data['year']:
-            if year <= 2014:
-                export_colors.append(STORY_COLORS['foundation'])
-            elif year <= 2019:
-                export_colors.append(STORY_COLORS['challenge'])  # Declining trend
-            elif year == 2020:
-                export_colors.append(STORY_COLORS['challenge'])  # COVID impact
-            else:
-                export_colors.append(STORY_COLORS['growth'])     # Recovery
-        
-        fig.add_trace(
-            go.Scatter(
-                x=exports_data['year'], 
-                y=exports_data['value'],
-                mode='lines+markers',
-                name='Exports % of GDP',
-                line=dict(color=STORY_COLORS['opportunity'], width=3),
-                marker=dict(size=8, color=export_colors),
-                hovertemplate='<b>%{x}</b><br>Exports: %{y:.1f}% of GDP<extra></extra>'
-            ),
-            row=1, col=1
-        )
-        
-        # Add trend line
-        from sklearn.linear_model import LinearRegression
-        X = exports_data['year'].values.reshape(-1, 1)
-        y = exports_data['value'].values
-        reg = LinearRegression().fit(X, y)
-        trend_line = reg.predict(X)
-        
-        fig.add_trace(
-            go.Scatter(
-                x=exports_data['year'], 
-                y=trend_line,
-                mode='lines',
-                name='Trend',
-                line=dict(color=STORY_COLORS['neutral'], dash='dash', width=2),
-                hovertemplate='Trend: %{y:.1f}%<extra></extra>'
-            ),
-            row=1, col=1
-        )
-        
-        # Export vs GDP Growth correlation
-        merged_data = pd.merge(exports_data, gdp_growth_data, on='year', suffixes=('_exports', '_gdp'))
-        
-        fig.add_trace(
-            go.Scatter(
-                x=merged_data['value_exports'], 
-                y=merged_data['value_gdp'],
-                mode='markers',
-                name='Export-Growth Relationship',
-                marker=dict(
-                    size=10, 
-                    color=merged_data['year'],
-                    colorscale='Viridis',
-                    showscale=True,
-                    colorbar=dict(title="Year")
-                ),
-                text=merged_data['year'],
-                hovertemplate='<b>%{text}</b><br>Exports: %{x:.1f}%<br>GDP Growth: %{y:.1f}%<extra></extra>'
-            ),
-            row=1, col=2
-        )
-        
-        # Global comparison (data-driven)
-        current_export_share = exports_data[exports_data['year'] == 2023]['value'].iloc[0]
-        
-        # Create realistic benchmarks based on our data
-        countries = ['India', 'China', 'Vietnam', 'Thailand', 'Malaysia', 'Indonesia']
-        export_shares = [
-            current_export_share,
-            35.2,  # China (reference)
-            95.8,  # Vietnam (high export economy)
-            68.4,  # Thailand 
-            73.1,  # Malaysia
-            21.9   # Indonesia (similar to India)
-        ]
-        
-        colors_global = [STORY_COLORS['opportunity'] if c == 'India' else STORY_COLORS['neutral'] for c in countries]
-        
-        fig.add_trace(
-            go.Bar(
-                x=countries, 
-                y=export_shares,
-                marker_color=colors_global,
-                name='Export Share Comparison',
-                hovertemplate='<b>%{x}</b><br>Exports: %{y:.1f}% of GDP<extra></extra>'
-            ),
-            row=2, col=1
-        )
-        
-        # Future projections based on trend
-        future_years = list(range(2025, 2031))
-        future_X = np.array(future_years).reshape(-1, 1)
-        future_projections = reg.predict(future_X)
-        
-        # Adjust projections based on MSME policy interventions
-        policy_boost = [1.02, 1.05, 1.08, 1.12, 1.15, 1.18]  # Progressive improvement
-        adjusted_projections = [proj * boost for proj, boost in zip(future_projections, policy_boost)]
-        
-        fig.add_trace(
-            go.Scatter(
-                x=future_years, 
-                y=adjusted_projections,
-                mode='lines+markers',
-                name='Projected Growth with MSME Focus',
-                line=dict(color=STORY_COLORS['growth'], dash='dot', width=3),
-                marker=dict(size=8),
-                hovertemplate='<b>%{x}</b><br>Projected: %{y:.1f}% of GDP<extra></extra>'
-            ),
-            row=2, col=2
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=future_years, 
-                y=future_projections,
-                mode='lines',
-                name='Baseline Projection',
-                line=dict(color=STORY_COLORS['neutral'], dash='dash', width=2),
-                hovertemplate='Baseline: %{y:.1f}%<extra></extra>'
-            ),
-            row=2, col=2
-        )
-        
-        fig.update_layout(
-            title="Chapter 3: India's Export Growth Journey & MSME Potential (2010-2030)<br>" +
-                  f"<sub>Current position: {current_export_share:.1f}% of GDP | Target: Enhanced through MSME growth</sub>",
-            title_font=dict(size=18, family="Arial Black"),
-            height=800,
-            showlegend=True,
-            template="plotly_white"
-        )
-        
-        # Save Chapter 3
-        fig.write_html("output/images/chapter3_export_pathway.html")
-        fig.write_image("output/images/chapter3_export_pathway.png", width=1400, height=900, scale=2)
-        
-        # Calculate story insights
-        export_trend = reg.coef_[0]
-        current_vs_peak = current_export_share / exports_data['value'].max()
-        
-        self.story_insights.extend([
-            f"Export Trajectory: {export_trend:+.2f} percentage points per year trend (2010-2024)",
-            f"Current Position: {current_export_share:.1f}% of GDP, {current_vs_peak:.1%} of historical peak",
-            f"Global Gap: {export_shares[1] - current_export_share:.1f} percentage points behind China",
-            f"2030 Potential: {adjusted_projections[-1]:.1f}% of GDP with focused MSME export strategy"
-        ])
-        
+        self._save_chapter('chapter3_export_pathway', *build_chapter_3_trade_pathway(self.indicator_frames, self.country))
         print("✅ Chapter 3 completed: Export Pathway")
-    
+
+    def build_chapters(self, workers=None, names=None):
+        """Build and image-export chapters (all, or just `names`) as (name, fig, insights, image paths).
+
+        With more than one worker each chapter is built and rendered in a worker process, so the
+        Kaleido export, most of the build time, runs on as many cores as there are workers.
+        """
+        chapters = [(name, builder) for name, builder, _ in CHAPTERS if names is None or name in names]
+        workers = workers or min(len(chapters), os.cpu_count() or 1)
+        if workers <= 1:
+            results = [(name, *builder(self.indicator_frames, self.country)) for name, builder in chapters]
+            images = export_chapter_images({name: fig for name, fig, _ in results}, self.images_dir)
+            return [(name, fig, insights, images[name]) for name, fig, insights in results]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(name, pool.submit(_run_chapter_builder, name, builder, self.indicator_frames, self.country,
+                                          self.images_dir))
+                       for name, builder in chapters]
+            results = []
+            for name, future in futures:
+                fig_dict, insights, images = future.result()
+                results.append((name, go.Figure(fig_dict), insights, images))
+        return results
+
+    def _chapter_outputs(self, name):
+        outputs = [os.path.join(self.images_dir, f"{name}.html"), os.path.join(self.images_dir, f"{name}.png")]
+        if self.html_mode == 'shared':
+            outputs.append(self._spec_path(name))
+        return outputs
+
+    def _html_code(self):
+        if self.html_mode == 'inline':
+            return ['inline']
+        return ['shared', html_export.compact_figure, html_export.render_page, html_export.PAGE_TEMPLATE,
+                html_export.CHAPTER_BLOCK, html_export.FLOAT_SIGNIFICANT_DIGITS]
+
+    def _chapter_deps(self, builder, indicators):
+        return {
+            'indicators': indicator_hashes(self.source, self.indicator_frames, indicators),
+            'code': code_hash(builder, STORY_COLORS, GDP_PERIODS, EXPORT_PERIODS, COVID_EXPORT_PERIODS, export_periods,
+                              covid_shock, period_colors, IMAGE_EXPORT, export_chapter_images, kaleido_scope, write_image_tiers,
+                              self.country, IMAGE_TIERS, SAVE_OPTIONS, *self._html_code()),
+        }
+
+    def _bundle_path(self):
+        return os.path.join(self.images_dir, f"{BUNDLE_NAME}.html")
+
+    def _bundle_deps(self):
+        return {
+            'code': code_hash(*self._html_code()),
+            'artifacts': {name: artifact_digest(self.manifest.get(name) or {}) for name, _, _ in CHAPTERS},
+        }
+
+    def _report_path(self):
+        return os.path.join(self.reports_dir, f"{REPORT_NAME}.md")
+
+    def _report_deps(self):
+        return {
+            'indicators': indicator_hashes(self.source, self.indicator_frames, REPORT_INDICATORS),
+            'code': code_hash(type(self).generate_unified_story_report, self.country),
+            'artifacts': {name: artifact_digest(self.manifest.get(name) or {}) for name, _, _ in CHAPTERS},
+        }
+
+    def plan_build(self, force=False):
+        """{artifact: (deps, reasons)} in build order; an artifact with no reasons is up to date"""
+        plan = {}
+        for name, builder, indicators in CHAPTERS:
+            deps = self._chapter_deps(builder, indicators)
+            reasons = ["forced"] if force else self.manifest.stale_reasons(name, deps, self._chapter_outputs(name))
+            plan[name] = (deps, reasons)
+
+        deps = self._report_deps()
+        reasons = ["forced"] if force else self.manifest.stale_reasons(REPORT_NAME, deps, [self._report_path()])
+        reasons += [f"upstream rebuilt: {name}" for name, _, _ in CHAPTERS if plan[name][1] and not force]
+        plan[REPORT_NAME] = (deps, reasons)
+
+        if self.bundle:
+            deps = self._bundle_deps()
+            reasons = ["forced"] if force else self.manifest.stale_reasons('bundle', deps, [self._bundle_path()])
+            reasons += [f"upstream rebuilt: {name}" for name, _, _ in CHAPTERS if plan[name][1] and not force]
+            plan['bundle'] = (deps, reasons)
+        return plan
+
     def generate_unified_story_report(self):
         """Generate the complete story report"""
         print("\n📖 Generating Unified Story Report...")
         
         # Calculate key metrics across the story
-        gdp_data = self.wb_data[self.wb_data['indicator'] == 'NY.GDP.MKTP.KD.ZG'].copy()
-        labor_data = self.wb_data[self.wb_data['indicator'] == 'SL.TLF.TOTL.IN'].copy()
-        exports_data = self.wb_data[self.wb_data['indicator'] == 'NE.EXP.GNFS.ZS'].copy()
+        gdp_data = indicator_frame(self.indicator_frames, 'NY.GDP.MKTP.KD.ZG')
+        labor_data = indicator_frame(self.indicator_frames, 'SL.TLF.TOTL.IN')
+        exports_data = indicator_frame(self.indicator_frames, 'NE.EXP.GNFS.ZS')
+        gdp_usd_data = indicator_frame(self.indicator_frames, 'NY.GDP.MKTP.CD')
+        country_name = self.country['name']
+        current_exports = value_at(exports_data, 2023)
         
         story_report = f"""
-# THE MSME OPPORTUNITY: INDIA'S UNIFIED GROWTH STORY
+# THE MSME OPPORTUNITY: {country_name.upper()}'S UNIFIED GROWTH STORY
 ## From Economic Foundation to Export Leadership (2010-2030)
 
 ### 📚 The Three-Chapter Narrative
 
 **Chapter 1: Economic Foundation (2010-2024)**
-India built a resilient economic foundation with sustained GDP growth averaging {gdp_data['value'].mean():.1f}%, expanding its labor force to {labor_data[labor_data['year']==2024]['value'].iloc[0]/1000000:.0f} million workers, and growing its economy to ${self.wb_data[self.wb_data['indicator']=='NY.GDP.MKTP.CD']['value'].iloc[0]/1000000000000:.1f} trillion.
+{country_name} built a resilient economic foundation with sustained GDP growth averaging {gdp_data['value'].mean():.1f}%, expanding its labor force to {value_at(labor_data, 2024)/1000000:.0f} million workers, and growing its economy to ${value_at(gdp_usd_data, 2024)/1000000000000:.1f} trillion.
 
 **Chapter 2: MSME Opportunities (2024-2027)**  
 Strategic sectors emerge from economic data: Digital Services, Manufacturing, and Healthcare Tech lead priority investments, while Green Energy and Agriculture Tech offer high-growth emerging opportunities.
 
 **Chapter 3: Export Pathway (2025-2030)**
-India can leverage MSME growth to boost exports from current {exports_data[exports_data['year']==2023]['value'].iloc[0]:.1f}% of GDP to projected {25.5:.1f}% by 2030, closing the gap with regional export leaders.
+{country_name} can leverage MSME growth to boost exports from current {current_exports:.1f}% of GDP to projected {25.5:.1f}% by 2030, closing the gap with regional export leaders.
 
 ### 🎯 Unified Story Insights
 
@@ -602,9 +919,9 @@ India can leverage MSME growth to boost exports from current {exports_data[expor
 - Create sector-specific export facilitation
 
 **Phase 3: Global Integration (2027-2030)**
-- Target export growth from {exports_data[exports_data['year']==2023]['value'].iloc[0]:.1f}% to 25%+ of GDP
-- Position India as MSME hub for Asian value chains
-- Establish India as export leader in knowledge services
+- Target export growth from {current_exports:.1f}% to 25%+ of GDP
+- Position {country_name} as MSME hub for Asian value chains
+- Establish {country_name} as export leader in knowledge services
 
 ### 📊 Data Validation
 - **Consistent Timeline:** All analysis uses 2010-2024 World Bank data
@@ -614,26 +931,57 @@ India can leverage MSME growth to boost exports from current {exports_data[expor
 *Story Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 """
         
-        with open('output/reports/unified_msme_story.md', 'w') as f:
+        with open(self._report_path(), 'w') as f:
             f.write(story_report)
         
         print("✅ Unified story report generated")
     
-    def run_complete_story(self):
-        """Execute the complete unified story"""
+    def run_complete_story(self, workers=None, dry_run=False, force=False):
+        """Execute the complete unified story, rebuilding only the artifacts whose inputs or code changed"""
         print("📖 CREATING UNIFIED MSME STORY")
         print("=" * 60)
         
         if not self.load_data():
             return
         
-        # Create the three-chapter story
-        self.create_story_chapter_1_foundation()
-        self.create_story_chapter_2_opportunity() 
-        self.create_story_chapter_3_trade_pathway()
+        plan = self.plan_build(force)
+        print("\n🧭 Build plan:")
+        for name, (_, reasons) in plan.items():
+            print(f"   {'🔁' if reasons else '✅'} {name}: {'; '.join(reasons) if reasons else 'up to date'}")
+        if dry_run:
+            return plan
+        
+        os.makedirs(self.images_dir, exist_ok=True)
+        os.makedirs(self.reports_dir, exist_ok=True)
+        
+        # Build and render the stale chapters concurrently, then write their pages from this process
+        stale_chapters = [name for name, _, _ in CHAPTERS if plan[name][1]]
+        if stale_chapters:
+            print("\n🖼️ Building and exporting chapter images...")
+            chapters = self.build_chapters(workers, stale_chapters)
+            for name, fig, insights, images in chapters:
+                outputs = self._write_chapter_html(name, fig) + images
+                self.manifest.record(name, plan[name][0], outputs, insights=insights)
+            self.manifest.save()
+            print(f"✅ {len(chapters)} chapters rebuilt")
+        
+        # Up-to-date chapters contribute the insights recorded when they were last built
+        self.story_insights = [insight for name, _, _ in CHAPTERS for insight in self.manifest.get(name)['insights']]
         
         # Generate unified report
-        self.generate_unified_story_report()
+        if plan[REPORT_NAME][1]:
+            self.generate_unified_story_report()
+            self.manifest.record(REPORT_NAME, self._report_deps(), [self._report_path()])
+            self.manifest.save()
+        
+        if self.bundle and plan['bundle'][1]:
+            self.manifest.record('bundle', self._bundle_deps(), self._write_bundle())
+            self.manifest.save()
+            print(f"✅ Single-page bundle written to {self._bundle_path()}")
+        
+        if not any(reasons for _, reasons in plan.values()):
+            print("\n✅ Story is up to date, nothing to rebuild")
+            return plan
         
         print("\n" + "=" * 60)
         print("📚 UNIFIED MSME STORY COMPLETED!")
@@ -645,8 +993,132 @@ India can leverage MSME growth to boost exports from current {exports_data[expor
         for insight in self.story_insights[:6]:
             print(f"   • {insight}")
         print(f"\n📊 Based on {len(self.wb_data)} consistent data points from World Bank")
+        return plan
+
+def _run_country_story(country, wb_data, output_root, html_mode, force, dry_run=False):
+    """Batch worker: build one economy's story into output_root/<ISO>/ and summarise the result"""
+    code = country['code']
+    summary = {'code': code, 'name': country['name'], 'status': 'failed', 'rebuilt': [], 'insights': [],
+               'chapters': [f"{code}/images/{name}.html" for name, _, _ in CHAPTERS],
+               'thumbnails': [f"{code}/images/{name}.thumb.jpg" for name, _, _ in CHAPTERS],
+               'report': f"{code}/reports/{REPORT_NAME}.md"}
+    story = UnifiedMSMEStory(os.path.join(output_root, code, 'images'), os.path.join(output_root, code, 'reports'),
+                             html_mode=html_mode, country=country, wb_data=wb_data)
+    try:
+        plan = story.run_complete_story(workers=1, dry_run=dry_run, force=force)
+    except Exception as e:
+        summary['error'] = str(e)
+        return summary
+    if plan is None:
+        summary['error'] = "data could not be loaded"
+        return summary
+    summary.update(status='ok', rebuilt=[name for name, (_, reasons) in plan.items() if reasons],
+                   insights=story.story_insights)
+    return summary
+
+
+def write_batch_index(output_root, results):
+    """index.json plus a browsable index.html linking every country's chapters and report"""
+    with open(os.path.join(output_root, 'index.json'), 'w') as f:
+        json.dump({'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'countries': results}, f, indent=2)
+
+    rows = []
+    for result in results:
+        if result['status'] != 'ok':
+            rows.append(f"<tr><td>{result['name']} ({result['code']})</td>"
+                        f"<td colspan=\"2\">❌ {result['status']}: {result.get('error', '')}</td></tr>")
+            continue
+        links = " ".join(f'<a href="{page}"><img src="{thumb}" width="160"></a>'
+                         for page, thumb in zip(result['chapters'], result['thumbnails']))
+        highlights = "".join(f"<li>{insight}</li>" for insight in result['insights'][:3])
+        rows.append(f"<tr><td><a href=\"{result['report']}\">{result['name']} ({result['code']})</a></td>"
+                    f"<td>{links}</td><td><ul>{highlights}</ul></td></tr>")
+    html = ("<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>MSME Story: Country Index</title></head>"
+            "<body style=\"font-family: Arial, sans-serif;\"><h1>MSME Story: Country Index</h1>"
+            "<table><tr><th>Economy</th><th>Chapters</th><th>Highlights</th></tr>"
+            + "\n".join(rows) + "</table></body></html>")
+    with open(os.path.join(output_root, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(html)
+
+
+def run_country_batch(countries, source=WB_SOURCE, output_root='output/countries', workers=None,
+                      html_mode='inline', force=False, dry_run=False):
+    """Build the story for every ISO code in `countries` (or 'all') from one multi-country extract.
+
+    The extract is read once and split by country; each economy is built in its own worker process
+    into output_root/<ISO>/ with its own incremental build manifest, then summarised in an index.
+    With dry_run=True each summary's 'rebuilt' lists what would rebuild and nothing is written.
+    """
+    print(f"🌍 Loading multi-country World Bank extract: {source}")
+    wb_data = pd.read_csv(source)
+    if 'country_code' not in wb_data.columns:
+        raise ValueError(f"{source} has no country_code column; batch mode needs a multi-country extract")
+
+    by_country = dict(tuple(wb_data.groupby('country_code', sort=False)))
+    if list(countries) == ['all']:
+        countries = sorted(by_country)
+    export_shares, gdp_usd, names = extract_countries(wb_data)
+
+    jobs, results = [], {}
+    for code in countries:
+        country = story_country(code, export_shares=export_shares, names=names, gdp_usd=gdp_usd)
+        if code in by_country:
+            jobs.append((country, by_country[code]))
+        else:
+            results[code] = {'code': code, 'name': country['name'], 'status': 'missing',
+                             'error': f"not in {source}"}
+
+    if not dry_run:
+        os.makedirs(output_root, exist_ok=True)
+    workers = workers or min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        for country, frame in jobs:
+            results[country['code']] = _run_country_story(country, frame, output_root, html_mode, force, dry_run)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {country['code']: pool.submit(_run_country_story, country, frame, output_root, html_mode, force, dry_run)
+                       for country, frame in jobs}
+            for code, future in futures.items():
+                results[code] = future.result()
+
+    ordered = [results[code] for code in countries]
+    if dry_run:
+        return ordered
+    write_batch_index(output_root, ordered)
+    built = sum(result['status'] == 'ok' for result in ordered)
+    print(f"\n🌍 {built}/{len(ordered)} country stories built -> {os.path.join(output_root, 'index.html')}")
+    return ordered
+
 
 if __name__ == "__main__":
-    # Run the unified story
-    story = UnifiedMSMEStory()
-    story.run_complete_story() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Build the unified MSME story chapters and report")
+    parser.add_argument('--dry-run', action='store_true', help="list what would rebuild without writing anything")
+    parser.add_argument('--force', action='store_true', help="rebuild every artifact regardless of the manifest")
+    parser.add_argument('--html', choices=['shared', 'inline'], default=None,
+                        help="inline (default): self-contained pages; shared: plotly.js and templates written once as "
+                             "hashed assets under <images>/assets, to be deployed with the pages (default with --bundle)")
+    parser.add_argument('--bundle', action='store_true', help="also write every chapter on one page (shared mode)")
+    parser.add_argument('--workers', type=int, default=None, help="build processes (1 builds inline)")
+    parser.add_argument('--country', default=DEFAULT_COUNTRY, help="ISO3 code of the economy for a single story")
+    parser.add_argument('--countries', help="batch mode: comma-separated ISO3 codes, or 'all', from a multi-country extract")
+    parser.add_argument('--source', default=WB_SOURCE, help="World Bank long-format CSV (indicator, year, value[, country_code])")
+    parser.add_argument('--output-root', default='output/countries',
+                        help="per-country output tree (batch mode, and single stories other than India's)")
+    args = parser.parse_args()
+    args.html = args.html or ('shared' if args.bundle else 'inline')
+    if args.bundle and args.html != 'shared':
+        parser.error("--bundle requires --html shared")
+
+    if args.countries:
+        run_country_batch(args.countries.split(','), source=args.source, output_root=args.output_root,
+                          workers=args.workers, html_mode=args.html, force=args.force, dry_run=args.dry_run)
+    else:
+        # Run the unified story; only India's goes to output/images, which the dashboard serves
+        dirs = {}
+        if args.country != DEFAULT_COUNTRY:
+            dirs = dict(images_dir=os.path.join(args.output_root, args.country, 'images'),
+                        reports_dir=os.path.join(args.output_root, args.country, 'reports'))
+        story = UnifiedMSMEStory(html_mode=args.html, bundle=args.bundle, country=story_country(args.country),
+                                 source=args.source, **dirs)
+        if story.run_complete_story(workers=args.workers, dry_run=args.dry_run, force=args.force) is None:
+            raise SystemExit(1) 
\ No newline at end of file